@@ -0,0 +1,212 @@
+"""
+설문 제출 저장 계층 벤치마크 (Google Sheets 대체 워크시트)
+
+목적:
+- 실제 자격 증명 없이 gcp_storage의 제출 처리량을 잰다. 워크시트는 fake_sheets.FakeWorksheet로 바꾸고
+  호출당 지연(--latency-ms)과 분당 요청 한도(--quota-per-minute)를 준다.
+- 세션(--sessions)마다 스레드 하나가 --submissions 건을 연달아 제출한다. Streamlit 서버에서 여러 세션의
+  스크립트 스레드가 동시에 handle_submit을 부르는 상황과 같다.
+- 모드
+  · direct : append_one_row_to_sheet로 제출마다 시트에 바로 쓴다 (배치 없음, 제출 스레드가 API를 기다림).
+  · outbox : enqueue_row_to_sheet로 로컬 outbox에 커밋하고 dispatcher가 --batch-sizes 크기로 모아 보낸다.
+             배치 크기 1은 배치 없이 outbox만 쓴 경우다.
+
+측정:
+- 제출 지연: 제출 함수가 돌아오기까지의 시간 p50/p90/p99/max.
+- 접수 처리량: 제출 수 / 모든 세션이 제출을 마친 시간.
+- 반영 처리량: 시트에 반영된 행 수 / 마지막 행이 시트에 반영된 시간.
+- API 호출 수, 할당량 초과(429) 횟수, 실패한 제출, 시트의 중복 submission_id.
+
+권장 실행:
+   python bench_sheets.py
+   python bench_sheets.py --sessions 32 --submissions 10 --latency-ms 400 --batch-sizes 1 10 50
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+import gcp_storage
+from fake_sheets import FakeWorksheet
+from submission_outbox import outbox_counts
+
+
+DRAIN_TIMEOUT_SEC = 300.0
+
+
+def percentile_summary(values: list[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "count": int(arr.size),
+        "p50_ms": round(float(np.percentile(arr, 50)), 2),
+        "p90_ms": round(float(np.percentile(arr, 90)), 2),
+        "p99_ms": round(float(np.percentile(arr, 99)), 2),
+        "max_ms": round(float(arr.max()), 2),
+    }
+
+
+def make_row(session_no: int, seq: int, questions: int) -> tuple[str, dict]:
+    submission_id = f"bench-{session_no:03d}-{seq:04d}"
+    row = {"submission_ts": time.strftime("%Y-%m-%d %H:%M:%S"), "respondent_id": f"session-{session_no:03d}"}
+    for i in range(1, questions + 1):
+        row[f"Q{i}_func"] = "Y"
+        row[f"Q{i}_sat"] = 4
+        row[f"Q{i}_imp"] = ""
+        row[f"Q{i}_cmt"] = ""
+    return submission_id, row
+
+
+def run_sessions(submit, args: argparse.Namespace) -> tuple[list[float], list[str], float]:
+    latencies: list[float] = []
+    errors: list[str] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(args.sessions)
+
+    def session(session_no: int) -> None:
+        barrier.wait()
+        for seq in range(args.submissions):
+            submission_id, row = make_row(session_no, seq, args.questions)
+            started = time.perf_counter()
+            try:
+                submit(submission_id, row)
+                error = None
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed_ms)
+                if error:
+                    errors.append(error)
+
+    threads = [threading.Thread(target=session, args=(no,)) for no in range(args.sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - started
+
+
+def wait_for_drain(dispatcher: dict, expected: int) -> tuple[float, dict]:
+    started = time.perf_counter()
+    while time.perf_counter() - started < DRAIN_TIMEOUT_SEC:
+        with dispatcher["lock"]:
+            counts = outbox_counts(dispatcher["conn"])
+        if counts.get("sent", 0) >= expected:
+            break
+        time.sleep(0.05)
+    return time.perf_counter() - started, counts
+
+
+def run_case(mode: str, batch_size: int, args: argparse.Namespace, workdir: Path) -> dict:
+    worksheet = FakeWorksheet(
+        latency=args.latency_ms / 1000,
+        read_quota_per_minute=args.quota_per_minute or None,
+        write_quota_per_minute=args.quota_per_minute or None,
+        seed=0,
+    )
+    name = f"{mode}-{batch_size}"
+    gcp_storage.set_worksheet_backend(lambda spreadsheet_id, worksheet_name, **kwargs: worksheet, target=("bench", name))
+    total = args.sessions * args.submissions
+
+    if mode == "direct":
+        latencies, errors, submit_sec = run_sessions(
+            lambda submission_id, row: gcp_storage.append_one_row_to_sheet({**row, "submission_id": submission_id}),
+            args,
+        )
+        drain_sec = 0.0
+        pending = 0
+    else:
+        # dispatcher는 처음 만들 때 배치 크기와 outbox 경로를 읽는다.
+        os.environ["KIRBS_OUTBOX_PATH"] = str(workdir / f"{name}.sqlite3")
+        gcp_storage.WRITE_BATCH_SIZE = batch_size
+        dispatcher = gcp_storage._get_sheet_dispatcher("bench", name)
+        latencies, errors, submit_sec = run_sessions(gcp_storage.enqueue_row_to_sheet, args)
+        drain_sec, counts = wait_for_drain(dispatcher, total - len(errors))
+        pending = counts.get("pending", 0) + counts.get("sending", 0)
+
+    rows = worksheet.data_rows()
+    header = worksheet.rows[0] if worksheet.rows else []
+    id_col = header.index("submission_id") if "submission_id" in header else None
+    ids = [row[id_col] for row in rows] if id_col is not None else []
+    delivered_sec = submit_sec + drain_sec
+    return {
+        "mode": mode,
+        "batch_size": batch_size if mode == "outbox" else None,
+        "submissions": total,
+        "failed": len(errors),
+        "pending": pending,
+        "rows_in_sheet": len(rows),
+        "duplicates": len(ids) - len(set(ids)),
+        "submit_latency": percentile_summary(latencies),
+        "accepted_per_sec": round(total / submit_sec, 1) if submit_sec > 0 else None,
+        "delivered_per_sec": round(len(rows) / delivered_sec, 1) if delivered_sec > 0 else None,
+        "api_calls": dict(worksheet.calls),
+        "quota_errors": worksheet.errors.get(429, 0),
+        "errors": sorted(set(errors))[:5],
+    }
+
+
+def print_result(result: dict) -> None:
+    label = result["mode"] if result["batch_size"] is None else f"{result['mode']}(batch {result['batch_size']})"
+    latency = result["submit_latency"]
+    print(
+        f"\n[{label}] 제출 {result['submissions']} · 실패 {result['failed']} · 미반영 {result['pending']} · "
+        f"시트 행 {result['rows_in_sheet']} · 중복 {result['duplicates']}"
+    )
+    print(
+        f"  제출 지연 p50 {latency.get('p50_ms')} / p90 {latency.get('p90_ms')} / p99 {latency.get('p99_ms')} / "
+        f"max {latency.get('max_ms')} ms"
+    )
+    print(f"  접수 {result['accepted_per_sec']}건/초 · 반영 {result['delivered_per_sec']}건/초")
+    print(f"  API 호출 {result['api_calls']} · 429 {result['quota_errors']}회")
+    for error in result["errors"]:
+        print(f"  ! {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="설문 제출 저장 계층 벤치마크")
+    parser.add_argument("--modes", nargs="+", choices=["direct", "outbox"], default=["direct", "outbox"])
+    parser.add_argument("--sessions", type=int, default=16, help="동시에 제출하는 세션 수")
+    parser.add_argument("--submissions", type=int, default=5, help="세션당 제출 수")
+    parser.add_argument("--questions", type=int, default=60, help="제출 행의 문항 수 (문항당 컬럼 4개)")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="워크시트 API 호출당 지연")
+    parser.add_argument("--quota-per-minute", type=int, default=60, help="분당 읽기/쓰기 요청 한도 (0이면 무제한)")
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 50], help="outbox 모드 배치 크기")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    # Streamlit 런타임 밖에서 st.cache_resource를 쓰면 나오는 경고를 숨긴다.
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    print(
+        f"세션 {args.sessions} × 제출 {args.submissions} · API 지연 {args.latency_ms:.0f} ms · "
+        f"분당 한도 {args.quota_per_minute or '없음'}"
+    )
+    results = []
+    with tempfile.TemporaryDirectory(prefix="kirbs-bench-") as workdir:
+        for mode in args.modes:
+            for batch_size in args.batch_sizes if mode == "outbox" else [1]:
+                result = run_case(mode, batch_size, args, Path(workdir))
+                print_result(result)
+                results.append(result)
+    gcp_storage.set_worksheet_backend(None)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\nJSON 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+직업 데이터/임베딩 산출물 핫 리로드
+
+목적:
+- career_jobs.xlsx나 embedding_output/* 를 다시 생성해도 Streamlit 프로세스를 재시작하지 않고
+  새 데이터를 쓰게 한다.
+- 감시 대상 파일의 (이름, 크기, mtime)으로 산출물 버전 id를 만든다. 내용 해시는 load_data가
+  스냅샷 검증용으로 따로 계산하므로 여기서는 stat만 본다.
+- 감시 스레드가 주기적으로 버전을 확인하고, 같은 새 버전이 두 번 연속 보이면(쓰기 완료) 백그라운드에서
+  build(version)으로 캐시를 예열한 뒤 활성 버전을 한 번에 교체한다. 빌드가 실패하면 이전 버전을 유지한다.
+- rerun은 시작할 때 활성 버전을 한 번 읽어 고정(pin)한다. 진행 중인 rerun은 이전 버전으로 끝나고
+  다음 rerun부터 새 버전을 쓴다. 버전 id는 하위 캐시 함수의 인자로 넘겨 캐시 키에 포함시킨다.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable
+import hashlib
+import threading
+import time
+
+
+WATCH_INTERVAL_SECONDS = 2.0
+
+_PINNED_VERSION: ContextVar[str] = ContextVar("kirbs_artifact_version", default="")
+
+
+def list_watched_files(data_path: Path, artifact_dir: Path) -> list[Path]:
+    paths = [Path(data_path)]
+    if artifact_dir.is_dir():
+        # 다른 프로세스가 쓰는 중인 임시 파일(.xxx.tmp 등)은 버전에 넣지 않는다.
+        paths.extend(
+            path
+            for path in sorted(artifact_dir.iterdir())
+            if path.is_file() and not path.name.startswith(".") and not path.name.endswith(".tmp")
+        )
+    return paths
+
+
+def fingerprint_files(paths: list[Path]) -> str:
+    digest = hashlib.sha1()
+    for path in paths:
+        digest.update(path.name.encode("utf-8"))
+        try:
+            stat = path.stat()
+        except OSError:
+            digest.update(b"<missing>")
+            continue
+        digest.update(f":{stat.st_size}:{stat.st_mtime_ns};".encode("ascii"))
+    return digest.hexdigest()[:12]
+
+
+def create_artifact_store(
+    list_sources: Callable[[], list[Path]],
+    build: Callable[[str], None],
+    interval: float = WATCH_INTERVAL_SECONDS,
+) -> dict:
+    return {
+        "list_sources": list_sources,
+        "build": build,
+        "interval": interval,
+        "lock": threading.Lock(),
+        "build_lock": threading.Lock(),
+        "active": None,
+        "candidate": None,
+        "failed": set(),
+        "error": None,
+        "watcher": None,
+    }
+
+
+def current_fingerprint(store: dict) -> str:
+    return fingerprint_files(store["list_sources"]())
+
+
+def _build_version(store: dict, version: str) -> None:
+    started = time.perf_counter()
+    with pin_artifact_version(version):
+        store["build"](version)
+    active = {
+        "version": version,
+        "activated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "build_ms": (time.perf_counter() - started) * 1000,
+    }
+    with store["lock"]:
+        store["active"] = active
+        store["error"] = None
+
+
+def poll_artifact_store(store: dict) -> bool:
+    """감시 한 주기. 새 버전을 빌드해 교체했으면 True."""
+    version = current_fingerprint(store)
+    with store["lock"]:
+        active = store["active"]
+        if active is None or version == active["version"] or version in store["failed"]:
+            store["candidate"] = None
+            return False
+        if store["candidate"] != version:
+            # 파일을 쓰는 도중일 수 있으니 다음 주기에도 같은 값인지 본다.
+            store["candidate"] = version
+            return False
+        store["candidate"] = None
+
+    with store["build_lock"]:
+        try:
+            _build_version(store, version)
+        except Exception as exc:
+            with store["lock"]:
+                store["failed"].add(version)
+                store["error"] = f"{version}: {exc}"
+            return False
+    return True
+
+
+def _watch_loop(store: dict) -> None:
+    while True:
+        time.sleep(store["interval"])
+        try:
+            poll_artifact_store(store)
+        except Exception as exc:
+            with store["lock"]:
+                store["error"] = str(exc)
+
+
+def start_artifact_watcher(store: dict) -> None:
+    with store["lock"]:
+        if store["watcher"] is not None:
+            return
+        store["watcher"] = threading.Thread(target=_watch_loop, args=(store,), name="kirbs-artifact-watcher", daemon=True)
+    store["watcher"].start()
+
+
+def active_artifact_version(store: dict) -> str:
+    """활성 버전 id를 돌려준다. 아직 한 번도 빌드되지 않았으면 현재 파일로 동기 빌드한다."""
+    active = store["active"]
+    if active is not None:
+        return active["version"]
+
+    with store["build_lock"]:
+        active = store["active"]
+        if active is None:
+            # 첫 빌드 실패는 호출 측(rerun)으로 그대로 올려 오류 화면을 보여준다.
+            _build_version(store, current_fingerprint(store))
+            active = store["active"]
+    start_artifact_watcher(store)
+    return active["version"]
+
+
+def artifact_status(store: dict) -> dict:
+    with store["lock"]:
+        active = dict(store["active"] or {})
+        return {
+            "version": active.get("version", ""),
+            "activated_at": active.get("activated_at", ""),
+            "build_ms": active.get("build_ms"),
+            "pending": store["candidate"],
+            "error": store["error"],
+        }
+
+
+def pinned_artifact_version() -> str:
+    return _PINNED_VERSION.get()
+
+
+@contextmanager
+def pin_artifact_version(version: str):
+    token = _PINNED_VERSION.set(version)
+    try:
+        yield version
+    finally:
+        _PINNED_VERSION.reset(token)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+import argparse
 import json
 import re
 from typing import Iterable
@@ -8,6 +9,8 @@ from typing import Iterable
 import numpy as np
 import pandas as pd
 
+from excel_stream import read_table
+
 try:
     from sentence_transformers import SentenceTransformer
 except ImportError as exc:
@@ -48,6 +51,12 @@ MAJOR_PREFIX = "major_"
 CONTACT_PREFIX = "contact_"
 MAX_DISPLAY_KEYWORDS = 10
 MAX_TOPIC_TAGS = 12
+NEIGHBOR_K = 12
+NEIGHBOR_BLOCK_SIZE = 1024
+
+EMBEDDINGS_FILE_NAME = "career_jobs_embeddings.npy"
+NEIGHBOR_INDEX_FILE_NAME = "career_jobs_neighbors_idx.npy"
+NEIGHBOR_SCORE_FILE_NAME = "career_jobs_neighbors_score.npy"
 
 
 # =========================
@@ -399,6 +408,75 @@ def build_document_text(row: pd.Series) -> str:
     return "\n".join(blocks).strip()
 
 
+# =========================
+# 유사 직업 그래프
+# =========================
+def build_neighbor_graph(
+    embeddings: np.ndarray,
+    k: int = NEIGHBOR_K,
+    block_size: int = NEIGHBOR_BLOCK_SIZE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """직업별 코사인 유사도 상위 k개 이웃을 구한다.
+
+    전체 n×n 유사도 행렬을 만들지 않도록 block_size 행씩 나눠 계산하므로
+    메모리 사용량은 block_size×n에 비례한다.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    n = len(vectors)
+    k = max(0, min(int(k), n - 1))
+
+    indices = np.zeros((n, k), dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float16)
+    if k == 0:
+        return indices, scores
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors / np.maximum(norms, 1e-12)
+
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+        sims = vectors[start:end] @ vectors.T
+        sims[np.arange(end - start), np.arange(start, end)] = -np.inf
+
+        candidates = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(sims, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1)
+
+        indices[start:end] = np.take_along_axis(candidates, order, axis=1)
+        scores[start:end] = np.take_along_axis(candidate_scores, order, axis=1).astype(np.float16)
+
+    return indices, scores
+
+
+def save_neighbor_graph(embeddings: np.ndarray, output_dir: Path, k: int = NEIGHBOR_K) -> dict:
+    indices, scores = build_neighbor_graph(embeddings, k=k)
+    np.save(output_dir / NEIGHBOR_INDEX_FILE_NAME, indices)
+    np.save(output_dir / NEIGHBOR_SCORE_FILE_NAME, scores)
+    return {
+        "neighbor_k": int(indices.shape[1]),
+        "neighbor_index_file": NEIGHBOR_INDEX_FILE_NAME,
+        "neighbor_score_file": NEIGHBOR_SCORE_FILE_NAME,
+    }
+
+
+def rebuild_neighbor_graph(output_dir: Path = OUTPUT_DIR, k: int = NEIGHBOR_K) -> dict:
+    """이미 저장된 임베딩으로 이웃 그래프만 다시 만든다. 모델 인코딩은 하지 않는다."""
+    embeddings = np.load(output_dir / EMBEDDINGS_FILE_NAME)
+    neighbor_info = save_neighbor_graph(embeddings, output_dir, k=k)
+
+    config_path = output_dir / "embedding_config.json"
+    config = {}
+    if config_path.exists():
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    config.update(neighbor_info)
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+    print(f"이웃 그래프 저장 완료: {embeddings.shape[0]:,}건 × 상위 {neighbor_info['neighbor_k']}개")
+    return neighbor_info
+
+
 # =========================
 # 실행
 # =========================
@@ -408,16 +486,14 @@ def build_embeddings(
     model_name: str = MODEL_NAME,
     batch_size: int = BATCH_SIZE,
     normalize_embeddings: bool = NORMALIZE_EMBEDDINGS,
+    neighbor_k: int = NEIGHBOR_K,
 ) -> tuple[pd.DataFrame, np.ndarray]:
     if not input_file.exists():
         raise FileNotFoundError(f"입력 파일을 찾을 수 없습니다: {input_file}")
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    if input_file.suffix.lower() in {".xlsx", ".xls", ".xlsm"}:
-        df = pd.read_excel(input_file)
-    else:
-        df = pd.read_csv(input_file)
+    df = read_table(input_file)
 
     df = df.copy()
     df.columns = [str(c).strip() for c in df.columns]
@@ -457,7 +533,8 @@ def build_embeddings(
     df["topic_tags_json"] = df["topic_tags"].map(lambda x: json.dumps(x, ensure_ascii=False))
 
     print("[4/4] 파일 저장")
-    np.save(output_dir / "career_jobs_embeddings.npy", embeddings)
+    np.save(output_dir / EMBEDDINGS_FILE_NAME, embeddings)
+    neighbor_info = save_neighbor_graph(embeddings, output_dir, k=neighbor_k)
 
     meta_priority_cols = [
         "jobdicSeq",
@@ -499,6 +576,7 @@ def build_embeddings(
         "keyword_method": "rule_based_action_trait_v2",
         "max_display_keywords": MAX_DISPLAY_KEYWORDS,
         "max_topic_tags": MAX_TOPIC_TAGS,
+        **neighbor_info,
     }
     with open(output_dir / "embedding_config.json", "w", encoding="utf-8") as f:
         json.dump(config, f, ensure_ascii=False, indent=2)
@@ -536,7 +614,16 @@ def semantic_search(
 
 
 if __name__ == "__main__":
-    df_meta, emb = build_embeddings()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--neighbors-only", action="store_true", help="저장된 임베딩으로 이웃 그래프만 다시 만든다.")
+    parser.add_argument("--neighbor-k", type=int, default=NEIGHBOR_K)
+    args = parser.parse_args()
+
+    if args.neighbors_only:
+        rebuild_neighbor_graph(k=args.neighbor_k)
+        raise SystemExit(0)
+
+    df_meta, emb = build_embeddings(neighbor_k=args.neighbor_k)
 
     print("\n샘플 검색 결과")
     sample_query = "컴퓨터와 관련된 일"
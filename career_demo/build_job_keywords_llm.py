@@ -38,6 +38,8 @@ from typing import Iterable
 
 import pandas as pd
 
+from excel_stream import read_table
+
 
 TEXT_COLUMNS = [
     "job",
@@ -430,7 +432,7 @@ def build_keyword_meta(
 ) -> pd.DataFrame:
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_excel(input_file) if input_file.suffix.lower() in {".xlsx", ".xls", ".xlsm"} else pd.read_csv(input_file)
+    df = read_table(input_file)
     df = df.copy()
     df.columns = [str(c).strip() for c in df.columns]
 
@@ -527,6 +529,12 @@ def build_keyword_meta(
     meta.to_excel(out_xlsx, index=False)
     meta.to_csv(out_csv, index=False, encoding="utf-8-sig")
 
+    # search.py는 LLM 키워드 컬럼이 있는 parquet 메타를 xlsx보다 먼저 읽는다.
+    try:
+        meta.to_parquet(output_dir / "career_jobs_embedding_meta.parquet", index=False)
+    except Exception:
+        print("[안내] pyarrow 또는 fastparquet이 없어 parquet 저장은 건너뛰었습니다. xlsx 메타 파일은 정상 저장되었습니다.")
+
     print(f"\n저장 완료: {out_xlsx}")
     print(f"보조 CSV: {out_csv}")
     return meta
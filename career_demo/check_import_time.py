@@ -0,0 +1,115 @@
+"""
+search.py 콜드 임포트 시간 점검
+
+목적:
+- 새 컨테이너에서 앱 첫 화면이 늦게 뜨지 않도록, `python -X importtime`으로 search 모듈의
+  누적 임포트 시간을 재고 예산(ms)을 넘으면 실패(exit 1)한다.
+- torch, sentence_transformers, openpyxl 같은 무거운 모듈은 실제로 필요할 때만 불러와야 하므로
+  임포트 그래프에 나타나면 시간과 무관하게 실패한다.
+- 디스크 캐시 영향을 줄이기 위해 새 프로세스로 여러 번 재고 가장 빠른 값을 기준으로 삼는다.
+
+권장 실행:
+   python check_import_time.py
+   python check_import_time.py --threshold-ms 1500 --repeat 5 --top 15
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import os
+import subprocess
+import sys
+
+
+BASE_DIR = Path(__file__).resolve().parent
+IMPORT_BUDGET_MS = 2000.0
+FORBIDDEN_MODULES = ["torch", "sentence_transformers", "transformers", "openpyxl", "streamlit.emojis"]
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """`-X importtime` 출력에서 (모듈, 자체 시간, 누적 시간, 깊이)를 뽑는다. 단위는 ms."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        self_us, cumulative_us, name = parts
+        # 모듈 이름 앞 공백은 " " + 깊이 × "  " 이다.
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append(
+            {
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": depth,
+            }
+        )
+    return rows
+
+
+def measure_import(module: str) -> list[dict]:
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    # 바이트코드 캐시는 배포 이미지에도 있으므로 그대로 두고, 모듈 임포트만 잰다.
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        tail = "\n".join(completed.stderr.strip().splitlines()[-5:])
+        raise SystemExit(f"{module} 임포트에 실패했습니다:\n{tail}")
+    return parse_importtime(completed.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="search.py 콜드 임포트 시간 점검")
+    parser.add_argument("--module", default="search")
+    parser.add_argument("--threshold-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="직접 임포트 중 오래 걸린 상위 N개 출력")
+    args = parser.parse_args()
+
+    best_rows: list[dict] = []
+    best_ms = float("inf")
+    for _ in range(max(1, args.repeat)):
+        rows = measure_import(args.module)
+        target = next((row for row in rows if row["module"] == args.module and row["depth"] == 0), None)
+        if target is None:
+            raise SystemExit(f"-X importtime 출력에서 {args.module}을(를) 찾지 못했습니다.")
+        if target["cumulative_ms"] < best_ms:
+            best_ms = target["cumulative_ms"]
+            best_rows = rows
+
+    imported = {row["module"] for row in best_rows}
+    forbidden = [name for name in FORBIDDEN_MODULES if name in imported]
+
+    direct = sorted(
+        (row for row in best_rows if row["depth"] == 1),
+        key=lambda row: row["cumulative_ms"],
+        reverse=True,
+    )
+    print(f"{args.module} 누적 임포트 시간: {best_ms:,.1f} ms (예산 {args.threshold_ms:,.0f} ms, {args.repeat}회 중 최솟값)")
+    print(f"불러온 모듈 수: {len(imported):,}")
+    for row in direct[: args.top]:
+        print(f"  {row['cumulative_ms']:>9,.1f} ms  {row['module']}")
+
+    failed = False
+    if forbidden:
+        print(f"[실패] 지연 로딩해야 할 모듈이 임포트 시점에 불러와졌습니다: {', '.join(forbidden)}")
+        failed = True
+    if best_ms > args.threshold_ms:
+        print(f"[실패] 임포트 예산을 {best_ms - args.threshold_ms:,.1f} ms 초과했습니다.")
+        failed = True
+    if failed:
+        raise SystemExit(1)
+    print("[통과]")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 import re
+import numpy as np
 import pandas as pd
 
+from excel_stream import read_table
+
 BASE_COLUMNS = [
     "job",
     "summary",
@@ -39,7 +42,7 @@ def collect_nonempty_values(row, columns):
 
 
 def load_job_data(file_source):
-    df = pd.read_excel(file_source)
+    df = read_table(file_source)
 
     for col in BASE_COLUMNS + CONTACT_COLUMNS + MAJOR_COLUMNS:
         if col not in df.columns:
@@ -62,9 +65,46 @@ def load_job_data(file_source):
     ).str.lower()
 
     df = df.drop_duplicates(subset=["job"]).reset_index(drop=True)
+    df.attrs["job_index"] = build_job_index(df)
+    df.attrs["search_arrays"] = build_search_arrays(df)
     return df
 
 
+class SharedIndex(dict):
+    """df.attrs에 두는 읽기 전용 색인. pandas는 연산마다 attrs를 deepcopy하므로 복사 없이 공유한다."""
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def build_search_arrays(df: pd.DataFrame) -> SharedIndex:
+    # score_job과 같은 결과가 나오도록 직업명은 파이썬 str.lower로 소문자화한다.
+    # 고정 폭 유니코드 배열은 (행 수 × 가장 긴 행) 만큼 메모리를 잡으므로 object 배열로 둔다.
+    return SharedIndex(
+        job=np.array([job.lower() for job in df["job"].tolist()], dtype=object),
+        search_text=np.array(df["search_text"].tolist(), dtype=object),
+    )
+
+
+def _search_rows(df: pd.DataFrame, arrays) -> np.ndarray | None:
+    """df의 각 행이 로드 시점 검색 배열의 몇 번째 행인지. 직업명은 로드 때 중복 제거되므로 job_index로 찾는다."""
+    job_index = df.attrs.get("job_index")
+    if arrays is None or job_index is None:
+        return None
+    rows = df["job"].map(job_index)
+    if rows.isna().any():
+        return None
+    rows = rows.to_numpy(dtype=np.int64)
+    if rows.max() >= len(arrays["job"]):
+        return None
+    return rows
+
+
+def _contains(values: np.ndarray, text: str) -> np.ndarray:
+    # object dtype를 유지해야 pandas가 pyarrow 문자열로 바꾸지 않는다(한글은 그쪽이 약 4배 느리다).
+    return pd.Series(values, dtype=object, copy=False).str.contains(text, regex=False).to_numpy(dtype=bool)
+
+
 def score_job(row, query: str) -> int:
     q = query.strip().lower()
     if not q:
@@ -93,20 +133,84 @@ def score_job(row, query: str) -> int:
     return score
 
 
+def score_jobs(df: pd.DataFrame, query: str) -> np.ndarray:
+    """score_job을 전체 행에 한 번에 적용한 것과 같은 점수 배열. score_job이 기준 구현이다."""
+    q = query.strip().lower()
+    if not q or df.empty:
+        return np.zeros(len(df), dtype=np.int64)
+
+    arrays = df.attrs.get("search_arrays")
+    rows = _search_rows(df, arrays)
+    if rows is None:
+        # load_job_data를 거치지 않은 프레임은 그 자리에서 배열을 만든다.
+        arrays = build_search_arrays(df)
+        rows = None
+
+    job = arrays["job"]
+    search_text = arrays["search_text"]
+    scores = np.zeros(len(job), dtype=np.int64)
+
+    def exact(text):
+        return job == text
+
+    def in_job(text):
+        return _contains(job, text)
+
+    def in_search_text(text):
+        return _contains(search_text, text)
+
+    scores += 100 * exact(q)
+    scores += 50 * in_job(q)
+    scores += 20 * in_search_text(q)
+
+    # 같은 토큰이 여러 번 나오면 점수도 여러 번 더해지므로(score_job과 동일) 마스크만 재사용한다.
+    token_scores: dict[str, np.ndarray] = {}
+    for token in q.split():
+        if token not in token_scores:
+            token_scores[token] = np.select(
+                [exact(token), in_job(token), in_search_text(token)],
+                [30, 15, 5],
+                default=0,
+            )
+        scores += token_scores[token]
+
+    return scores if rows is None else scores[rows]
+
+
 def search_jobs(df: pd.DataFrame, query: str, top_n: int = 30) -> pd.DataFrame:
     q = query.strip()
 
     if not q:
         return df[["job"]].sort_values("job").head(top_n)
 
-    result = df.copy()
-    result["score"] = result.apply(lambda row: score_job(row, q), axis=1)
-    result = result[result["score"] > 0].sort_values(["score", "job"], ascending=[False, True])
+    scores = score_jobs(df, q)
+    matched = np.flatnonzero(scores > 0)
+    # 점수 내림차순, 직업명 오름차순. 상위 top_n 행만 복사한다.
+    names = df["job"].to_numpy(dtype=object)[matched]
+    order = matched[np.lexsort((names, -scores[matched]))][:top_n]
+
+    result = df.iloc[order].copy()
+    result["score"] = scores[order]
+    return result
+
+
+def build_job_index(df: pd.DataFrame) -> dict:
+    index = SharedIndex()
+    for pos, job in enumerate(df["job"].tolist()):
+        index.setdefault(job, pos)
+    return index
+
 
-    return result.head(top_n)
+def get_job_detail(df: pd.DataFrame, job_name: str, job_index: dict = None):
+    if job_index is None:
+        job_index = df.attrs.get("job_index")
 
+    if job_index is not None:
+        pos = job_index.get(job_name)
+        # 필터링된 프레임에 원본 색인이 따라온 경우를 대비해 위치의 직업명을 확인한다.
+        if pos is not None and pos < len(df) and df["job"].iat[pos] == job_name:
+            return df.iloc[pos].to_dict()
 
-def get_job_detail(df: pd.DataFrame, job_name: str):
     matched = df[df["job"] == job_name]
     if matched.empty:
         return None
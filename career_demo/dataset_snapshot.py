@@ -0,0 +1,156 @@
+"""
+career_jobs 전처리 결과 스냅샷 (Parquet)
+
+목적:
+- 매 콜드 스타트마다 career_jobs.xlsx와 임베딩 메타 xlsx를 다시 파싱하지 않도록,
+  search.py의 load_data 전처리가 끝난 데이터프레임(파생 컬럼, 임금 분위수,
+  병합된 키워드 목록 포함)을 Parquet 스냅샷으로 저장한다.
+- 스냅샷에는 포맷 버전과 원본 파일 해시가 함께 기록되며, 해시가 일치할 때만 사용한다.
+  원본이 바뀌었거나 포맷이 다르면 None을 반환하고 호출 측이 Excel 경로로 되돌아간다.
+
+권장 실행 (데이터 갱신 후 1회):
+   python dataset_snapshot.py
+   python dataset_snapshot.py --input career_jobs.xlsx
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import hashlib
+import json
+import os
+import time
+from typing import Iterable
+
+import pandas as pd
+
+# pyarrow.parquet은 스냅샷을 실제로 읽고 쓸 때만 불러온다 (앱 콜드 임포트 시간 절약).
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_METADATA_KEY = b"kirbs_dataset_snapshot"
+SNAPSHOT_DIR_NAME = "snapshot"
+
+
+def snapshot_path_for(data_path: Path) -> Path:
+    return data_path.parent / SNAPSHOT_DIR_NAME / f"{data_path.stem}_prepared.parquet"
+
+
+def compute_source_hash(paths: Iterable[Path], extra: str = "") -> str:
+    """원본 파일 내용과 전처리 버전 문자열로 스냅샷 유효성 판단용 해시를 만든다."""
+    digest = hashlib.sha256()
+    digest.update(f"format={SNAPSHOT_FORMAT_VERSION};{extra}".encode("utf-8"))
+    for path in paths:
+        path = Path(path)
+        digest.update(path.name.encode("utf-8"))
+        if not path.exists():
+            digest.update(b"<missing>")
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _list_columns(schema) -> list[str]:
+    import pyarrow as pa
+
+    return [field.name for field in schema if pa.types.is_list(field.type)]
+
+
+def write_snapshot(df: pd.DataFrame, path: Path, source_hash: str) -> Path:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    info = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "source_hash": source_hash,
+        "row_count": int(table.num_rows),
+        "columns": table.column_names,
+        "list_columns": _list_columns(table.schema),
+        "attrs": dict(df.attrs),
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    metadata = dict(table.schema.metadata or {})
+    metadata[SNAPSHOT_METADATA_KEY] = json.dumps(info, ensure_ascii=False).encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    # 다른 프로세스가 읽는 도중 덮어쓰지 않도록 임시 파일에 쓴 뒤 교체한다.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot_info(path: Path) -> dict | None:
+    if not path.exists():
+        return None
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+        raw = metadata.get(SNAPSHOT_METADATA_KEY)
+        return json.loads(raw.decode("utf-8")) if raw else None
+    except Exception:
+        return None
+
+
+def read_snapshot(path: Path, source_hash: str) -> pd.DataFrame | None:
+    """해시와 포맷 버전이 일치하는 스냅샷만 memory-map으로 읽는다. 그 외에는 None."""
+    info = read_snapshot_info(path)
+    if not info:
+        return None
+    if info.get("format_version") != SNAPSHOT_FORMAT_VERSION or info.get("source_hash") != source_hash:
+        return None
+
+    import pyarrow.parquet as pq
+
+    try:
+        table = pq.read_table(path, memory_map=True)
+    except Exception:
+        return None
+
+    if table.num_rows != info.get("row_count") or table.column_names != info.get("columns"):
+        return None
+
+    df = table.to_pandas()
+    # pyarrow는 list 컬럼을 numpy 배열로 돌려주므로 앱 코드가 기대하는 list로 되돌린다.
+    for col in _list_columns(table.schema):
+        df[col] = [list(value) if value is not None else [] for value in df[col].tolist()]
+    df.attrs.update(info.get("attrs", {}))
+    return df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="career_jobs 전처리 스냅샷 생성")
+    parser.add_argument("--input", type=Path, default=None)
+    args = parser.parse_args()
+
+    # search.py의 전처리 파이프라인을 그대로 사용해야 앱과 같은 결과가 나온다.
+    import search
+
+    data_path = (args.input or search.DATA_FILE).resolve()
+    snapshot_path = snapshot_path_for(data_path)
+    source_hash = search.dataset_source_hash(data_path)
+
+    print(f"[1/3] 원본 전처리: {data_path}")
+    df = search.prepare_dataset(data_path)
+    df.attrs["data_version"] = source_hash[:12]
+
+    print(f"[2/3] 스냅샷 저장: {snapshot_path}")
+    write_snapshot(df, snapshot_path, source_hash)
+
+    print("[3/3] 스냅샷 검증")
+    loaded = read_snapshot(snapshot_path, source_hash)
+    if loaded is None or len(loaded) != len(df) or list(loaded.columns) != list(df.columns):
+        raise SystemExit("스냅샷 검증에 실패했습니다.")
+
+    print(f"저장 완료: {len(loaded):,}행, {len(loaded.columns)}개 컬럼, source_hash={source_hash[:12]}")
+
+
+if __name__ == "__main__":
+    main()
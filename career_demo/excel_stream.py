@@ -0,0 +1,130 @@
+"""
+엑셀/CSV 청크 단위 적재
+
+목적:
+- load_data, build_embeddings, build_keyword_meta, data_loader.load_job_data가 같은 방식으로
+  원본 표를 읽도록 하는 공통 적재 계층.
+- openpyxl read_only 모드로 시트를 행 단위로 흘려 읽고, chunk_size 행마다 pandas
+  TextParser로 형 변환한 DataFrame 배치를 돌려준다. 시트 전체를 파이썬 리스트로 올린 뒤
+  한 번에 변환하는 pd.read_excel과 달리, 파싱 중 셀 값 버퍼가 청크 크기로 제한된다.
+- 메모리 상한은 iter_table_chunks를 청크 단위로 소비할 때만 유지된다. read_table은 모든 청크를 모아
+  하나의 DataFrame으로 합치므로 결과 프레임(과 합치는 동안의 청크 목록)은 표 전체 크기만큼 메모리를 쓴다.
+  지금의 적재 함수들은 중복 제거·분위수·임베딩처럼 표 전체가 필요해 read_table을 쓴다.
+- 형 변환 규칙(빈 칸 → NaN, 숫자처럼 보이는 문자열 → 숫자, 중복/빈 헤더 이름)은 pd.read_excel과 같다.
+  청크마다 추론한 dtype이 어긋나는 경우(앞 청크가 모두 빈 칸 등)는 read_table이 합칠 때 맞춘다.
+  단, 한 컬럼이 어떤 청크에서는 숫자로, 다른 청크에서는 문자열로 추론되면 청크별 값이 섞인 object
+  컬럼이 된다. 기본 청크(5000행)보다 작은 career_jobs.xlsx는 한 청크로 읽혀 pd.read_excel과 완전히 같다.
+- CSV는 pd.read_csv(chunksize=...)로 같은 인터페이스를 제공하고, .xls는 pd.read_excel로 읽는다.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+
+DEFAULT_CHUNK_SIZE = 5000
+STREAMING_EXCEL_SUFFIXES = {".xlsx", ".xlsm"}
+
+
+def source_suffix(source) -> str:
+    name = source if isinstance(source, (str, Path)) else getattr(source, "name", "")
+    return Path(str(name or "")).suffix.lower()
+
+
+def _convert_cell(value):
+    # pandas OpenpyxlReader._convert_cell과 같은 규칙.
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _parse_chunk(header: list, rows: list[list]) -> pd.DataFrame:
+    from pandas.io.parsers import TextParser
+
+    return TextParser([header] + rows, header=0).read()
+
+
+def iter_excel_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_name: str | int = 0) -> Iterator[pd.DataFrame]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        worksheet = workbook[sheet_name] if isinstance(sheet_name, str) else workbook.worksheets[sheet_name]
+        rows = worksheet.iter_rows(values_only=True)
+
+        header = None
+        for values in rows:
+            converted = [_convert_cell(value) for value in values]
+            if any(value != "" for value in converted):
+                header = converted
+                break
+        if header is None:
+            return
+
+        width = max(len(header), worksheet.max_column or 0)
+        header = header + [""] * (width - len(header))
+
+        batch: list[list] = []
+        for values in rows:
+            converted = [_convert_cell(value) for value in values[:width]]
+            # 완전히 빈 행은 pd.read_excel(TextParser skip_blank_lines)처럼 건너뛴다.
+            if not any(value != "" for value in converted):
+                continue
+            batch.append(converted + [""] * (width - len(converted)))
+            if len(batch) >= chunk_size:
+                yield _parse_chunk(header, batch)
+                batch = []
+        if batch:
+            yield _parse_chunk(header, batch)
+    finally:
+        workbook.close()
+
+
+def iter_table_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_name: str | int = 0) -> Iterator[pd.DataFrame]:
+    """엑셀/CSV 원본을 chunk_size 행씩 형 변환된 DataFrame으로 돌려준다."""
+    suffix = source_suffix(source)
+    if suffix == ".csv":
+        yield from pd.read_csv(source, chunksize=chunk_size)
+    elif suffix in STREAMING_EXCEL_SUFFIXES or not suffix:
+        yield from iter_excel_chunks(source, chunk_size=chunk_size, sheet_name=sheet_name)
+    else:
+        yield pd.read_excel(source, sheet_name=sheet_name)
+
+
+def _align_chunk_dtypes(chunks: list[pd.DataFrame]) -> None:
+    """값이 모두 빈 청크 컬럼을 다른 청크의 dtype에 맞춘다. 정수/불리언은 NaN을 담을 수 없으므로 그대로 둔다."""
+    for col in chunks[0].columns:
+        filled = [chunk[col].dtype for chunk in chunks if chunk[col].notna().any()]
+        if not filled or any(dtype != filled[0] for dtype in filled):
+            continue
+        target = filled[0]
+        if pd.api.types.is_integer_dtype(target) or pd.api.types.is_bool_dtype(target):
+            continue
+        for chunk in chunks:
+            if chunk[col].dtype != target and not chunk[col].notna().any():
+                chunk[col] = chunk[col].astype(target)
+
+
+def read_table(source, chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_name: str | int = 0) -> pd.DataFrame:
+    """iter_table_chunks 결과를 하나로 합친다. 결과는 pd.read_excel/pd.read_csv와 같다.
+
+    파싱 버퍼만 청크 크기로 제한되고, 돌려주는 프레임은 표 전체를 메모리에 담는다.
+    표 전체를 한 번에 들고 있지 않으려면 iter_table_chunks를 직접 소비한다.
+    """
+    if source_suffix(source) == ".csv":
+        return pd.read_csv(source)
+
+    chunks = list(iter_table_chunks(source, chunk_size=chunk_size, sheet_name=sheet_name))
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+    _align_chunk_dtypes(chunks)
+    return pd.concat(chunks, ignore_index=True)
@@ -0,0 +1,296 @@
+"""
+직업 상세 페이지 정적 사이트 내보내기
+
+목적:
+- 진로 주간처럼 접속이 몰리는 기간에 상세 페이지를 Python 프로세스 없이
+  아무 정적 파일 서버(nginx, GitHub Pages, S3 등)에서 제공할 수 있도록 한다.
+- 상세 화면과 같은 섹션 빌더(search.build_detail_fragments)와 inject_css의 CSS를 그대로 사용하므로
+  Streamlit 화면과 같은 마크업이 나온다. 탭/펼치기 같은 위젯만 정적 HTML로 바꾼다.
+- 하이브리드(의미) 검색은 계속 Streamlit 앱이 담당하고, 여기서는 직업명/키워드 기반의
+  간단한 목록 필터용 검색 색인(search_index.json)만 미리 만들어 둔다.
+
+출력 구조:
+   static_site/
+     index.html            직업 목록 + 클라이언트 측 필터
+     search_index.json     직업별 id/이름/키워드/검색 키
+     assets/app.css        inject_css의 스타일 + 정적 레이아웃 규칙 (모든 페이지가 공유)
+     jobs/<page>.html      직업별 상세 페이지
+
+권장 실행 (데이터 갱신 후 1회):
+   python export_static_site.py
+   python export_static_site.py --output static_site --limit 20
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import time
+
+import pandas as pd
+
+# search.py의 전처리/섹션 빌더를 그대로 사용해야 앱과 같은 결과가 나온다.
+import search
+from hangul import compact_search_key, extract_chosung
+
+
+DEFAULT_OUTPUT_DIR = search.BASE_DIR / "static_site"
+JOB_PAGE_DIR_NAME = "jobs"
+SEARCH_INDEX_FILE_NAME = "search_index.json"
+STYLESHEET_PATH = "assets/app.css"
+SEARCH_INDEX_VERSION = 1
+
+# Streamlit의 columns/tabs/expander를 대신하는 최소 레이아웃 규칙
+STATIC_LAYOUT_CSS = """
+body{ margin:0; background:var(--bg); color:var(--text); font-family:"Pretendard","Noto Sans KR",-apple-system,BlinkMacSystemFont,sans-serif; }
+.static-page{ max-width:1180px; margin:0 auto; padding:32px 20px 48px 20px; }
+.static-row{ display:grid; gap:24px; margin-bottom:24px; align-items:start; }
+.static-col{ display:flex; flex-direction:column; gap:16px; min-width:0; }
+.static-nav{ margin:0 0 18px 0; }
+.static-nav a, .static-link{ color:var(--blue); text-decoration:none; font-weight:700; }
+.static-tab-title{ font-size:16px; font-weight:800; margin:4px 0 10px 0; }
+.static-details summary{ cursor:pointer; font-weight:700; margin:10px 0; }
+.static-neighbor-list{ display:flex; flex-wrap:wrap; gap:8px; margin-top:10px; }
+.static-search{ width:100%; box-sizing:border-box; padding:14px 16px; font-size:16px; border:1px solid var(--line-strong); border-radius:14px; margin:18px 0; }
+.static-job-list{ display:grid; grid-template-columns:repeat(3, minmax(0, 1fr)); gap:16px; }
+.static-job-list .soft-card[hidden]{ display:none; }
+@media (max-width: 768px){
+    .static-row, .static-job-list{ grid-template-columns:1fr !important; }
+}
+"""
+
+INDEX_FILTER_SCRIPT = """
+<script>
+(function(){
+    var input = document.getElementById("job-filter");
+    var cards = Array.prototype.slice.call(document.querySelectorAll("[data-search-key]"));
+    input.addEventListener("input", function(){
+        var q = input.value.toLowerCase().replace(/[^0-9a-z가-힣ㄱ-ㅎㅏ-ㅣ]/g, "");
+        cards.forEach(function(card){
+            var hit = !q || card.dataset.searchKey.indexOf(q) >= 0 || card.dataset.chosung.indexOf(q) >= 0;
+            card.hidden = !hit;
+        });
+    });
+})();
+</script>
+"""
+
+
+def job_page_name(job_id: str) -> str:
+    """job_id를 파일명으로 바꾼다. id::123 → id-123.html, 이름 기반 키는 해시를 쓴다."""
+    if job_id.startswith("id::") and re.fullmatch(r"[0-9A-Za-z_-]+", job_id[4:]):
+        return f"id-{job_id[4:]}.html"
+    return f"job-{hashlib.sha1(job_id.encode('utf-8')).hexdigest()[:12]}.html"
+
+
+def render_row(columns: list[str], widths: list[float]) -> str:
+    template = " ".join(f"{width}fr" for width in widths)
+    cells = "".join(f'<div class="static-col">{cell}</div>' for cell in columns)
+    return f'<div class="static-row" style="grid-template-columns:{template};">{cells}</div>'
+
+
+def render_outlook_static(title: str, fragment: dict) -> str:
+    parts = [f'<div class="static-tab-title">{html.escape(title)}</div>', fragment["card_html"]]
+    if fragment["full_html"]:
+        parts.append(
+            f'<details class="static-details"><summary>{html.escape(title)} 세부 설명 보기</summary>{fragment["full_html"]}</details>'
+        )
+    return "".join(parts)
+
+
+def render_semantic_neighbors_static(neighbors: list[tuple[str, str, float]], known_pages: dict[str, str]) -> str:
+    links = []
+    for job_id, name, score in neighbors:
+        label = f"{html.escape(name)} · {score * 100:.0f}%"
+        page = known_pages.get(job_id)
+        if page:
+            links.append(f'<a class="pill static-link" href="{html.escape(page)}">{label}</a>')
+        else:
+            links.append(f'<span class="pill">{label}</span>')
+    if not links:
+        return ""
+    return f"""
+        <div class="soft-card">
+            <div class="section-title" style="font-size:18px; margin-bottom:4px;">의미가 비슷한 직업</div>
+            <div class="section-sub">직무 설명 임베딩이 가까운 직업입니다.</div>
+            <div class="static-neighbor-list">{''.join(links)}</div>
+        </div>
+        """
+
+
+def build_stylesheet() -> str:
+    css = re.sub(r"^\s*<style>|</style>\s*$", "", search.build_app_css())
+    return css.strip() + "\n" + STATIC_LAYOUT_CSS.strip() + "\n"
+
+
+def render_job_page(detail: pd.Series, known_pages: dict[str, str]) -> str:
+    fragments = search.build_detail_fragments(detail)
+    profile = fragments["profile"]
+    capability = fragments["capability"]
+    market = fragments["market"]
+    chart = fragments["chart"]
+
+    gender_html = chart["gender_chart_html"] or '<div class="empty-text">성별 PCNT 데이터가 없습니다.</div>'
+    age_html = chart["age_chart_html"] or '<div class="empty-text">연령대 PCNT 데이터가 없습니다.</div>'
+    salary_html = market["salary_gauge_html"] or '<div class="empty-text">임금 그래프를 표시할 수 있는 데이터가 없습니다.</div>'
+
+    body = [
+        '<div class="static-nav"><a href="../index.html">← 목록으로</a></div>',
+        search.build_detail_hero(str(detail.get("job", ""))),
+        search.build_section_header("profile"),
+        render_row(
+            [
+                profile["profile_html"],
+                profile["similar_html"]
+                + render_semantic_neighbors_static(profile["semantic_neighbors"], known_pages)
+                + profile["major_html"],
+            ],
+            [1.2, 0.8],
+        ),
+        search.build_section_header("roadmap"),
+        render_row(fragments["roadmap"]["timeline_cards"], [1] * len(fragments["roadmap"]["timeline_cards"])),
+        search.build_section_header("capability"),
+        render_row(
+            [
+                capability["keyword_html"] + capability["aptitude_html"],
+                capability["cert_html"] + capability["contact_html"],
+            ],
+            [1, 1],
+        ),
+        search.build_section_header("market"),
+        render_row(
+            [
+                market["summary_html"] + salary_html,
+                render_outlook_static("고용전망", market["employment_outlook"])
+                + render_outlook_static("발전가능성", market["possibility_outlook"]),
+            ],
+            [0.9, 1.1],
+        ),
+        search.build_section_header("chart"),
+        render_row(
+            [
+                search.build_card_heading("성별 관심도 비중") + gender_html,
+                search.build_card_heading("연령대별 선호도") + age_html,
+            ],
+            [1, 1],
+        ),
+    ]
+    return render_document(f"{detail.get('job', '')} · AI 직업 탐색 리포트", f"../{STYLESHEET_PATH}", "".join(body))
+
+
+def render_document(title: str, stylesheet: str, body: str, script: str = "") -> str:
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f'<title>{html.escape(title)}</title>\n<link rel="stylesheet" href="{html.escape(stylesheet)}">\n</head>\n'
+        f'<body>\n<div class="static-page">\n{body}\n</div>\n{script}\n</body>\n</html>\n'
+    )
+
+
+def build_search_index_entry(detail: pd.Series, url: str) -> dict:
+    keywords = list(detail.get("display_keywords_list") or detail.get("llm_keywords_list") or [])
+    topics = list(detail.get("topic_tags_list") or [])
+    majors = list(detail.get("major_list") or [])
+    job_name = str(detail.get("job", ""))
+    salary_amount = search.safe_float(detail.get("salary_amount"))
+    return {
+        "id": str(detail.get("job_id", "")),
+        "job": job_name,
+        "url": url,
+        "summary": search.shorten_text(detail.get("summary", ""), 120),
+        "keywords": keywords,
+        "topics": topics,
+        "majors": majors,
+        "salary_amount": salary_amount,
+        "salary_bucket": str(detail.get("salary_bucket", "")),
+        "employment_status": str(detail.get("employment_status", "")),
+        "search_key": compact_search_key(" ".join([job_name, *keywords, *topics, *majors])),
+        "chosung": extract_chosung(job_name),
+    }
+
+
+def render_index_page(entries: list[dict]) -> str:
+    cards = []
+    for entry in entries:
+        cards.append(
+            f"""
+            <a class="soft-card static-link" href="{html.escape(entry['url'])}"
+               data-search-key="{html.escape(entry['search_key'])}" data-chosung="{html.escape(entry['chosung'])}">
+                <div class="section-title" style="font-size:18px; margin-bottom:6px;">{html.escape(entry['job'])}</div>
+                <div class="section-sub">{html.escape(entry['summary'])}</div>
+            </a>
+            """
+        )
+    body = f"""
+        <div class="hero">
+            <div class="hero-kicker">Job-Explorer AI</div>
+            <div class="hero-title">직업 상세 정보</div>
+            <div class="hero-sub">직업 데이터 {len(entries):,}건의 상세 페이지입니다. 의미 기반 검색은 AI 직업 탐색 앱에서 이용할 수 있습니다.</div>
+        </div>
+        <input id="job-filter" class="static-search" type="search" placeholder="직업명, 키워드, 전공 또는 초성(ㅅㅍㅌㅇ)으로 찾기">
+        <div class="static-job-list">{''.join(cards)}</div>
+        """
+    return render_document("AI 직업 탐색 리포트", STYLESHEET_PATH, body, INDEX_FILTER_SCRIPT)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def export_static_site(df: pd.DataFrame, output_dir: Path, limit: int | None = None) -> dict:
+    rows = df if limit is None else df.head(limit)
+    job_dir = output_dir / JOB_PAGE_DIR_NAME
+    job_dir.mkdir(parents=True, exist_ok=True)
+    stylesheet_path = output_dir / STYLESHEET_PATH
+    stylesheet_path.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(stylesheet_path, build_stylesheet())
+
+    known_pages = {str(job_id): job_page_name(str(job_id)) for job_id in rows["job_id"].tolist()}
+
+    entries = []
+    for _, detail in rows.iterrows():
+        page_name = known_pages[str(detail["job_id"])]
+        write_text_atomic(job_dir / page_name, render_job_page(detail, known_pages))
+        entries.append(build_search_index_entry(detail, f"{JOB_PAGE_DIR_NAME}/{page_name}"))
+
+    index = {
+        "version": SEARCH_INDEX_VERSION,
+        "data_version": str(df.attrs.get("data_version", "")),
+        "template_version": search.DETAIL_TEMPLATE_VERSION,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "jobs": entries,
+    }
+    write_text_atomic(output_dir / SEARCH_INDEX_FILE_NAME, json.dumps(index, ensure_ascii=False))
+    write_text_atomic(output_dir / "index.html", render_index_page(entries))
+    return index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="직업 상세 페이지 정적 사이트 내보내기")
+    parser.add_argument("--input", type=Path, default=None)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 일부 직업만 내보내기 (점검용)")
+    args = parser.parse_args()
+
+    data_path = (args.input or search.DATA_FILE).resolve()
+    print(f"[1/2] 데이터 로드: {data_path}")
+    df = search.load_data(data_path)
+
+    print(f"[2/2] 정적 페이지 생성: {args.output}")
+    started = time.perf_counter()
+    index = export_static_site(df, args.output, limit=args.limit)
+    elapsed = time.perf_counter() - started
+
+    print(f"저장 완료: {len(index['jobs']):,}개 페이지, {elapsed:.1f}초, data_version={index['data_version']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+한글 자모 분해 유틸리티
+
+- 완성형 음절(가-힣)을 초성/중성/종성 호환 자모로 분해한다.
+- 겹받침(ㄳ, ㄺ …)과 이중모음(ㅘ, ㅢ …)은 입력 순서대로 다시 나눠,
+  입력 도중의 "솦"(소+ㅍ)이 "소프트"의 접두어로 인식되도록 한다.
+"""
+
+from __future__ import annotations
+
+import re
+
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+
+CHOSEONG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ", "ㅙ",
+    "ㅚ", "ㅛ", "ㅜ", "ㅝ", "ㅞ", "ㅟ", "ㅠ", "ㅡ", "ㅢ", "ㅣ",
+]
+JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+CHOSEONG_SET = set(CHOSEONG)
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return HANGUL_START <= ord(char) <= HANGUL_END
+
+
+def split_syllable(char: str) -> tuple[str, str, str]:
+    offset = ord(char) - HANGUL_START
+    return (
+        CHOSEONG[offset // (21 * 28)],
+        JUNGSEONG[(offset % (21 * 28)) // 28],
+        JONGSEONG[offset % 28],
+    )
+
+
+def decompose_jamo(text: str) -> str:
+    """음절을 자모열로 풀어 쓴다. 한글이 아닌 문자는 소문자로 그대로 둔다."""
+    output: list[str] = []
+    for char in str(text).lower():
+        if is_hangul_syllable(char):
+            for jamo in split_syllable(char):
+                output.append(COMPOUND_JAMO.get(jamo, jamo))
+        else:
+            output.append(COMPOUND_JAMO.get(char, char))
+    return "".join(output)
+
+
+def extract_chosung(text: str) -> str:
+    """음절은 초성만 남기고, 이미 자음인 문자는 그대로 둔다. 그 외 문자는 버린다."""
+    output: list[str] = []
+    for char in str(text):
+        if is_hangul_syllable(char):
+            output.append(split_syllable(char)[0])
+        elif char in CHOSEONG_SET:
+            output.append(char)
+    return "".join(output)
+
+
+def is_chosung_text(text: str, min_length: int = 2) -> bool:
+    """공백을 뺀 나머지가 모두 초성 자음인지 ("ㅅㅍㅌㅇ" 같은 초성 검색어 판별)."""
+    letters = [char for char in str(text) if not char.isspace()]
+    return len(letters) >= min_length and all(char in CHOSEONG_SET for char in letters)
+
+
+def compact_search_key(text: str) -> str:
+    """공백·기호를 뺀 소문자 키. 자동완성/오타 색인의 공통 정규화 기준이다."""
+    return re.sub(r"[^0-9a-z가-힣ㄱ-ㅎㅏ-ㅣ]", "", str(text).lower())
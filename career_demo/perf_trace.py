@@ -0,0 +1,164 @@
+"""
+검색 rerun 구간 계측 (개발 모드 전용)
+
+- ?dev=1일 때만 켜진다. 꺼져 있으면 span()은 미리 만들어 둔 빈 컨텍스트를 돌려주고,
+  traced 함수는 ContextVar 조회 한 번 뒤 원 함수를 그대로 호출한다.
+- 켜져 있으면 rerun 하나 동안의 구간(이름, 시작 시점, 길이, 중첩 깊이)을 모아 워터폴로 보여주고,
+  프로세스 전체 누적 통계(횟수, 합계, 최대, 최근 N회 분위수)를 JSON으로 내보낼 수 있다.
+- Streamlit은 세션마다 별도 스레드에서 스크립트를 돌리므로, 진행 중인 rerun은 ContextVar로 구분한다.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+import functools
+import json
+import threading
+import time
+
+import numpy as np
+
+
+ROLLING_WINDOW = 200
+RERUN_SPAN_NAME = "rerun"
+
+_CURRENT_TRACE: ContextVar[dict | None] = ContextVar("kirbs_perf_trace", default=None)
+_NULL_SPAN = nullcontext()
+
+_AGGREGATES: dict[str, dict] = {}
+_AGGREGATES_LOCK = threading.Lock()
+
+
+class _Span:
+    __slots__ = ("trace", "name", "meta", "started", "depth")
+
+    def __init__(self, trace: dict, name: str, meta: dict):
+        self.trace = trace
+        self.name = name
+        self.meta = meta
+
+    def __enter__(self):
+        self.depth = self.trace["depth"]
+        self.trace["depth"] += 1
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ended = time.perf_counter()
+        self.trace["depth"] -= 1
+        self.trace["spans"].append(
+            {
+                "name": self.name,
+                "start_ms": (self.started - self.trace["started"]) * 1000,
+                "ms": (ended - self.started) * 1000,
+                "depth": self.depth,
+                "meta": self.meta,
+            }
+        )
+        return False
+
+
+def is_tracing() -> bool:
+    return _CURRENT_TRACE.get() is not None
+
+
+def span(name: str, **meta):
+    trace = _CURRENT_TRACE.get()
+    if trace is None:
+        return _NULL_SPAN
+    return _Span(trace, name, meta)
+
+
+def traced(name: str | None = None):
+    """함수 호출 전체를 하나의 구간으로 기록한다. st.cache_* 위에 두면 캐시 조회 시간까지 잰다."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _CURRENT_TRACE.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with _Span(trace, span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_trace(enabled: bool) -> dict | None:
+    if not enabled:
+        _CURRENT_TRACE.set(None)
+        return None
+    trace = {"started": time.perf_counter(), "spans": [], "depth": 0}
+    _CURRENT_TRACE.set(trace)
+    return trace
+
+
+def finish_trace(trace: dict | None) -> dict | None:
+    """rerun 계측을 닫고 누적 통계에 반영한다. 시작 순서로 정렬된 구간 목록을 돌려준다."""
+    _CURRENT_TRACE.set(None)
+    if trace is None:
+        return None
+
+    total_ms = (time.perf_counter() - trace["started"]) * 1000
+    spans = sorted(trace["spans"], key=lambda item: (item["start_ms"], item["depth"]))
+
+    with _AGGREGATES_LOCK:
+        _add_sample(RERUN_SPAN_NAME, total_ms)
+        for item in spans:
+            _add_sample(item["name"], item["ms"])
+
+    return {"total_ms": total_ms, "spans": spans}
+
+
+def _add_sample(name: str, ms: float) -> None:
+    entry = _AGGREGATES.get(name)
+    if entry is None:
+        entry = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "recent": deque(maxlen=ROLLING_WINDOW)}
+        _AGGREGATES[name] = entry
+    entry["count"] += 1
+    entry["total_ms"] += ms
+    entry["max_ms"] = max(entry["max_ms"], ms)
+    entry["recent"].append(ms)
+
+
+def aggregate_summary() -> list[dict]:
+    with _AGGREGATES_LOCK:
+        snapshot = {name: (dict(entry), list(entry["recent"])) for name, entry in _AGGREGATES.items()}
+
+    rows = []
+    for name, (entry, recent) in snapshot.items():
+        recent_arr = np.asarray(recent, dtype=np.float64)
+        rows.append(
+            {
+                "span": name,
+                "count": entry["count"],
+                "mean_ms": round(entry["total_ms"] / entry["count"], 3),
+                "p50_ms": round(float(np.percentile(recent_arr, 50)), 3),
+                "p95_ms": round(float(np.percentile(recent_arr, 95)), 3),
+                "max_ms": round(entry["max_ms"], 3),
+                "total_ms": round(entry["total_ms"], 3),
+            }
+        )
+    return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+
+def export_aggregates_json() -> str:
+    return json.dumps(
+        {
+            "exported_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "rolling_window": ROLLING_WINDOW,
+            "spans": aggregate_summary(),
+        },
+        ensure_ascii=False,
+        indent=2,
+    )
+
+
+def reset_aggregates() -> None:
+    with _AGGREGATES_LOCK:
+        _AGGREGATES.clear()
@@ -7,7 +7,8 @@ import time
 import re
 import json
 import textwrap
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 from difflib import SequenceMatcher
 from math import ceil
 import warnings
@@ -34,18 +35,58 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+from artifact_store import (
+    active_artifact_version,
+    artifact_status,
+    create_artifact_store,
+    list_watched_files,
+    pin_artifact_version,
+    pinned_artifact_version,
+)
+from dataset_snapshot import compute_source_hash, read_snapshot, snapshot_path_for, write_snapshot
+from excel_stream import read_table
+from hangul import is_chosung_text
+from perf_trace import (
+    aggregate_summary,
+    export_aggregates_json,
+    finish_trace,
+    reset_aggregates,
+    span,
+    start_trace,
+    traced,
+)
+from search_index import (
+    SUGGESTION_KIND_LABELS,
+    build_chosung_index,
+    build_job_lookup,
+    build_suggestion_index,
+    build_typo_index,
+    chosung_candidate_positions,
+    lookup_job_position,
+    suggest_chosung_queries,
+    suggest_correction,
+    suggest_queries,
+    typo_candidate_positions,
+)
+
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_FILE = BASE_DIR / "career_jobs.xlsx"
 EMBEDDING_DIR = BASE_DIR / "embedding_output"
 EMBED_META_FILE = EMBEDDING_DIR / "career_jobs_embedding_meta.xlsx"
+EMBED_META_PARQUET_FILE = EMBEDDING_DIR / "career_jobs_embedding_meta.parquet"
 EMBED_ARRAY_FILE = EMBEDDING_DIR / "career_jobs_embeddings.npy"
 EMBED_CONFIG_FILE = EMBEDDING_DIR / "embedding_config.json"
 SEMANTIC_THRESHOLD = 0.34
+# load_data 전처리 결과가 달라지는 변경을 하면 올려서 기존 스냅샷을 무효화한다.
+DATASET_PREPARE_VERSION = 3
+# 상세 페이지 딥 링크용 쿼리 파라미터 (?job=<job_id>)
+JOB_QUERY_PARAM = "job"
 
 st.set_page_config(
     page_title="AI 직업 탐색 리포트",
-    page_icon="🔎",
+    # 이모지 아이콘은 Streamlit이 검증용 이모지 목록 전체를 불러오므로(콜드 임포트 +100ms 이상) 머티리얼 아이콘을 쓴다.
+    page_icon=":material/search:",
     layout="wide",
     initial_sidebar_state="collapsed",
     menu_items={},
@@ -384,6 +425,91 @@ def combine_pcnt_columns(
     return 0.0 if value is None else float(value)
 
 
+# 차트용 PCNT 통계: 정규화 컬럼명 → (정수부 컬럼 후보, 소수부 컬럼 후보, 별칭)
+PCNT_STAT_SPECS = {
+    "pcnt_male": (
+        ["PCNT1_남자", "PNT1_남자", "PCNT1 남자", "PNT1 남자", "PCNT1_남성", "PNT1_남성"],
+        ["PCNT2_남자", "PNT2_남자", "PCNT2 남자", "PNT2 남자", "PCNT2_남성", "PNT2_남성"],
+        ["남자", "남성", "male"],
+    ),
+    "pcnt_female": (
+        ["PCNT1_여자", "PNT1_여자", "PCNT1 여자", "PNT1 여자", "PCNT1_여성", "PNT1_여성"],
+        ["PCNT2_여자", "PNT2_여자", "PCNT2 여자", "PNT2 여자", "PCNT2_여성", "PNT2_여성"],
+        ["여자", "여성", "female"],
+    ),
+    "pcnt_middle": (
+        ["PCNT1_중학생", "PNT1_중학생", "PCNT1 중학생", "PNT1 중학생", "PCNT1_중등", "PNT1_중등"],
+        ["PCNT2_중학생", "PNT2_중학생", "PCNT2 중학생", "PNT2 중학생", "PCNT2_중등", "PNT2_중등"],
+        ["중학생", "중등", "middle"],
+    ),
+    "pcnt_high": (
+        ["PCNT1_고등학생", "PNT1_고등학생", "PCNT1 고등학생", "PNT1 고등학생", "PCNT1_고등", "PNT1_고등"],
+        ["PCNT2_고등학생", "PNT2_고등학생", "PCNT2 고등학생", "PNT2 고등학생", "PCNT2_고등", "PNT2_고등"],
+        ["고등학생", "고등", "high"],
+    ),
+}
+
+
+def resolve_pcnt_part_columns(columns, exact_columns: list[str], aliases: list[str], part_no: int) -> list[str]:
+    """first_existing_numeric → find_pcnt_part_by_alias 순서 그대로, 값을 찾아볼 컬럼 후보를 한 번만 정한다."""
+    candidates = [col for col in exact_columns if col in columns]
+
+    alias_keys = [normalize_column_key(alias) for alias in aliases if alias]
+    part_patterns = [f"pcnt{part_no}", f"pnt{part_no}", f"percent{part_no}", f"pct{part_no}"]
+    for col in columns:
+        key = normalize_column_key(col)
+        if not any(alias in key for alias in alias_keys):
+            continue
+        if not any(pattern in key for pattern in part_patterns):
+            if not (("pcnt" in key or "pnt" in key or "percent" in key or "pct" in key) and key.endswith(str(part_no))):
+                continue
+        if col not in candidates:
+            candidates.append(col)
+    return candidates
+
+
+def coalesce_numeric_columns(frame: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """행마다 후보 컬럼 중 처음으로 숫자로 읽히는 값을 고른다(safe_float 기준)."""
+    result = pd.Series(np.nan, index=frame.index, dtype="float64")
+    for col in columns:
+        values = frame[col]
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            numeric = values.astype("float64")
+        else:
+            numeric = pd.Series(map_unique_values(values, safe_float), index=frame.index, dtype="float64")
+        result = result.fillna(numeric)
+    return result
+
+
+def combine_pcnt_arrays(integer_part: pd.Series, decimal_part: pd.Series) -> pd.Series:
+    """combine_pcnt_value의 열 단위 버전. 두 값이 모두 없으면 0.0."""
+    whole = integer_part.fillna(0.0)
+    decimal = decimal_part.fillna(0.0)
+    # 10 <= decimal < 100 구간은 항상 두 자리이므로 /100과 같다.
+    fraction = np.where(decimal >= 100, 0.0, np.where(decimal >= 10, decimal / 100, decimal / 10))
+    combined = whole + fraction
+    return combined.where(integer_part.notna() | decimal_part.notna(), 0.0).astype("float64")
+
+
+def resolve_pcnt_stat_columns(frame: pd.DataFrame) -> dict[str, pd.Series]:
+    columns = list(frame.columns)
+    resolved = {}
+    for name, (integer_columns, decimal_columns, aliases) in PCNT_STAT_SPECS.items():
+        integer_part = coalesce_numeric_columns(frame, resolve_pcnt_part_columns(columns, integer_columns, aliases, 1))
+        decimal_part = coalesce_numeric_columns(frame, resolve_pcnt_part_columns(columns, decimal_columns, aliases, 2))
+        resolved[name] = combine_pcnt_arrays(integer_part, decimal_part)
+    return resolved
+
+
+def get_pcnt_stat(detail: pd.Series, name: str) -> float:
+    """load_data에서 정규화한 값을 우선 쓰고, 없는 프레임이면 별칭 탐색으로 되돌아간다."""
+    if name in detail.index:
+        value = safe_float(detail[name])
+        return 0.0 if value is None else value
+    integer_columns, decimal_columns, aliases = PCNT_STAT_SPECS[name]
+    return combine_pcnt_columns(detail, integer_columns, decimal_columns, aliases=aliases)
+
+
 def clamp_percent(value: float) -> float:
     try:
         value = float(value)
@@ -440,6 +566,9 @@ def parse_embedded_list(value) -> list[str]:
     if is_missing_like(value):
         return []
 
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+
     if isinstance(value, list):
         return unique_keep_order([str(x) for x in value if not is_missing_like(x)])
 
@@ -464,16 +593,35 @@ def parse_embedded_list(value) -> list[str]:
     return unique_keep_order(split_lines(text))
 
 
-@st.cache_data(show_spinner=False)
+def read_embedding_meta(meta_path: Path = EMBED_META_FILE) -> pd.DataFrame:
+    # Parquet 메타는 LLM 키워드 컬럼까지 담고 있을 때만 xlsx 대신 사용한다.
+    # build_job_embeddings.py만 다시 돌린 경우 Parquet에는 LLM 키워드가 없기 때문이다.
+    parquet_path = meta_path.with_suffix(".parquet")
+    if parquet_path.exists():
+        try:
+            meta = pd.read_parquet(parquet_path, memory_map=True)
+            if "llm_keywords_json" in meta.columns or not meta_path.exists():
+                return meta
+        except Exception:
+            pass
+    return read_table(meta_path)
+
+
+@traced("load_embedding_assets")
+@st.cache_resource(show_spinner=False, max_entries=2)
 def load_embedding_assets(
     meta_path: Path = EMBED_META_FILE,
     array_path: Path = EMBED_ARRAY_FILE,
     config_path: Path = EMBED_CONFIG_FILE,
+    artifact_version: str = "",
 ):
-    if not (meta_path.exists() and array_path.exists() and config_path.exists()):
+    # artifact_version은 캐시 키 역할만 한다. 산출물이 바뀌면 새 버전으로 다시 읽는다.
+    # 모든 세션이 같은 임베딩 행렬/메타를 공유하므로 돌려받은 값은 읽기 전용으로 다룬다.
+    has_meta = meta_path.exists() or meta_path.with_suffix(".parquet").exists()
+    if not (has_meta and array_path.exists() and config_path.exists()):
         return None
 
-    meta = pd.read_excel(meta_path)
+    meta = read_embedding_meta(meta_path)
     embeddings = np.load(array_path)
 
     if len(meta) != len(embeddings):
@@ -482,6 +630,18 @@ def load_embedding_assets(
     with open(config_path, "r", encoding="utf-8") as f:
         config = json.load(f)
 
+    # build_job_embeddings.py가 미리 계산한 코사인 상위 k 이웃 (int32 인덱스, float16 점수).
+    neighbor_indices = None
+    neighbor_scores = None
+    neighbor_index_path = array_path.parent / config.get("neighbor_index_file", "career_jobs_neighbors_idx.npy")
+    neighbor_score_path = array_path.parent / config.get("neighbor_score_file", "career_jobs_neighbors_score.npy")
+    if neighbor_index_path.exists() and neighbor_score_path.exists():
+        neighbor_indices = np.load(neighbor_index_path)
+        neighbor_scores = np.load(neighbor_score_path)
+        if len(neighbor_indices) != len(meta) or neighbor_scores.shape != neighbor_indices.shape:
+            neighbor_indices = None
+            neighbor_scores = None
+
     for col in ["display_keywords", "display_keywords_text", "display_keywords_json"]:
         if col not in meta.columns:
             meta[col] = ""
@@ -494,40 +654,28 @@ def load_embedding_assets(
 
     # LLM/ML로 사전 생성한 카드용 키워드가 있으면 최우선으로 사용한다.
     # 없으면 기존 display_keywords를 fallback으로 사용한다.
-    meta["llm_keywords_list"] = meta.apply(
-        lambda row: parse_embedded_list(
-            row.get("llm_keywords_json")
-            or row.get("llm_keywords_text")
-            or row.get("llm_keywords")
-            or row.get("card_keywords_json")
-            or row.get("card_keywords_text")
-            or row.get("card_keywords")
-        ),
-        axis=1,
-    )
-    meta["display_keywords_list"] = meta.apply(
-        lambda row: parse_embedded_list(
-            row.get("display_keywords_json") or row.get("display_keywords_text") or row.get("display_keywords")
-        ),
-        axis=1,
-    )
-    meta["topic_tags_list"] = meta.apply(
-        lambda row: parse_embedded_list(
-            row.get("topic_tags_json") or row.get("topic_tags_text") or row.get("topic_tags")
-        ),
-        axis=1,
-    )
+    list_sources = {
+        "llm_keywords_list": [
+            "llm_keywords_json", "llm_keywords_text", "llm_keywords",
+            "card_keywords_json", "card_keywords_text", "card_keywords",
+        ],
+        "display_keywords_list": ["display_keywords_json", "display_keywords_text", "display_keywords"],
+        "topic_tags_list": ["topic_tags_json", "topic_tags_text", "topic_tags"],
+    }
+    for list_col, source_cols in list_sources.items():
+        source = first_present_values(meta, source_cols)
+        meta[list_col] = [list(items) for items in map_unique_values(source, parse_embedded_list)]
 
-    keys = [
-        build_embedding_key(row.get("jobdicSeq"), row.get("job", ""))
-        for _, row in meta.iterrows()
-    ]
+    keys = build_embedding_keys(meta).tolist()
     key_to_index = {key: idx for idx, key in enumerate(keys)}
 
     return {
         "meta": meta,
         "embeddings": embeddings.astype(np.float32),
+        "keys": keys,
         "key_to_index": key_to_index,
+        "neighbor_indices": neighbor_indices,
+        "neighbor_scores": neighbor_scores,
         "model_name": config.get("model_name", "intfloat/multilingual-e5-base"),
         "normalize_embeddings": bool(config.get("normalize_embeddings", True)),
         "config": config,
@@ -540,11 +688,12 @@ def load_embedding_model(model_name: str):
     return SentenceTransformer(model_name)
 
 
+@traced()
 def compute_semantic_scores(df: pd.DataFrame, query: str) -> np.ndarray:
     if df.empty or not query.strip():
         return np.zeros(len(df), dtype=np.float32)
 
-    assets = load_embedding_assets()
+    assets = load_embedding_assets(artifact_version=pinned_artifact_version())
     if not assets:
         return np.zeros(len(df), dtype=np.float32)
 
@@ -559,10 +708,10 @@ def compute_semantic_scores(df: pd.DataFrame, query: str) -> np.ndarray:
     except Exception:
         return np.zeros(len(df), dtype=np.float32)
 
+    keys = df["job_id"].tolist() if "job_id" in df.columns else build_embedding_keys(df).tolist()
     positions = []
     embedding_indices = []
-    for pos, (_, row) in enumerate(df.iterrows()):
-        key = build_embedding_key(row.get("jobdicSeq"), row.get("job", ""))
+    for pos, key in enumerate(keys):
         idx = assets["key_to_index"].get(key)
         if idx is not None:
             positions.append(pos)
@@ -575,21 +724,131 @@ def compute_semantic_scores(df: pd.DataFrame, query: str) -> np.ndarray:
     return scores
 
 
+def get_semantic_neighbors(detail: pd.Series, limit: int = 6) -> list[tuple[str, str, float]]:
+    """사전 계산된 이웃 그래프에서 의미가 가까운 직업을 찾는다. 인코딩/행렬곱 없이 O(k)."""
+    assets = load_embedding_assets(artifact_version=pinned_artifact_version())
+    if not assets or assets.get("neighbor_indices") is None:
+        return []
+
+    idx = assets["key_to_index"].get(build_embedding_key(detail.get("jobdicSeq"), detail.get("job", "")))
+    if idx is None:
+        return []
+
+    meta_jobs = assets["meta"]["job"]
+    neighbors: list[tuple[str, str, float]] = []
+    for neighbor, score in zip(assets["neighbor_indices"][idx][:limit], assets["neighbor_scores"][idx][:limit]):
+        name = normalize_whitespace(str(meta_jobs.iat[int(neighbor)]))
+        if name:
+            neighbors.append((str(assets["keys"][int(neighbor)]), name, float(score)))
+    return neighbors
+
+
 # -----------------------------
-# Row-level extractors
+# Column-level extractors
 # -----------------------------
+SALARY_PATTERNS = [
+    r"평균연봉\(중위값\)은\s*([0-9]+(?:\.[0-9]+)?)\s*만원",
+    r"중위값\)?은\s*([0-9]+(?:\.[0-9]+)?)\s*만원",
+    r"평균연봉은\s*([0-9]+(?:\.[0-9]+)?)\s*만원",
+    r"([0-9]+(?:\.[0-9]+)?)\s*만원",
+]
+
+EMPLOYMENT_GOOD_WORDS = ["증가", "성장", "확대", "유망", "밝", "좋"]
+EMPLOYMENT_CAUTION_WORDS = ["감소", "축소", "줄어", "낮아질", "어려울", "감소할"]
+
+MISSING_TEXT_VALUES = ["", "nan", "none", "null"]
+
+
+def missing_text_mask(values: pd.Series) -> pd.Series:
+    """is_missing_like와 같은 기준으로 열 전체의 결측/공백 여부를 한 번에 계산한다."""
+    lowered = values.fillna("").astype(str).str.strip().str.lower()
+    return values.isna() | lowered.isin(MISSING_TEXT_VALUES)
+
+
+def text_column(frame: pd.DataFrame, col: str) -> pd.Series:
+    if col not in frame.columns:
+        return pd.Series("", index=frame.index, dtype=object)
+    return frame[col].fillna("").astype(str)
+
+
+def first_present_values(frame: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """여러 후보 열 중 행마다 처음으로 값이 있는 열의 값을 고른다."""
+    result = pd.Series("", index=frame.index, dtype=object)
+    pending = pd.Series(True, index=frame.index)
+    for col in columns:
+        if col not in frame.columns or not pending.any():
+            continue
+        available = pending & ~missing_text_mask(frame[col])
+        result.loc[available] = frame.loc[available, col].astype(object)
+        pending &= ~available
+    return result
+
+
+def normalize_whitespace_column(values: pd.Series) -> pd.Series:
+    """normalize_whitespace를 pandas 문자열 연산으로 열 단위 적용한다. 결측값은 빈 문자열이 된다."""
+    missing = missing_text_mask(values)
+    text = (
+        values.fillna("").astype(str)
+        .str.replace("_x000D_", " ", regex=False)
+        .str.replace("\\r", "\n", regex=False)
+        .str.replace("\\n", "\n", regex=False)
+        .str.replace("\r", "\n", regex=False)
+        .str.replace(r"(?i)<br\s*/?>", "\n", regex=True)
+        .str.replace(r"<[^>]+>", " ", regex=True)
+        .str.replace("\u00a0", " ", regex=False)
+        .str.replace(r"[ \t]+", " ", regex=True)
+        .str.replace(r"\n+", "\n", regex=True)
+        .str.strip()
+    )
+    return text.mask(missing, "")
+
+
+def map_unique_values(values: pd.Series, func, cache: dict | None = None) -> list:
+    """반복되는 셀 값은 한 번만 변환한다. 전공/연락처처럼 중복이 많은 열에서 비용을 줄인다."""
+    cache = {} if cache is None else cache
+    output = []
+    for value in values.tolist():
+        try:
+            result = cache[value]
+        except KeyError:
+            result = cache[value] = func(value)
+        except TypeError:
+            result = func(value)
+        output.append(result)
+    return output
+
+
+def resolve_prefixed_columns(columns, prefix: str) -> list[str]:
+    return [col for col in columns if str(col).startswith(prefix)]
+
+
+def collect_prefixed_lists(frame: pd.DataFrame, columns: list[str]) -> list[list[str]]:
+    if not columns:
+        return [[] for _ in range(len(frame))]
+
+    cache: dict = {}
+    per_column = [map_unique_values(frame[col], split_lines, cache) for col in columns]
+    # split_lines 결과는 이미 clean_sentence를 거친 값이므로 소문자 키로만 중복을 제거한다.
+    merged: list[list[str]] = []
+    for parts in zip(*per_column):
+        seen = set()
+        items: list[str] = []
+        for part in parts:
+            for item in part:
+                key = item.lower()
+                if key not in seen:
+                    seen.add(key)
+                    items.append(item)
+        merged.append(items)
+    return merged
+
+
 def extract_salary_amount(text) -> float | None:
     if is_missing_like(text):
         return None
 
     cleaned = str(text).replace(",", "")
-    patterns = [
-        r"평균연봉\(중위값\)은\s*([0-9]+(?:\.[0-9]+)?)\s*만원",
-        r"중위값\)?은\s*([0-9]+(?:\.[0-9]+)?)\s*만원",
-        r"평균연봉은\s*([0-9]+(?:\.[0-9]+)?)\s*만원",
-        r"([0-9]+(?:\.[0-9]+)?)\s*만원",
-    ]
-    for pattern in patterns:
+    for pattern in SALARY_PATTERNS:
         match = re.search(pattern, cleaned)
         if match:
             try:
@@ -599,81 +858,99 @@ def extract_salary_amount(text) -> float | None:
     return None
 
 
-def classify_salary_bucket(amount: float | None, low_cut: float | None, high_cut: float | None) -> str:
-    if amount is None:
-        return "정보 없음"
-    if low_cut is None or high_cut is None:
-        return "정보 있음"
-    if amount < low_cut:
-        return "하"
-    if amount < high_cut:
-        return "중"
-    return "상"
-
-
-def classify_employment_status(row: pd.Series) -> str:
-    text = f"{row.get('employment', '')} {row.get('job_possibility', '')}".lower()
-    if any(word in text for word in ["증가", "성장", "확대", "유망", "밝", "좋"]):
-        return "좋음"
-    if any(word in text for word in ["감소", "축소", "줄어", "낮아질", "어려울", "감소할"]):
-        return "주의"
-    return "보통"
-
+def extract_salary_amounts(values: pd.Series) -> pd.Series:
+    """extract_salary_amount의 열 단위 버전. 앞선 패턴에서 찾지 못한 행만 다음 패턴으로 넘긴다."""
+    text = values.fillna("").astype(str).str.replace(",", "", regex=False)
+    amounts = pd.Series(np.nan, index=values.index, dtype="float64")
+    for pattern in SALARY_PATTERNS:
+        pending = amounts.isna()
+        if not pending.any():
+            break
+        matched = text[pending].str.extract(pattern, expand=False)
+        amounts.loc[pending] = pd.to_numeric(matched, errors="coerce")
+    return amounts
 
-def get_prefixed_values(row: pd.Series, prefix: str) -> list[str]:
-    items: list[str] = []
-    for col in row.index:
-        if str(col).startswith(prefix):
-            items.extend(split_lines(row[col]))
-    return unique_keep_order(items)
 
+def classify_salary_buckets(amounts: pd.Series, low_cut: float | None, high_cut: float | None) -> pd.Series:
+    if low_cut is None or high_cut is None:
+        buckets = np.where(amounts.notna(), "정보 있음", "정보 없음")
+    else:
+        buckets = np.select(
+            [amounts.isna(), amounts < low_cut, amounts < high_cut],
+            ["정보 없음", "하", "중"],
+            default="상",
+        )
+    return pd.Series(buckets, index=amounts.index, dtype=object)
 
-def get_major_list(row: pd.Series) -> list[str]:
-    return get_prefixed_values(row, "major_")
 
+def classify_employment_statuses(frame: pd.DataFrame) -> pd.Series:
+    text = (text_column(frame, "employment") + " " + text_column(frame, "job_possibility")).str.lower()
+    good = text.str.contains("|".join(map(re.escape, EMPLOYMENT_GOOD_WORDS)), regex=True)
+    caution = text.str.contains("|".join(map(re.escape, EMPLOYMENT_CAUTION_WORDS)), regex=True)
+    statuses = np.select([good, caution], ["좋음", "주의"], default="보통")
+    return pd.Series(statuses, index=frame.index, dtype=object)
 
-def get_similar_jobs(row: pd.Series) -> list[str]:
-    return split_job_names(row.get("similarJob", ""))
 
+def build_search_blobs(frame: pd.DataFrame, major_lists: list[list[str]]) -> pd.Series:
+    columns = [col for col in SEARCH_COLUMNS if col in frame.columns]
+    blob = pd.Series("", index=frame.index, dtype=object)
+    for pos, col in enumerate(columns):
+        blob = blob + ("" if pos == 0 else " ") + text_column(frame, col)
 
-def get_certifications(row: pd.Series) -> list[str]:
-    return unique_keep_order(split_lines(row.get("certification", "")))
+    majors_text = pd.Series([" ".join(items) for items in major_lists], index=frame.index, dtype=object)
+    has_majors = majors_text != ""
+    separator = " " if columns else ""
+    blob = blob.where(~has_majors, blob + separator + majors_text)
+    return blob.str.lower()
 
 
-def get_contacts(row: pd.Series) -> list[str]:
-    return unique_keep_order(get_prefixed_values(row, "contact_"))
+def build_embedding_keys(frame: pd.DataFrame) -> pd.Series:
+    """build_embedding_key의 열 단위 버전. jobdicSeq가 있으면 id 키, 없으면 직업명 키를 만든다."""
+    job_names = frame["job"] if "job" in frame.columns else pd.Series("", index=frame.index)
+    job_keys = pd.Series(
+        map_unique_values(job_names, lambda name: f"job::{clean_sentence(str(name)).lower()}"),
+        index=frame.index,
+        dtype=object,
+    )
+    if "jobdicSeq" not in frame.columns:
+        return job_keys
 
+    seq = frame["jobdicSeq"]
+    present = ~missing_text_mask(seq)
+    numeric = pd.to_numeric(seq, errors="coerce")
+    numeric_ok = present & numeric.notna() & np.isfinite(numeric.astype("float64"))
 
-def build_search_blob(row: pd.Series) -> str:
-    chunks = []
-    for col in SEARCH_COLUMNS:
-        if col in row.index:
-            chunks.append(str(row.get(col, "")))
-    chunks.extend(row.get("major_list", []))
-    chunks.extend(row.get("display_keywords_list", []))
-    chunks.extend(row.get("topic_tags_list", []))
-    return " ".join(chunks).lower()
+    keys = job_keys.copy()
+    if numeric_ok.any():
+        keys.loc[numeric_ok] = "id::" + numeric[numeric_ok].astype("float64").astype("int64").astype(str)
+    text_ok = present & ~numeric_ok
+    if text_ok.any():
+        keys.loc[text_ok] = [f"id::{clean_sentence(str(value))}" for value in seq[text_ok].tolist()]
+    return keys
 
 
 # -----------------------------
 # Data loading and preparation
 # -----------------------------
-@st.cache_data(show_spinner=False)
-def load_data(path: Path) -> pd.DataFrame:
-    if not path.exists():
-        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+def dataset_source_hash(path: Path) -> str:
+    sources = [
+        path,
+        EMBED_META_FILE,
+        EMBED_META_PARQUET_FILE,
+        EMBED_ARRAY_FILE,
+        EMBED_CONFIG_FILE,
+    ]
+    return compute_source_hash(sources, extra=f"prepare={DATASET_PREPARE_VERSION}")
 
-    if path.suffix.lower() in {".xlsx", ".xlsm", ".xls"}:
-        df = pd.read_excel(path)
-    else:
-        df = pd.read_csv(path)
 
-    df = df.copy()
+def prepare_dataset(path: Path, artifact_version: str = "") -> pd.DataFrame:
+    df = read_table(path)
+
     df.columns = [str(col).strip() for col in df.columns]
 
-    for col in df.columns:
-        if df[col].dtype == object:
-            df[col] = df[col].map(lambda x: normalize_whitespace(x) if not is_missing_like(x) else "")
+    text_columns = df.select_dtypes(include=["object", "string"]).columns
+    for col in text_columns:
+        df[col] = normalize_whitespace_column(df[col])
 
     if "job" not in df.columns:
         raise ValueError("career_jobs.xlsx에 'job' 컬럼이 없습니다.")
@@ -683,8 +960,10 @@ def load_data(path: Path) -> pd.DataFrame:
 
     df["job"] = df["job"].astype(str).str.strip()
     df = df[df["job"] != ""].reset_index(drop=True)
+    df["job_id"] = build_embedding_keys(df)
 
-    salary_values = df.get("salery", pd.Series([""] * len(df))).map(extract_salary_amount)
+    salary_source = df["salery"] if "salery" in df.columns else pd.Series("", index=df.index)
+    salary_values = extract_salary_amounts(salary_source)
     valid_salary = salary_values.dropna()
 
     if valid_salary.empty:
@@ -694,24 +973,31 @@ def load_data(path: Path) -> pd.DataFrame:
         low_cut = float(valid_salary.quantile(0.33))
         high_cut = float(valid_salary.quantile(0.66))
 
+    major_columns = resolve_prefixed_columns(df.columns, "major_")
+    contact_columns = resolve_prefixed_columns(df.columns, "contact_")
+
+    major_lists = collect_prefixed_lists(df, major_columns)
+    similar_source = df["similarJob"] if "similarJob" in df.columns else pd.Series("", index=df.index)
+    certification_source = df["certification"] if "certification" in df.columns else pd.Series("", index=df.index)
+
     df["salary_amount"] = salary_values
-    df["salary_bucket"] = df["salary_amount"].map(lambda x: classify_salary_bucket(x, low_cut, high_cut))
-    df["employment_status"] = df.apply(classify_employment_status, axis=1)
-    df["major_list"] = df.apply(get_major_list, axis=1)
-    df["similar_job_list"] = df.apply(get_similar_jobs, axis=1)
-    df["certification_list"] = df.apply(get_certifications, axis=1)
-    df["contact_list_all"] = df.apply(get_contacts, axis=1)
-    df["search_blob"] = df.apply(build_search_blob, axis=1)
-
-    assets = load_embedding_assets()
+    for name, values in resolve_pcnt_stat_columns(df).items():
+        df[name] = values
+    df["salary_bucket"] = classify_salary_buckets(salary_values, low_cut, high_cut)
+    df["employment_status"] = classify_employment_statuses(df)
+    df["major_list"] = major_lists
+    df["similar_job_list"] = [list(items) for items in map_unique_values(similar_source, split_job_names)]
+    df["certification_list"] = [
+        list(items) for items in map_unique_values(certification_source, lambda x: unique_keep_order(split_lines(x)))
+    ]
+    df["contact_list_all"] = collect_prefixed_lists(df, contact_columns)
+    df["search_blob"] = build_search_blobs(df, major_lists)
+
+    # load_data는 rerun의 버전 고정 밖(산출물 교체 준비 등)에서도 불리므로 버전을 직접 넘긴다.
+    assets = load_embedding_assets(artifact_version=artifact_version)
     if assets:
-        meta = assets["meta"].copy()
-        meta["embedding_key"] = meta.apply(
-            lambda row: build_embedding_key(row.get("jobdicSeq"), row.get("job", "")),
-            axis=1,
-        )
         meta_cols = [
-            "embedding_key",
+            "job_id",
             "llm_keywords_list",
             "display_keywords_list",
             "topic_tags_list",
@@ -719,31 +1005,83 @@ def load_data(path: Path) -> pd.DataFrame:
             "display_keywords_text",
             "topic_tags_text",
         ]
-        df["embedding_key"] = df.apply(
-            lambda row: build_embedding_key(row.get("jobdicSeq"), row.get("job", "")),
-            axis=1,
-        )
-        df = df.merge(meta[meta_cols], on="embedding_key", how="left")
-        df.drop(columns=["embedding_key"], inplace=True)
+        meta = assets["meta"].assign(job_id=assets["keys"])[meta_cols]
+        df = df.merge(meta, on="job_id", how="left")
 
-    if "llm_keywords_list" not in df.columns:
-        df["llm_keywords_list"] = [[] for _ in range(len(df))]
-    else:
-        df["llm_keywords_list"] = df["llm_keywords_list"].map(parse_embedded_list)
+    for col in ["llm_keywords_list", "display_keywords_list", "topic_tags_list"]:
+        if col not in df.columns:
+            df[col] = [[] for _ in range(len(df))]
+        else:
+            df[col] = [value if isinstance(value, list) else [] for value in df[col].tolist()]
 
-    if "display_keywords_list" not in df.columns:
-        df["display_keywords_list"] = [[] for _ in range(len(df))]
-    else:
-        df["display_keywords_list"] = df["display_keywords_list"].map(parse_embedded_list)
+    df.attrs["salary_quantiles"] = {"low": low_cut, "high": high_cut}
+    return df
 
-    if "topic_tags_list" not in df.columns:
-        df["topic_tags_list"] = [[] for _ in range(len(df))]
-    else:
-        df["topic_tags_list"] = df["topic_tags_list"].map(parse_embedded_list)
 
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_data(path: Path, artifact_version: str = "") -> pd.DataFrame:
+    # 교체 직후에도 진행 중인 세션이 쓰도록 이전 버전 하나를 남긴다.
+    # 모든 세션이 같은 프레임을 공유한다(rerun마다 역직렬화 복사를 만들지 않는다). 검색 결과는 이 프레임의
+    # 행 위치로만 다루고, 프레임과 attrs는 읽기 전용으로 다룬다.
+    if not path.exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+    # 원본 해시가 같은 전처리 스냅샷이 있으면 Excel 파싱 없이 그대로 사용한다.
+    source_hash = dataset_source_hash(path)
+    snapshot_path = snapshot_path_for(path)
+    df = read_snapshot(snapshot_path, source_hash)
+    if df is not None:
+        return df
+
+    df = prepare_dataset(path, artifact_version)
+    df.attrs["data_version"] = source_hash[:12]
+    try:
+        write_snapshot(df, snapshot_path, source_hash)
+    except Exception:
+        # 읽기 전용 배포 환경에서는 스냅샷 없이 동작한다.
+        pass
     return df
 
 
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_suggestion_index(path: Path, artifact_version: str) -> dict:
+    # artifact_version은 캐시 키 역할만 한다. 데이터가 바뀌면 색인도 새로 만든다.
+    return build_suggestion_index(load_data(path, artifact_version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_job_lookup(path: Path, artifact_version: str) -> dict:
+    return build_job_lookup(load_data(path, artifact_version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_typo_index(path: Path, artifact_version: str) -> dict:
+    return build_typo_index(load_data(path, artifact_version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_chosung_index(path: Path, artifact_version: str) -> dict:
+    return build_chosung_index(load_data(path, artifact_version))
+
+
+def build_artifact_version(artifact_version: str) -> None:
+    """새 산출물 버전의 데이터/색인 캐시를 채운다. 활성 버전으로 교체되기 직전에 호출된다."""
+    df = load_data(DATA_FILE, artifact_version)
+    job_lookup = load_job_lookup(DATA_FILE, artifact_version)
+    load_suggestion_index(DATA_FILE, artifact_version)
+    load_typo_index(DATA_FILE, artifact_version)
+    load_chosung_index(DATA_FILE, artifact_version)
+    warm_detail_fragments(df, str(df.attrs.get("data_version", "")), job_lookup)
+
+
+@st.cache_resource(show_spinner=False)
+def get_artifact_store() -> dict:
+    return create_artifact_store(
+        lambda: list_watched_files(DATA_FILE, EMBEDDING_DIR),
+        build_artifact_version,
+    )
+
+
 # -----------------------------
 # Search / filter logic
 # -----------------------------
@@ -764,6 +1102,7 @@ def extract_display_keywords(query: str) -> list[str]:
     return keywords
 
 
+@traced()
 def extract_search_terms(query: str) -> list[str]:
     base_tokens = extract_display_keywords(query)
     tokens: list[str] = []
@@ -862,55 +1201,132 @@ def compute_search_score(row: pd.Series, query: str, tokens: list[str]) -> float
     return score
 
 
-def search_jobs(df: pd.DataFrame, query: str) -> pd.DataFrame:
-    if not query.strip():
-        return df.iloc[0:0].copy()
+# 검색 결과는 공유 데이터프레임의 행 위치와 점수 배열로만 들고 다니고,
+# 화면에 보일 행만 materialize_results로 꺼낸다. (세션마다 df 복사본을 만들지 않는다.)
+SEARCH_RESULT_SCORE_KEYS = ["search_score", "semantic_score", "semantic_boost", "combined_search_score"]
+# 오타 교정으로만 찾은 직업명 일치(거리 0, 가중치 1)의 키워드 점수. 직업명 부분 일치(12점)보다 낮게 둔다.
+TYPO_MATCH_SCORE = 9.0
+# 초성 검색어("ㅅㅍㅌㅇ")가 직업명 앞부분과 맞을 때의 키워드 점수. 키워드·태그 일치는 가중치만큼 낮아진다.
+CHOSUNG_MATCH_SCORE = 10.0
 
-    tokens = extract_search_terms(query)
-    results = df.copy()
-    results["search_score"] = results.apply(lambda row: compute_search_score(row, query, tokens), axis=1)
 
-    semantic_scores = compute_semantic_scores(results, query)
-    results["semantic_score"] = semantic_scores
-    results["semantic_boost"] = results["semantic_score"].map(
-        lambda x: max(0.0, float(x) - SEMANTIC_THRESHOLD) * 35.0
-    )
-    results["combined_search_score"] = results["search_score"] + results["semantic_boost"]
+def empty_search_results() -> dict:
+    results = {"positions": np.empty(0, dtype=np.int64)}
+    for key in SEARCH_RESULT_SCORE_KEYS:
+        results[key] = np.empty(0, dtype=np.float64)
+    return results
 
-    results = results[
-        (results["search_score"] > 0) |
-        (results["semantic_score"] >= SEMANTIC_THRESHOLD)
-    ]
 
-    return results.sort_values(
-        ["combined_search_score", "search_score", "semantic_score", "job"],
-        ascending=[False, False, False, True],
-    ).reset_index(drop=True)
+def take_search_results(results: dict, selector) -> dict:
+    return {key: values[selector] for key, values in results.items()}
+
+
+def compute_typo_scores(df: pd.DataFrame, query: str, typo_index: dict) -> np.ndarray:
+    """오타 색인이 찾은 후보 행에 더할 점수. 검색어 전체와 각 키워드를 따로 교정해 본다."""
+    scores = np.zeros(len(df), dtype=np.float64)
+    terms = [query] + [token for token in extract_display_keywords(query) if token != query.strip().lower()]
+    for pos, weight in typo_candidate_positions(typo_index, terms).items():
+        if pos < len(df):
+            scores[pos] = TYPO_MATCH_SCORE * weight
+    return scores
+
+
+def compute_chosung_scores(df: pd.DataFrame, query: str, chosung_index: dict) -> np.ndarray:
+    scores = np.zeros(len(df), dtype=np.float64)
+    for pos, weight in chosung_candidate_positions(chosung_index, query).items():
+        if pos < len(df):
+            scores[pos] = CHOSUNG_MATCH_SCORE * weight
+    return scores
+
+
+@traced()
+def search_jobs(
+    df: pd.DataFrame,
+    query: str,
+    typo_index: dict | None = None,
+    chosung_index: dict | None = None,
+) -> dict:
+    """검색어와 맞는 행의 위치와 점수를 정렬된 배열로 돌려준다."""
+    if not query.strip():
+        return empty_search_results()
+
+    tokens = extract_search_terms(query)
+    with span("compute_search_score", rows=len(df)):
+        search_scores = np.fromiter(
+            (compute_search_score(row, query, tokens) for _, row in df.iterrows()),
+            dtype=np.float64,
+            count=len(df),
+        )
+    if typo_index:
+        with span("typo_candidates"):
+            search_scores += compute_typo_scores(df, query, typo_index)
+    if chosung_index:
+        with span("chosung_candidates"):
+            search_scores += compute_chosung_scores(df, query, chosung_index)
+    semantic_scores = compute_semantic_scores(df, query).astype(np.float64)
+    semantic_boost = np.maximum(0.0, semantic_scores - SEMANTIC_THRESHOLD) * 35.0
+    combined_scores = search_scores + semantic_boost
+
+    positions = np.flatnonzero((search_scores > 0) | (semantic_scores >= SEMANTIC_THRESHOLD))
+    names = df["job"].to_numpy()[positions]
+    name_rank = np.empty(len(positions), dtype=np.int64)
+    name_rank[np.argsort(names, kind="stable")] = np.arange(len(positions))
+
+    # 정렬 우선순위: 종합 점수 → 키워드 점수 → 의미 점수 (내림차순), 직업명 (오름차순)
+    order = np.lexsort((
+        name_rank,
+        -semantic_scores[positions],
+        -search_scores[positions],
+        -combined_scores[positions],
+    ))
+    positions = positions[order]
+    return {
+        "positions": positions,
+        "search_score": search_scores[positions],
+        "semantic_score": semantic_scores[positions],
+        "semantic_boost": semantic_boost[positions],
+        "combined_search_score": combined_scores[positions],
+    }
 
 
+@traced()
 def filter_results(
     df: pd.DataFrame,
+    results: dict,
     selected_majors: list[str],
     salary_filters: list[str],
     employment_filters: list[str],
-) -> pd.DataFrame:
-    filtered = df.copy()
+) -> dict:
+    positions = results["positions"]
+    mask = np.ones(len(positions), dtype=bool)
 
     if selected_majors:
         selected_set = {item.lower() for item in selected_majors}
-        filtered = filtered[
-            filtered["major_list"].map(
-                lambda majors: bool({m.lower() for m in majors} & selected_set)
-            )
-        ]
+        major_lists = df["major_list"].to_numpy()[positions]
+        mask &= np.fromiter(
+            (bool({m.lower() for m in majors} & selected_set) for majors in major_lists),
+            dtype=bool,
+            count=len(positions),
+        )
 
     if salary_filters:
-        filtered = filtered[filtered["salary_bucket"].isin(salary_filters)]
+        mask &= np.isin(df["salary_bucket"].to_numpy()[positions], salary_filters)
 
     if employment_filters:
-        filtered = filtered[filtered["employment_status"].isin(employment_filters)]
+        mask &= np.isin(df["employment_status"].to_numpy()[positions], employment_filters)
+
+    if mask.all():
+        return results
+    return take_search_results(results, mask)
 
-    return filtered.reset_index(drop=True)
+
+def materialize_results(df: pd.DataFrame, results: dict, start: int = 0, end: int | None = None) -> pd.DataFrame:
+    """결과 중 [start:end] 구간의 행만 데이터프레임으로 꺼내고 점수 컬럼을 붙인다."""
+    window = take_search_results(results, slice(start, end))
+    page_df = df.iloc[window["positions"]].reset_index(drop=True)
+    for key in SEARCH_RESULT_SCORE_KEYS:
+        page_df[key] = window[key]
+    return page_df
 
 
 # -----------------------------
@@ -961,18 +1377,8 @@ def build_salary_gauge(salary_amount) -> str | None:
 
 
 def build_gender_chart(detail: pd.Series) -> str | None:
-    male = combine_pcnt_columns(
-        detail,
-        ["PCNT1_남자", "PNT1_남자", "PCNT1 남자", "PNT1 남자", "PCNT1_남성", "PNT1_남성"],
-        ["PCNT2_남자", "PNT2_남자", "PCNT2 남자", "PNT2 남자", "PCNT2_남성", "PNT2_남성"],
-        aliases=["남자", "남성", "male"],
-    )
-    female = combine_pcnt_columns(
-        detail,
-        ["PCNT1_여자", "PNT1_여자", "PCNT1 여자", "PNT1 여자", "PCNT1_여성", "PNT1_여성"],
-        ["PCNT2_여자", "PNT2_여자", "PCNT2 여자", "PNT2 여자", "PCNT2_여성", "PNT2_여성"],
-        aliases=["여자", "여성", "female"],
-    )
+    male = get_pcnt_stat(detail, "pcnt_male")
+    female = get_pcnt_stat(detail, "pcnt_female")
 
     total = male + female
     if total <= 0:
@@ -1009,18 +1415,8 @@ def build_gender_chart(detail: pd.Series) -> str | None:
 
 
 def build_age_chart(detail: pd.Series) -> str | None:
-    teen = combine_pcnt_columns(
-        detail,
-        ["PCNT1_중학생", "PNT1_중학생", "PCNT1 중학생", "PNT1 중학생", "PCNT1_중등", "PNT1_중등"],
-        ["PCNT2_중학생", "PNT2_중학생", "PCNT2 중학생", "PNT2 중학생", "PCNT2_중등", "PNT2_중등"],
-        aliases=["중학생", "중등", "middle"],
-    )
-    high = combine_pcnt_columns(
-        detail,
-        ["PCNT1_고등학생", "PNT1_고등학생", "PCNT1 고등학생", "PNT1 고등학생", "PCNT1_고등", "PNT1_고등"],
-        ["PCNT2_고등학생", "PNT2_고등학생", "PCNT2 고등학생", "PNT2 고등학생", "PCNT2_고등", "PNT2_고등"],
-        aliases=["고등학생", "고등", "high"],
-    )
+    teen = get_pcnt_stat(detail, "pcnt_middle")
+    high = get_pcnt_stat(detail, "pcnt_high")
 
     total = teen + high
     if total <= 0:
@@ -1054,8 +1450,8 @@ def build_age_chart(detail: pd.Series) -> str | None:
 # -----------------------------
 # CSS
 # -----------------------------
-def inject_css() -> None:
-    render_html(
+def build_app_css() -> str:
+    return textwrap.dedent(
         """
         <style>
         :root{
@@ -2156,7 +2552,17 @@ def inject_css() -> None:
         }
         </style>
         """
-    )
+    ).strip()
+
+
+@st.cache_resource(show_spinner=False)
+def get_app_css() -> str:
+    # 스크립트는 rerun마다 다시 실행되므로 큰 CSS 문자열을 한 번만 만들어 공유한다.
+    return build_app_css()
+
+
+def inject_css() -> None:
+    render_html(get_app_css())
 
 
 # -----------------------------
@@ -2205,7 +2611,7 @@ def render_search_panel(total_count: int, filtered_count: int, query: str) -> No
     )
 
 
-def render_ai_search_brief(query: str, searched: pd.DataFrame, filtered: pd.DataFrame) -> None:
+def render_ai_search_brief(query: str, top_results: pd.DataFrame, result_count: int) -> None:
     if not query.strip():
         render_html(
             """
@@ -2224,18 +2630,18 @@ def render_ai_search_brief(query: str, searched: pd.DataFrame, filtered: pd.Data
         )
         return
 
-    display_keywords = derive_brief_keywords(query, filtered, limit=8)
+    display_keywords = derive_brief_keywords(query, top_results, limit=8)
     token_html = "".join([f'<span class="meta-chip">{html.escape(token)}</span>' for token in display_keywords])
 
-    related_tags = extract_related_topics(filtered, limit=8)
+    related_tags = extract_related_topics(top_results, limit=8)
     related_html = "".join([f'<span class="meta-chip">{html.escape(tag)}</span>' for tag in related_tags])
 
-    if filtered.empty:
+    if top_results.empty:
         result_text = "조건에 맞는 결과를 찾지 못했습니다."
         result_sub = "검색어를 더 넓게 입력하거나 필터를 줄여 보세요."
     else:
-        top_job = str(filtered.iloc[0].get("job", ""))
-        result_text = f"{len(filtered):,}개 직업을 선별했습니다"
+        top_job = str(top_results.iloc[0].get("job", ""))
+        result_text = f"{result_count:,}개 직업을 선별했습니다"
         result_sub = f"현재 탐색어와 가장 가깝게 읽히는 직업은 {top_job}입니다." if top_job else "검색 결과를 정렬했습니다."
 
     render_html(
@@ -2642,75 +3048,117 @@ def render_result_card(row: pd.Series, delay_ms: int = 0) -> None:
     )
 
 
+# -----------------------------
+# Detail sections
+# -----------------------------
+# 섹션 키 → (kicker, 제목, 설명). Streamlit 화면과 정적 내보내기가 같은 머리글을 쓴다.
+DETAIL_SECTION_HEADERS = {
+    "profile": ("Job Profile", "직무 프로필", "직업의 핵심 역할과 특징을 문장 단위로 정리했습니다."),
+    "roadmap": ("How To Be", "로드맵", "진입부터 실무 적응, 이후 확장까지의 흐름을 단계형으로 정리했습니다."),
+    "capability": ("Competency & Qualification", "역량 및 자격", "사전 생성된 AI 키워드와 직무 원문을 함께 사용해 핵심 적성과 준비 정보를 정리했습니다."),
+    "market": ("Market Insight", "시장 지표", "임금과 전망 정보를 한눈에 읽을 수 있도록 요약했습니다."),
+    "chart": ("PCNT Analytics", "데이터 인사이트", "관심도 분포를 성별과 연령대 기준으로 시각화했습니다."),
+}
 
-def render_profile_section(detail: pd.Series) -> None:
-    summary_lines = split_lines(detail.get("summary", ""))
-    if not summary_lines:
-        summary_lines = [clean_sentence(detail.get("summary", ""))]
-    summary_html = "<ul class='bullet-list'>" + "".join([
-        f"<li>{html.escape(line)}</li>" for line in summary_lines if line
-    ]) + "</ul>"
 
-    render_html(
-        """
+def build_section_header(section: str) -> str:
+    kicker, title, sub = DETAIL_SECTION_HEADERS[section]
+    return f"""
         <div class="panel">
             <div class="panel-head">
                 <div>
-                    <div class="section-kicker">Job Profile</div>
-                    <div class="section-title">직무 프로필</div>
-                    <div class="section-sub">직업의 핵심 역할과 특징을 문장 단위로 정리했습니다.</div>
+                    <div class="section-kicker">{html.escape(kicker)}</div>
+                    <div class="section-title">{html.escape(title)}</div>
+                    <div class="section-sub">{html.escape(sub)}</div>
                 </div>
             </div>
         </div>
         """
-    )
 
-    col1, col2 = st.columns([1.2, 0.8], gap="large")
-    with col1:
-        render_html(
-            f"""
-            <div class="profile-box">
-                <div class="section-title" style="font-size:26px; margin-bottom:12px;">{html.escape(str(detail.get('job', '')))}</div>
-                <div class="profile-summary">{summary_html}</div>
+
+def build_card_heading(title: str) -> str:
+    return f"""
+            <div class="soft-card">
+                <div class="section-title" style="font-size:18px; margin-bottom:10px;">{html.escape(title)}</div>
             </div>
             """
+
+
+def build_profile_fragments(detail: pd.Series) -> dict:
+    summary_lines = split_lines(detail.get("summary", ""))
+    if not summary_lines:
+        summary_lines = [clean_sentence(detail.get("summary", ""))]
+    summary_html = "<ul class='bullet-list'>" + "".join([
+        f"<li>{html.escape(line)}</li>" for line in summary_lines if line
+    ]) + "</ul>"
+
+    similar_jobs = detail.get("similar_job_list", [])[:8]
+    if similar_jobs:
+        cards = "".join(
+            [
+                f'<div class="similar-job-item"><span class="similar-job-bullet"></span><span>{html.escape(item)}</span></div>'
+                for item in similar_jobs
+            ]
         )
+        similar_body = f'<div class="similar-job-grid">{cards}</div>'
+    else:
+        similar_body = '<div class="empty-text">등록된 유사 직업 정보가 없습니다.</div>'
 
-    with col2:
-        similar_jobs = detail.get("similar_job_list", [])[:8]
-        if similar_jobs:
-            cards = "".join(
-                [
-                    f'<div class="similar-job-item"><span class="similar-job-bullet"></span><span>{html.escape(item)}</span></div>'
-                    for item in similar_jobs
-                ]
-            )
-            similar_body = f'<div class="similar-job-grid">{cards}</div>'
-        else:
-            similar_body = '<div class="empty-text">등록된 유사 직업 정보가 없습니다.</div>'
+    majors = detail.get("major_list", [])[:8]
+    major_html = "".join([f'<span class="pill">{html.escape(item)}</span>' for item in majors]) if majors else '<div class="empty-text">등록된 관련 전공 정보가 없습니다.</div>'
 
-        render_html(
-            f"""
+    return {
+        "profile_html": f"""
+            <div class="profile-box">
+                <div class="section-title" style="font-size:26px; margin-bottom:12px;">{html.escape(str(detail.get('job', '')))}</div>
+                <div class="profile-summary">{summary_html}</div>
+            </div>
+            """,
+        "similar_html": f"""
             <div class="soft-card">
                 <div class="section-title" style="font-size:18px; margin-bottom:10px;">유사 직업</div>
                 {similar_body}
             </div>
-            """
-        )
-
-        st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
-
-        majors = detail.get("major_list", [])[:8]
-        major_html = "".join([f'<span class="pill">{html.escape(item)}</span>' for item in majors]) if majors else '<div class="empty-text">등록된 관련 전공 정보가 없습니다.</div>'
-
-        render_html(
-            f"""
+            """,
+        "major_html": f"""
             <div class="soft-card">
                 <div class="section-title" style="font-size:18px; margin-bottom:10px;">관련 전공</div>
                 <div class="pill-wrap">{major_html}</div>
             </div>
-            """
-        )
+            """,
+        "semantic_neighbors": get_semantic_neighbors(detail, limit=6),
+    }
+
+
+def render_profile_section(fragments: dict) -> None:
+    render_html(build_section_header("profile"))
+
+    col1, col2 = st.columns([1.2, 0.8], gap="large")
+    with col1:
+        render_html(fragments["profile_html"])
+
+    with col2:
+        render_html(fragments["similar_html"])
+
+        semantic_neighbors = fragments["semantic_neighbors"]
+        if semantic_neighbors:
+            st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+            render_html(
+                """
+                <div class="soft-card">
+                    <div class="section-title" style="font-size:18px; margin-bottom:4px;">의미가 비슷한 직업</div>
+                    <div class="section-sub">직무 설명 임베딩이 가까운 직업입니다. 눌러서 바로 이동할 수 있습니다.</div>
+                </div>
+                """
+            )
+            neighbor_cols = st.columns(2, gap="small")
+            for idx, (job_id, name, score) in enumerate(semantic_neighbors):
+                with neighbor_cols[idx % 2]:
+                    if st.button(f"{name} · {score * 100:.0f}%", key=f"semantic_neighbor_{idx}", use_container_width=True):
+                        open_job_detail(job_id, name)
+
+        st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+        render_html(fragments["major_html"])
 
 
 def get_roadmap_steps(detail: pd.Series) -> list[dict[str, str]]:
@@ -2734,34 +3182,28 @@ def get_roadmap_steps(detail: pd.Series) -> list[dict[str, str]]:
     ]
 
 
-def render_roadmap_section(detail: pd.Series) -> None:
-    render_html(
-        """
-        <div class="panel">
-            <div class="panel-head">
-                <div>
-                    <div class="section-kicker">How To Be</div>
-                    <div class="section-title">로드맵</div>
-                    <div class="section-sub">진입부터 실무 적응, 이후 확장까지의 흐름을 단계형으로 정리했습니다.</div>
-                </div>
-            </div>
-        </div>
-        """
-    )
-
-    steps = get_roadmap_steps(detail)
-    cols = st.columns(4, gap="medium")
-    for col, step in zip(cols, steps):
-        with col:
-            render_html(
-                f"""
+def build_roadmap_fragments(detail: pd.Series) -> dict:
+    return {
+        "timeline_cards": [
+            f"""
                 <div class="timeline-card">
                     <div class="timeline-no">{html.escape(step['no'])}</div>
                     <div class="timeline-title">{html.escape(step['title'])}</div>
                     <div class="timeline-text">{html.escape(clean_sentence(step['text']))}</div>
                 </div>
                 """
-            )
+            for step in get_roadmap_steps(detail)
+        ],
+    }
+
+
+def render_roadmap_section(fragments: dict) -> None:
+    render_html(build_section_header("roadmap"))
+
+    cols = st.columns(4, gap="medium")
+    for col, card_html in zip(cols, fragments["timeline_cards"]):
+        with col:
+            render_html(card_html)
 
 
 def trim_phrase_edges(phrase: str) -> str:
@@ -2873,7 +3315,7 @@ def extract_keywords_from_text(text: str, limit: int = 14) -> list[str]:
     return selected
 
 
-def render_capability_section(detail: pd.Series) -> None:
+def build_capability_fragments(detail: pd.Series) -> dict:
     aptitude_keywords = derive_display_keywords_for_row(detail, max_keywords=10)
     if not aptitude_keywords:
         aptitude_keywords = extract_keywords_from_text(str(detail.get("aptitude", "")), limit=12)
@@ -2884,117 +3326,100 @@ def render_capability_section(detail: pd.Series) -> None:
     certs = detail.get("certification_list", [])
     cert_html = "<ul class='bullet-list'>" + "".join([f"<li>{html.escape(item)}</li>" for item in certs]) + "</ul>" if certs else "<div class='empty-text'>등록된 자격 정보가 없습니다.</div>"
 
-    render_html(
-        """
-        <div class="panel">
-            <div class="panel-head">
-                <div>
-                    <div class="section-kicker">Competency & Qualification</div>
-                    <div class="section-title">역량 및 자격</div>
-                    <div class="section-sub">사전 생성된 AI 키워드와 직무 원문을 함께 사용해 핵심 적성과 준비 정보를 정리했습니다.</div>
-                </div>
-            </div>
-        </div>
-        """
-    )
-
-    col1, col2 = st.columns([1, 1], gap="large")
-    with col1:
-        render_html(
-            f"""
-            <div class="soft-card">
-                <div class="section-title" style="font-size:18px; margin-bottom:10px;">핵심 적성 키워드</div>
-                <div class="pill-wrap">{keyword_html if keyword_html else '<div class="empty-text">추출 가능한 키워드가 없습니다.</div>'}</div>
-            </div>
-            """
-        )
-
-        aptitude_lines = split_lines(detail.get("aptitude", ""))
-        if aptitude_lines:
-            render_html(
-                f"""
+    aptitude_lines = split_lines(detail.get("aptitude", ""))
+    aptitude_html = ""
+    if aptitude_lines:
+        aptitude_html = f"""
                 <div class="soft-card" style="margin-top:16px;">
                     <div class="section-title" style="font-size:18px; margin-bottom:10px;">적성 상세</div>
                     <ul class="bullet-list">{''.join([f'<li>{html.escape(line)}</li>' for line in aptitude_lines])}</ul>
                 </div>
                 """
-            )
 
-    with col2:
-        render_html(
-            f"""
+    contacts = detail.get("contact_list_all", [])
+    contact_html = "<ul class='bullet-list'>" + "".join([f"<li>{html.escape(item)}</li>" for item in contacts]) + "</ul>" if contacts else "<div class='empty-text'>추가 링크/연락처 정보가 없습니다.</div>"
+
+    return {
+        "keyword_html": f"""
+            <div class="soft-card">
+                <div class="section-title" style="font-size:18px; margin-bottom:10px;">핵심 적성 키워드</div>
+                <div class="pill-wrap">{keyword_html if keyword_html else '<div class="empty-text">추출 가능한 키워드가 없습니다.</div>'}</div>
+            </div>
+            """,
+        "aptitude_html": aptitude_html,
+        "cert_html": f"""
             <div class="soft-card">
                 <div class="section-title" style="font-size:18px; margin-bottom:10px;">관련 자격</div>
                 {cert_html}
             </div>
-            """
-        )
-
-        contacts = detail.get("contact_list_all", [])
-        contact_html = "<ul class='bullet-list'>" + "".join([f"<li>{html.escape(item)}</li>" for item in contacts]) + "</ul>" if contacts else "<div class='empty-text'>추가 링크/연락처 정보가 없습니다.</div>"
-
-        render_html(
-            f"""
+            """,
+        "contact_html": f"""
             <div class="soft-card" style="margin-top:16px;">
                 <div class="section-title" style="font-size:18px; margin-bottom:10px;">추가 정보</div>
                 {contact_html}
             </div>
-            """
-        )
+            """,
+    }
+
+
+def render_capability_section(fragments: dict) -> None:
+    render_html(build_section_header("capability"))
+
+    col1, col2 = st.columns([1, 1], gap="large")
+    with col1:
+        render_html(fragments["keyword_html"])
+        if fragments["aptitude_html"]:
+            render_html(fragments["aptitude_html"])
+
+    with col2:
+        render_html(fragments["cert_html"])
+        render_html(fragments["contact_html"])
 
 
-def render_outlook_text_panel(title: str, raw_text, empty_message: str) -> None:
+def build_outlook_fragment(raw_text, empty_message: str) -> dict:
     summary_points = summarize_long_text(raw_text, max_points=4, max_chars=118)
     full_html = format_sentences_as_paragraphs(raw_text)
 
     if not summary_points and not full_html:
-        render_html(f"<div class='outlook-card'><div class='empty-text'>{html.escape(empty_message)}</div></div>")
-        return
+        return {
+            "card_html": f"<div class='outlook-card'><div class='empty-text'>{html.escape(empty_message)}</div></div>",
+            "full_html": None,
+        }
 
     summary_html = "".join([f"<li>{html.escape(point)}</li>" for point in summary_points]) if summary_points else "<li>요약 가능한 핵심 문장이 충분하지 않습니다.</li>"
 
-    render_html(
-        f"""
+    return {
+        "card_html": f"""
         <div class="outlook-card">
             <div class="outlook-summary">
                 <div class="outlook-summary-title">한눈에 보기</div>
                 <ul class="insight-list">{summary_html}</ul>
             </div>
         </div>
-        """
-    )
+        """,
+        "full_html": f"<div class='outlook-body'>{full_html}</div>" if full_html else "",
+    }
+
+
+def render_outlook_text_panel(title: str, fragment: dict, empty_message: str) -> None:
+    render_html(fragment["card_html"])
+    if fragment["full_html"] is None:
+        return
 
     with st.expander(f"{title} 세부 설명 보기", expanded=False):
-        if full_html:
-            render_html(f"<div class='outlook-body'>{full_html}</div>")
+        if fragment["full_html"]:
+            render_html(fragment["full_html"])
         else:
             st.info(empty_message)
 
 
-def render_market_section(detail: pd.Series) -> None:
-    salary_amount = extract_salary_amount(detail.get("salery", ""))
+def build_market_fragments(detail: pd.Series) -> dict:
+    salary_amount = safe_float(detail["salary_amount"]) if "salary_amount" in detail.index else extract_salary_amount(detail.get("salery", ""))
     salary_bucket = detail.get("salary_bucket", "정보 없음")
     employment_status = detail.get("employment_status", "보통")
 
-    render_html(
-        """
-        <div class="panel">
-            <div class="panel-head">
-                <div>
-                    <div class="section-kicker">Market Insight</div>
-                    <div class="section-title">시장 지표</div>
-                    <div class="section-sub">임금과 전망 정보를 한눈에 읽을 수 있도록 요약했습니다.</div>
-                </div>
-            </div>
-        </div>
-        """
-    )
-
-    col1, col2 = st.columns([0.9, 1.1], gap="large")
-
-    with col1:
-        render_html(
-            f"""
+    return {
+        "summary_html": f"""
             <div class="soft-card">
                 <div class="section-title" style="font-size:18px; margin-bottom:12px;">핵심 지표 요약</div>
                 <div class="metric-row" style="grid-template-columns:1fr; gap:12px;">
@@ -3012,12 +3437,23 @@ def render_market_section(detail: pd.Series) -> None:
                     </div>
                 </div>
             </div>
-            """
-        )
+            """,
+        "salary_gauge_html": build_salary_gauge(salary_amount),
+        "employment_outlook": build_outlook_fragment(detail.get("employment", ""), "고용전망 설명이 없습니다."),
+        "possibility_outlook": build_outlook_fragment(detail.get("job_possibility", ""), "발전가능성 설명이 없습니다."),
+    }
+
 
-        salary_chart_html = build_salary_gauge(salary_amount)
-        if salary_chart_html is not None:
-            render_html(salary_chart_html)
+def render_market_section(fragments: dict) -> None:
+    render_html(build_section_header("market"))
+
+    col1, col2 = st.columns([0.9, 1.1], gap="large")
+
+    with col1:
+        render_html(fragments["summary_html"])
+
+        if fragments["salary_gauge_html"] is not None:
+            render_html(fragments["salary_gauge_html"])
         else:
             st.info("임금 그래프를 표시할 수 있는 데이터가 없습니다.")
 
@@ -3027,91 +3463,293 @@ def render_market_section(detail: pd.Series) -> None:
         with tab1:
             render_outlook_text_panel(
                 title="고용전망",
-                raw_text=detail.get("employment", ""),
+                fragment=fragments["employment_outlook"],
                 empty_message="고용전망 설명이 없습니다.",
             )
 
         with tab2:
             render_outlook_text_panel(
                 title="발전가능성",
-                raw_text=detail.get("job_possibility", ""),
+                fragment=fragments["possibility_outlook"],
                 empty_message="발전가능성 설명이 없습니다.",
             )
 
 
-def render_chart_section(detail: pd.Series) -> None:
-    render_html(
-        """
-        <div class="panel">
-            <div class="panel-head">
-                <div>
-                    <div class="section-kicker">PCNT Analytics</div>
-                    <div class="section-title">데이터 인사이트</div>
-                    <div class="section-sub">관심도 분포를 성별과 연령대 기준으로 시각화했습니다.</div>
-                </div>
-            </div>
-        </div>
-        """
-    )
+def build_chart_fragments(detail: pd.Series) -> dict:
+    return {
+        "gender_chart_html": build_gender_chart(detail),
+        "age_chart_html": build_age_chart(detail),
+    }
+
 
-    gender_chart_html = build_gender_chart(detail)
-    age_chart_html = build_age_chart(detail)
+def render_chart_section(fragments: dict) -> None:
+    render_html(build_section_header("chart"))
 
     col1, col2 = st.columns(2, gap="large")
 
     with col1:
-        render_html(
-            """
-            <div class="soft-card">
-                <div class="section-title" style="font-size:18px; margin-bottom:10px;">성별 관심도 비중</div>
-            </div>
-            """
-        )
+        render_html(build_card_heading("성별 관심도 비중"))
 
-        if gender_chart_html is not None:
-            render_html(gender_chart_html)
+        if fragments["gender_chart_html"] is not None:
+            render_html(fragments["gender_chart_html"])
         else:
             st.info("성별 PCNT 데이터가 없습니다.")
 
     with col2:
-        render_html(
-            """
-            <div class="soft-card">
-                <div class="section-title" style="font-size:18px; margin-bottom:10px;">연령대별 선호도</div>
-            </div>
-            """
-        )
+        render_html(build_card_heading("연령대별 선호도"))
 
-        if age_chart_html is not None:
-            render_html(age_chart_html)
+        if fragments["age_chart_html"] is not None:
+            render_html(fragments["age_chart_html"])
         else:
             st.info("연령대 PCNT 데이터가 없습니다.")
 
 
-def render_detail_page(detail: pd.Series) -> None:
-    job_name = str(detail.get("job", ""))
+# -----------------------------
+# Detail fragment cache
+# -----------------------------
+# 섹션 HTML 마크업을 바꾸면 올려서 캐시된 조각을 무효화한다.
+DETAIL_TEMPLATE_VERSION = 1
+DETAIL_FRAGMENT_CACHE_SIZE = 256
+DETAIL_WARMUP_LIMIT = 24
+
+
+def build_detail_fragments(detail: pd.Series) -> dict:
+    """상세 페이지의 텍스트 가공/차트 마크업을 모두 미리 만들어 둔다. Streamlit 호출은 하지 않는다."""
+    return {
+        "profile": build_profile_fragments(detail),
+        "roadmap": build_roadmap_fragments(detail),
+        "capability": build_capability_fragments(detail),
+        "market": build_market_fragments(detail),
+        "chart": build_chart_fragments(detail),
+    }
+
 
-    render_html(
-        f"""
+@st.cache_resource(show_spinner=False)
+def get_detail_fragment_cache() -> dict:
+    # 프로세스 전체에서 공유하는 LRU. 세션마다 같은 직업을 다시 가공하지 않도록 한다.
+    return {"entries": OrderedDict(), "views": Counter(), "lock": threading.Lock()}
+
+
+def detail_job_id(detail: pd.Series) -> str:
+    job_id = detail.get("job_id")
+    if job_id:
+        return str(job_id)
+    return build_embedding_key(detail.get("jobdicSeq"), detail.get("job", ""))
+
+
+def get_detail_fragments(detail: pd.Series, data_version: str, count_view: bool = True) -> dict:
+    cache = get_detail_fragment_cache()
+    job_id = detail_job_id(detail)
+    key = (job_id, data_version, DETAIL_TEMPLATE_VERSION)
+
+    with cache["lock"]:
+        if count_view:
+            cache["views"][job_id] += 1
+        fragments = cache["entries"].get(key)
+        if fragments is not None:
+            cache["entries"].move_to_end(key)
+            return fragments
+
+    with span("build_detail_fragments"):
+        fragments = build_detail_fragments(detail)
+
+    with cache["lock"]:
+        cache["entries"][key] = fragments
+        cache["entries"].move_to_end(key)
+        while len(cache["entries"]) > DETAIL_FRAGMENT_CACHE_SIZE:
+            cache["entries"].popitem(last=False)
+    return fragments
+
+
+def warm_detail_fragments(
+    df: pd.DataFrame,
+    data_version: str,
+    job_lookup: dict,
+    limit: int = DETAIL_WARMUP_LIMIT,
+) -> int:
+    """조회수가 많은 직업 중 현재 데이터 버전으로 캐시되지 않은 것만 미리 만든다.
+
+    행 위치는 job_lookup으로 찾는다. 데이터에서 사라진 직업은 조회수 집계에서 빼서 다음 rerun에 다시 찾지 않는다.
+    """
+    cache = get_detail_fragment_cache()
+    with cache["lock"]:
+        popular = [job_id for job_id, _ in cache["views"].most_common(limit)]
+        missing = [
+            job_id for job_id in popular
+            if (job_id, data_version, DETAIL_TEMPLATE_VERSION) not in cache["entries"]
+        ]
+    if not missing:
+        return 0
+
+    positions = []
+    gone = []
+    for job_id in missing:
+        pos = job_lookup["by_id"].get(job_id)
+        if pos is None:
+            gone.append(job_id)
+        else:
+            positions.append(pos)
+    if gone:
+        with cache["lock"]:
+            for job_id in gone:
+                cache["views"].pop(job_id, None)
+
+    for pos in positions:
+        get_detail_fragments(df.iloc[pos], data_version, count_view=False)
+    return len(positions)
+
+
+def build_detail_hero(job_name: str) -> str:
+    return f"""
         <div class="hero" style="margin-bottom:18px;">
             <div class="hero-kicker">Detail Page</div>
             <div class="hero-title">{html.escape(job_name)}</div>
             <div class="hero-sub">직무 프로필, 로드맵, 역량 및 자격, 시장 지표, PCNT 차트를 한 화면에서 확인할 수 있습니다.</div>
         </div>
         """
-    )
+
+
+@traced()
+def render_detail_page(detail: pd.Series, data_version: str = "") -> None:
+    render_html(build_detail_hero(str(detail.get("job", ""))))
 
     back_col, _ = st.columns([0.18, 0.82])
     with back_col:
         if st.button("← 목록으로", use_container_width=True):
-            st.session_state.page = "main"
-            rerun_app()
+            close_job_detail()
+
+    fragments = get_detail_fragments(detail, data_version)
+    render_profile_section(fragments["profile"])
+    render_roadmap_section(fragments["roadmap"])
+    render_capability_section(fragments["capability"])
+    render_market_section(fragments["market"])
+    render_chart_section(fragments["chart"])
+
+
+# -----------------------------
+# Dev profiler
+# -----------------------------
+def get_dev_mode() -> bool:
+    try:
+        params = st.query_params
+        return str(params.get("dev", "0")) == "1"
+    except Exception:
+        try:
+            params = st.experimental_get_query_params()
+            values = params.get("dev", ["0"])
+            return str(values[0]) == "1"
+        except Exception:
+            return False
+
+
+def build_profiler_waterfall(finished: dict) -> str:
+    total_ms = max(finished["total_ms"], 1e-6)
+    rows = []
+    for item in finished["spans"]:
+        left = clamp_percent(item["start_ms"] / total_ms * 100)
+        width = max(0.4, min(100.0 - left, item["ms"] / total_ms * 100))
+        meta = " ".join(f"{key}={value}" for key, value in item["meta"].items())
+        label = f"{item['name']} {meta}".strip()
+        rows.append(
+            f"""
+            <div style="display:grid; grid-template-columns:260px 1fr 84px; gap:10px; align-items:center; font-size:12px; margin:3px 0;">
+                <div style="padding-left:{item['depth'] * 14}px; color:#334155; white-space:nowrap; overflow:hidden; text-overflow:ellipsis;">{html.escape(label)}</div>
+                <div style="position:relative; height:12px; background:#f1f5f9; border-radius:6px;">
+                    <div style="position:absolute; left:{left:.2f}%; width:{width:.2f}%; height:12px; background:#2563eb; border-radius:6px;"></div>
+                </div>
+                <div style="text-align:right; color:#0f172a; font-weight:700;">{item['ms']:.1f} ms</div>
+            </div>
+            """
+        )
+    return f"""
+    <div class="soft-card">
+        <div class="section-title" style="font-size:16px; margin-bottom:8px;">이번 rerun · {finished['total_ms']:.1f} ms</div>
+        {''.join(rows) if rows else '<div class="empty-text">기록된 구간이 없습니다.</div>'}
+    </div>
+    """
+
+
+def render_profiler_panel(finished: dict) -> None:
+    with st.expander("개발자 프로파일러 (dev=1)", expanded=True):
+        render_html(build_profiler_waterfall(finished))
+
+        status = artifact_status(get_artifact_store())
+        build_ms = status["build_ms"]
+        st.caption(
+            f"산출물 버전 {status['version'] or '-'} · 활성화 {status['activated_at'] or '-'}"
+            + (f" · 빌드 {build_ms:.0f} ms" if build_ms is not None else "")
+            + (f" · 대기 중 {status['pending']}" if status["pending"] else "")
+        )
+        if status["error"]:
+            st.warning(f"최근 산출물 빌드 실패 (이전 버전 유지): {status['error']}")
+
+        summary = aggregate_summary()
+        if summary:
+            st.caption("프로세스 누적 통계 (분위수는 최근 구간 기준)")
+            st.dataframe(pd.DataFrame(summary), use_container_width=True, hide_index=True)
+
+        col1, col2 = st.columns([0.3, 0.7])
+        with col1:
+            st.download_button(
+                "누적 통계 JSON",
+                data=export_aggregates_json(),
+                file_name="search_profile.json",
+                mime="application/json",
+                use_container_width=True,
+            )
+        with col2:
+            if st.button("누적 통계 초기화", key="profiler_reset"):
+                reset_aggregates()
+
+
+# -----------------------------
+# Navigation
+# -----------------------------
+def get_query_param(name: str) -> str | None:
+    try:
+        value = st.query_params.get(name)
+    except Exception:
+        return None
+    return str(value) if value else None
+
+
+def set_job_query_param(job_id: str | None) -> None:
+    try:
+        if job_id:
+            st.query_params[JOB_QUERY_PARAM] = job_id
+        elif JOB_QUERY_PARAM in st.query_params:
+            del st.query_params[JOB_QUERY_PARAM]
+    except Exception:
+        pass
+
+
+def open_job_detail(job_id: str | None, job_name: str) -> None:
+    st.session_state.selected_job_id = job_id
+    st.session_state.selected_job = job_name
+    st.session_state.page = "detail"
+    set_job_query_param(job_id)
+    rerun_app()
+
 
-    render_profile_section(detail)
-    render_roadmap_section(detail)
-    render_capability_section(detail)
-    render_market_section(detail)
-    render_chart_section(detail)
+def close_job_detail() -> None:
+    st.session_state.page = "main"
+    st.session_state.selected_job_id = None
+    set_job_query_param(None)
+    rerun_app()
+
+
+def sync_navigation_from_query_params() -> None:
+    """URL의 ?job=<job_id>를 세션 상태에 반영한다. 딥 링크와 브라우저 뒤로/앞으로 이동을 지원한다."""
+    job_id = get_query_param(JOB_QUERY_PARAM)
+    if job_id:
+        if job_id != st.session_state.selected_job_id:
+            st.session_state.selected_job_id = job_id
+            st.session_state.selected_job = None
+        st.session_state.page = "detail"
+    elif st.session_state.page == "detail" and st.session_state.selected_job_id:
+        # 상세 화면에서 뒤로 가기로 파라미터가 사라지면 목록으로 돌아간다.
+        st.session_state.page = "main"
+        st.session_state.selected_job_id = None
 
 
 # -----------------------------
@@ -3120,14 +3758,63 @@ def render_detail_page(detail: pd.Series) -> None:
 def ensure_session_defaults() -> None:
     st.session_state.setdefault("page", "main")
     st.session_state.setdefault("selected_job", None)
+    st.session_state.setdefault("selected_job_id", None)
     st.session_state.setdefault("search_input", "")
     st.session_state.setdefault("committed_query", "")
     st.session_state.setdefault("trigger_ai_search", False)
     st.session_state.setdefault("page_number", 1)
 
 
-def render_main_page(df: pd.DataFrame) -> None:
-    render_hero(df)
+def apply_search_correction(correction: str) -> None:
+    # 검색창 위젯이 이미 그려진 뒤라 on_click 콜백(다음 rerun 전에 실행)에서 값을 바꾼다.
+    st.session_state.search_input = correction
+    st.session_state.committed_query = correction
+    st.session_state.page_number = 1
+
+
+def render_did_you_mean(correction: str) -> None:
+    col1, col2 = st.columns([0.72, 0.28], gap="small")
+    with col1:
+        render_html(
+            f"""
+            <div class="soft-card" style="padding:12px 16px;">
+                혹시 <b>{html.escape(correction)}</b>을(를) 찾으셨나요?
+            </div>
+            """
+        )
+    with col2:
+        st.button(
+            f"'{correction}'(으)로 검색",
+            key="did_you_mean",
+            on_click=apply_search_correction,
+            args=(correction,),
+            use_container_width=True,
+        )
+
+
+def start_search(query: str | None = None) -> None:
+    # 입력창이 그려진 뒤에는 값을 바꿀 수 없으므로 버튼 on_click 콜백에서 상태를 바꾼다.
+    if query is None:
+        query = str(st.session_state.get("search_input", ""))
+    st.session_state.search_input = query
+    st.session_state.committed_query = query.strip()
+    st.session_state.trigger_ai_search = bool(st.session_state.committed_query)
+    st.session_state.page_number = 1
+
+
+@st.fragment
+def render_search_console(suggestion_index: dict | None = None, chosung_index: dict | None = None) -> None:
+    # 입력창은 폼 밖에서 live로 두어 타이핑이 멈출 때마다 이 fragment만 다시 그린다.
+    # 자동완성은 확정된 검색어가 아니라 입력 중인 글자로 만든다. 검색은 버튼이나 추천어를 눌러야 시작한다.
+    st.text_input(
+        "AI 탐색어 입력",
+        placeholder="예: 데이터 분석을 하면서 사람과도 소통하는 직업",
+        key="search_input",
+        live=True,
+    )
+    # fragment 안의 버튼은 fragment만 다시 그리므로 검색을 시작하면 전체를 다시 실행한다.
+    if st.button("AI 탐색 시작", use_container_width=True, type="primary", on_click=start_search):
+        rerun_app()
 
     suggestion_queries = [
         "컴퓨터와 관련된 일",
@@ -3137,6 +3824,39 @@ def render_main_page(df: pd.DataFrame) -> None:
         "환경 문제를 다루는 일",
         "학생을 가르치는 직업",
     ]
+    suggestion_labels = suggestion_queries
+
+    # 입력어가 있으면 고정 예시 대신 직업명·키워드·전공 접두어 자동완성 결과를 보여준다.
+    typed_query = str(st.session_state.get("search_input", "")).strip()
+    completions = suggest_queries(suggestion_index, typed_query, limit=6) if typed_query else []
+    if not completions and is_chosung_text(typed_query):
+        completions = suggest_chosung_queries(chosung_index, typed_query, limit=6)
+    if completions:
+        suggestion_queries = [item["text"] for item in completions]
+        suggestion_labels = [
+            f"{item['text']} · {SUGGESTION_KIND_LABELS.get(item['kind'], '')}" for item in completions
+        ]
+
+    suggestion_cols = st.columns(3, gap="small")
+    for idx, (suggestion, label) in enumerate(zip(suggestion_queries, suggestion_labels)):
+        with suggestion_cols[idx % 3]:
+            if st.button(
+                label,
+                key=f"suggestion_{idx}",
+                use_container_width=True,
+                on_click=start_search,
+                args=(suggestion,),
+            ):
+                rerun_app()
+
+
+def render_main_page(
+    df: pd.DataFrame,
+    suggestion_index: dict | None = None,
+    typo_index: dict | None = None,
+    chosung_index: dict | None = None,
+) -> None:
+    render_hero(df)
 
     major_options = sorted({major for majors in df["major_list"] for major in majors})
 
@@ -3155,29 +3875,7 @@ def render_main_page(df: pd.DataFrame) -> None:
         """
     )
 
-    suggestion_cols = st.columns(3, gap="small")
-    for idx, suggestion in enumerate(suggestion_queries):
-        with suggestion_cols[idx % 3]:
-            if st.button(suggestion, key=f"suggestion_{idx}", use_container_width=True):
-                st.session_state.search_input = suggestion
-                st.session_state.committed_query = suggestion
-                st.session_state.trigger_ai_search = True
-                st.session_state.page_number = 1
-                rerun_app()
-
-    with st.form("ai_search_form", clear_on_submit=False):
-        st.text_input(
-            "AI 탐색어 입력",
-            placeholder="예: 데이터 분석을 하면서 사람과도 소통하는 직업",
-            key="search_input",
-        )
-        submitted = st.form_submit_button("AI 탐색 시작", use_container_width=True, type="primary")
-
-    if submitted:
-        st.session_state.committed_query = st.session_state.get("search_input", "").strip()
-        st.session_state.trigger_ai_search = bool(st.session_state.committed_query)
-        st.session_state.page_number = 1
-        rerun_app()
+    render_search_console(suggestion_index, chosung_index)
 
     col1, col2, col3 = st.columns([1.6, 0.9, 0.9], gap="medium")
     with col1:
@@ -3194,22 +3892,28 @@ def render_main_page(df: pd.DataFrame) -> None:
         st.session_state.trigger_ai_search = False
 
     if not search_query:
-        render_ai_search_brief("", df.iloc[0:0], df.iloc[0:0])
+        render_ai_search_brief("", df.iloc[0:0], 0)
         render_pre_search_state()
         return
 
-    searched = search_jobs(df, search_query)
-    filtered = filter_results(searched, selected_majors, salary_filters, employment_filters)
+    correction = suggest_correction(typo_index, search_query)
+    if correction and correction != search_query:
+        render_did_you_mean(correction)
 
-    render_ai_search_brief(search_query, searched, filtered)
-    render_search_panel(total_count=len(df), filtered_count=len(filtered), query=search_query)
+    searched = search_jobs(df, search_query, typo_index, chosung_index)
+    filtered = filter_results(df, searched, selected_majors, salary_filters, employment_filters)
+    filtered_count = len(filtered["positions"])
 
-    if filtered.empty:
+    # 브리핑은 상위 10개만 본다.
+    render_ai_search_brief(search_query, materialize_results(df, filtered, 0, 10), filtered_count)
+    render_search_panel(total_count=len(df), filtered_count=filtered_count, query=search_query)
+
+    if filtered_count == 0:
         st.warning("조건에 맞는 직업이 없습니다. 탐색어를 조금 넓게 입력하거나 필터를 줄여 주세요.")
         return
 
     per_page = 12
-    page_count = max(1, (len(filtered) - 1) // per_page + 1)
+    page_count = max(1, (filtered_count - 1) // per_page + 1)
 
     current_page = int(st.session_state.get("page_number", 1))
     current_page = max(1, min(current_page, page_count))
@@ -3217,16 +3921,15 @@ def render_main_page(df: pd.DataFrame) -> None:
 
     start = (current_page - 1) * per_page
     end = start + per_page
-    page_df = filtered.iloc[start:end].reset_index(drop=True)
+    page_df = materialize_results(df, filtered, start, end)
 
     cols = st.columns(3, gap="large")
-    for idx, (_, row) in enumerate(page_df.iterrows()):
-        with cols[idx % 3]:
-            render_result_card(row, delay_ms=idx * 120)
-            if st.button(f"상세 보기 · {row['job']}", key=f"open_{start+idx}", use_container_width=True):
-                st.session_state.selected_job = row["job"]
-                st.session_state.page = "detail"
-                rerun_app()
+    with span("render_cards", count=len(page_df)):
+        for idx, (_, row) in enumerate(page_df.iterrows()):
+            with cols[idx % 3]:
+                render_result_card(row, delay_ms=idx * 120)
+                if st.button(f"상세 보기 · {row['job']}", key=f"open_{start+idx}", use_container_width=True):
+                    open_job_detail(row.get("job_id"), row["job"])
 
     render_html(
         """
@@ -3280,32 +3983,59 @@ def render_main_page(df: pd.DataFrame) -> None:
 # -----------------------------
 # Entrypoint
 # -----------------------------
-def main() -> None:
-    inject_css()
-    ensure_session_defaults()
-
+def render_app() -> None:
     if not DATA_FILE.exists():
         st.error(f"기본 데이터 파일을 찾지 못했습니다: {DATA_FILE.name}")
         st.stop()
 
     try:
-        df = load_data(DATA_FILE)
+        with span("load_data"):
+            # rerun 동안에는 시작 시점의 산출물 버전을 고정한다. 교체는 다음 rerun부터 반영된다.
+            artifact_version = active_artifact_version(get_artifact_store())
+            with pin_artifact_version(artifact_version):
+                df = load_data(DATA_FILE, artifact_version)
     except Exception as exc:
         st.error(f"데이터 로드 중 오류가 발생했습니다: {exc}")
         st.stop()
 
-    if st.session_state.page == "detail" and st.session_state.selected_job:
-        matched = df[df["job"] == st.session_state.selected_job]
-        if matched.empty:
-            st.warning("선택한 직업 정보를 찾을 수 없어 목록 화면으로 이동합니다.")
-            st.session_state.page = "main"
-            st.session_state.selected_job = None
-            rerun_app()
-            return
+    data_version = str(df.attrs.get("data_version", ""))
 
-        render_detail_page(matched.iloc[0])
-    else:
-        render_main_page(df)
+    sync_navigation_from_query_params()
+
+    with pin_artifact_version(artifact_version):
+        if st.session_state.page == "detail" and (st.session_state.selected_job_id or st.session_state.selected_job):
+            position = lookup_job_position(
+                load_job_lookup(DATA_FILE, artifact_version),
+                job_id=st.session_state.selected_job_id,
+                job_name=st.session_state.selected_job,
+            )
+            if position is None:
+                st.warning("선택한 직업 정보를 찾을 수 없어 목록 화면으로 이동합니다.")
+                st.session_state.selected_job = None
+                close_job_detail()
+                return
+
+            render_detail_page(df.iloc[position], data_version)
+        else:
+            warm_detail_fragments(df, data_version, load_job_lookup(DATA_FILE, artifact_version))
+            suggestion_index = load_suggestion_index(DATA_FILE, artifact_version)
+            typo_index = load_typo_index(DATA_FILE, artifact_version)
+            chosung_index = load_chosung_index(DATA_FILE, artifact_version)
+            render_main_page(df, suggestion_index, typo_index, chosung_index)
+
+
+def main() -> None:
+    inject_css()
+    ensure_session_defaults()
+
+    trace = start_trace(get_dev_mode())
+    try:
+        render_app()
+    finally:
+        finished = finish_trace(trace)
+
+    if finished is not None:
+        render_profiler_panel(finished)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,415 @@
+"""
+직업 데이터 검색 보조 색인
+
+load_data가 만든 데이터프레임으로부터 한 번만 만들어 두고,
+search_jobs를 돌리지 않고도 바로 답할 수 있는 조회를 담당한다.
+
+- 자동완성: 직업명/LLM 키워드/주제 태그/전공을 자모 단위로 정렬한 배열에서
+  이진 탐색으로 접두어 범위를 찾고, 등장 빈도 가중치 상위 k개를 돌려준다.
+- 직업 조회: job_id(또는 직업명) → 행 위치 해시 테이블. 상세 페이지와 딥 링크가
+  전체 컬럼 비교 없이 O(1)로 행을 찾는다.
+- 오타 색인: 직업명과 유사 직업명을 자모열로 풀어 SymSpell 방식(대칭 삭제)으로 색인한다.
+  한 자모 오타가 거리 1이고, 질의 길이에만 비례하는 시간에 "혹시 이것을 찾으셨나요?"와
+  후보 행을 돌려준다.
+- 초성 색인: 직업명·LLM 키워드·주제 태그의 초성열을 글자 위치마다 잘라 정렬해 두고,
+  "ㅅㅍㅌㅇ" 같은 초성 검색어를 이진 탐색 한 번으로 부분 일치 후보로 바꾼다.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+from hangul import compact_search_key, decompose_jamo, extract_chosung, is_chosung_text
+
+
+# (종류, 컬럼) 순서가 곧 같은 표기의 대표 종류 우선순위다.
+SUGGESTION_SOURCES = [
+    ("job", "job"),
+    ("keyword", "llm_keywords_list"),
+    ("topic", "topic_tags_list"),
+    ("major", "major_list"),
+]
+SUGGESTION_KIND_BONUS = {"job": 3.0, "keyword": 1.0, "topic": 1.0, "major": 0.5}
+SUGGESTION_KIND_LABELS = {"job": "직업", "keyword": "키워드", "topic": "주제", "major": "전공"}
+
+
+def build_suggestion_index(df: pd.DataFrame) -> dict:
+    entries: dict[str, dict] = {}
+    for kind, col in SUGGESTION_SOURCES:
+        if col not in df.columns:
+            continue
+        for value in df[col].tolist():
+            items = [value] if kind == "job" else list(value or [])
+            seen_in_row = set()
+            for item in items:
+                text = " ".join(str(item).split())
+                key = compact_search_key(text)
+                if len(key) < 2 or key in seen_in_row:
+                    continue
+                seen_in_row.add(key)
+                entry = entries.setdefault(key, {"text": text, "kind": kind, "count": 0})
+                entry["count"] += 1
+
+    texts: list[str] = []
+    kinds: list[str] = []
+    weights: list[float] = []
+    pairs: list[tuple[str, int]] = []
+    for entry_id, entry in enumerate(entries.values()):
+        texts.append(entry["text"])
+        kinds.append(entry["kind"])
+        weights.append(entry["count"] + SUGGESTION_KIND_BONUS.get(entry["kind"], 0.0))
+
+        # "빅데이터 전문가"가 "전문"으로도 잡히도록 어절 시작 위치마다 키를 둔다.
+        words = entry["text"].split()
+        for start in range(len(words)):
+            key = decompose_jamo(compact_search_key("".join(words[start:])))
+            if key:
+                pairs.append((key, entry_id))
+
+    pairs.sort()
+    return {
+        "keys": [key for key, _ in pairs],
+        "entry_ids": np.array([entry_id for _, entry_id in pairs], dtype=np.int32),
+        "texts": texts,
+        "kinds": kinds,
+        "weights": np.array(weights, dtype=np.float32),
+        "lengths": np.array([len(text) for text in texts], dtype=np.int32),
+    }
+
+
+def _prefix_entry_ids(index: dict, prefix: str) -> np.ndarray:
+    key = decompose_jamo(compact_search_key(prefix))
+    if not key:
+        return np.empty(0, dtype=np.int32)
+    keys = index["keys"]
+    lo = bisect_left(keys, key)
+    hi = bisect_left(keys, key + "\uffff", lo)
+    return np.unique(index["entry_ids"][lo:hi])
+
+
+def suggest_queries(index: dict | None, prefix: str, limit: int = 8) -> list[dict]:
+    """접두어(자모 단위 부분 입력 포함)로 시작하는 검색어 후보를 인기순으로 돌려준다."""
+    if not index or not prefix or not prefix.strip():
+        return []
+
+    entry_ids = _prefix_entry_ids(index, prefix)
+    if entry_ids.size == 0:
+        words = prefix.split()
+        if len(words) > 1:
+            entry_ids = _prefix_entry_ids(index, words[-1])
+    if entry_ids.size == 0:
+        return []
+
+    weights = index["weights"][entry_ids]
+    if entry_ids.size > limit:
+        top = np.argpartition(-weights, limit)[:limit]
+        entry_ids = entry_ids[top]
+        weights = weights[top]
+
+    order = np.lexsort((index["lengths"][entry_ids], -weights))
+    return [
+        {"text": index["texts"][entry_id], "kind": index["kinds"][entry_id]}
+        for entry_id in entry_ids[order].tolist()
+    ]
+
+
+def build_job_lookup(df: pd.DataFrame) -> dict:
+    """job_id/직업명 → 행 위치. 같은 이름이 여러 번 나오면 첫 행을 쓴다(기존 필터 동작과 동일)."""
+    by_id: dict[str, int] = {}
+    if "job_id" in df.columns:
+        for pos, job_id in enumerate(df["job_id"].tolist()):
+            by_id.setdefault(str(job_id), pos)
+
+    by_name: dict[str, int] = {}
+    for pos, name in enumerate(df["job"].tolist()):
+        by_name.setdefault(str(name), pos)
+
+    return {"by_id": by_id, "by_name": by_name}
+
+
+def lookup_job_position(lookup: dict | None, job_id: str | None = None, job_name: str | None = None) -> int | None:
+    if not lookup:
+        return None
+    if job_id:
+        pos = lookup["by_id"].get(str(job_id))
+        if pos is not None:
+            return pos
+    if job_name:
+        return lookup["by_name"].get(str(job_name))
+    return None
+
+
+# 오타 색인. 거리는 자모 기준이다. 2음절 말은 한 자모만 달라도 다른 단어("교사"/"교수")가 되므로
+# 3글자 이상만 교정하고, 4글자까지는 1자모, 그보다 길면 2자모까지 허용한다.
+TYPO_MAX_DISTANCE = 2
+TYPO_MIN_LENGTH = 3
+TYPO_SHORT_LENGTH = 4
+# 삭제 변형은 앞 12자모(약 4음절)에만 만든다. 후보 검증은 전체 문자열 거리로 한다.
+TYPO_PREFIX_LENGTH = 12
+TYPO_SIMILAR_WEIGHT = 0.5
+
+
+def typo_key(text: str) -> str:
+    return decompose_jamo(compact_search_key(text))
+
+
+def typo_max_distance(text: str) -> int:
+    return 1 if len(compact_search_key(text)) <= TYPO_SHORT_LENGTH else TYPO_MAX_DISTANCE
+
+
+def _typo_deletes(key: str, max_distance: int) -> set[str]:
+    prefix = key[:TYPO_PREFIX_LENGTH]
+    deletes = {prefix}
+    frontier = {prefix}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for word in frontier:
+            if len(word) <= 1:
+                continue
+            for idx in range(len(word)):
+                next_frontier.add(word[:idx] + word[idx + 1:])
+        next_frontier -= deletes
+        deletes |= next_frontier
+        frontier = next_frontier
+    return deletes
+
+
+def _edit_distance(a: str, b: str, max_distance: int) -> int:
+    """인접 전치를 1로 세는 편집 거리(OSA). max_distance를 넘으면 max_distance + 1."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: list[int] | None = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+def build_typo_index(df: pd.DataFrame) -> dict:
+    """직업명(가중치 1)과 유사 직업명(그 이름을 유사 직업으로 가진 행, 가중치 0.5)의 오타 색인."""
+    terms: dict[str, dict] = {}
+
+    def add_term(text: str, pos: int, weight: float, is_job: bool) -> None:
+        text = " ".join(str(text).split())
+        key = typo_key(text)
+        if len(compact_search_key(text)) < 2:
+            return
+        term = terms.setdefault(key, {"text": text, "is_job": is_job, "positions": {}})
+        if is_job and not term["is_job"]:
+            term["text"] = text
+            term["is_job"] = True
+        term["positions"][pos] = max(term["positions"].get(pos, 0.0), weight)
+
+    for pos, name in enumerate(df["job"].tolist()):
+        add_term(name, pos, 1.0, True)
+    if "similar_job_list" in df.columns:
+        for pos, items in enumerate(df["similar_job_list"].tolist()):
+            for item in items or []:
+                add_term(item, pos, TYPO_SIMILAR_WEIGHT, False)
+
+    keys = list(terms)
+    deletes: dict[str, list[int]] = {}
+    for term_id, key in enumerate(keys):
+        for variant in _typo_deletes(key, TYPO_MAX_DISTANCE):
+            deletes.setdefault(variant, []).append(term_id)
+
+    entries = list(terms.values())
+    return {
+        "keys": keys,
+        "texts": [entry["text"] for entry in entries],
+        "is_job": np.array([entry["is_job"] for entry in entries], dtype=bool),
+        "positions": [np.array(list(entry["positions"]), dtype=np.int64) for entry in entries],
+        "weights": [np.array(list(entry["positions"].values()), dtype=np.float32) for entry in entries],
+        "deletes": deletes,
+    }
+
+
+def lookup_typo_terms(index: dict | None, text: str) -> list[tuple[int, int]]:
+    """(term_id, 거리) 목록. 거리 오름차순, 같은 거리면 직업명·등장 행이 많은 순."""
+    if not index or not text:
+        return []
+    if len(compact_search_key(text)) < TYPO_MIN_LENGTH:
+        return []
+
+    key = typo_key(text)
+    max_distance = typo_max_distance(text)
+    candidates: set[int] = set()
+    for variant in _typo_deletes(key, max_distance):
+        candidates.update(index["deletes"].get(variant, ()))
+
+    matches = []
+    for term_id in candidates:
+        distance = _edit_distance(key, index["keys"][term_id], max_distance)
+        if distance <= max_distance:
+            matches.append((term_id, distance))
+    matches.sort(key=lambda item: (item[1], not index["is_job"][item[0]], -len(index["positions"][item[0]])))
+    return matches
+
+
+def _same_spelling(a: str, b: str) -> bool:
+    return " ".join(a.lower().split()) == " ".join(b.lower().split())
+
+
+def typo_candidate_positions(index: dict | None, terms: list[str]) -> dict[int, float]:
+    """검색어(와 그 토큰)의 오타 교정 후보 행과 가중치. 철자가 그대로 같은 항목은 기존 부분 일치에 맡긴다."""
+    hits: dict[int, float] = {}
+    for text in terms:
+        matches = lookup_typo_terms(index, text)
+        # 가장 가까운 거리의 항목만 쓴다. 정확히 맞는 직업명이 있으면 더 먼 후보는 보태지 않는다.
+        closest = matches[0][1] if matches else 0
+        for term_id, distance in matches:
+            if distance > closest:
+                break
+            if distance == 0 and _same_spelling(text, index["texts"][term_id]):
+                continue
+            factor = 1.0 / (1 + distance)
+            for pos, weight in zip(index["positions"][term_id].tolist(), index["weights"][term_id].tolist()):
+                hits[pos] = max(hits.get(pos, 0.0), weight * factor)
+    return hits
+
+
+def suggest_correction(index: dict | None, query: str) -> str | None:
+    """오타로 보이는 검색어의 교정안. 전체가 하나의 직업명에 가까우면 그 이름, 아니면 어절별로 고친다."""
+    query = " ".join(str(query).split())
+    if not index or not query:
+        return None
+
+    matches = lookup_typo_terms(index, query)
+    if matches:
+        term_id, distance = matches[0]
+        return index["texts"][term_id] if distance > 0 else None
+
+    words = query.split()
+    if len(words) < 2:
+        return None
+    corrected = []
+    changed = False
+    for word in words:
+        word_matches = lookup_typo_terms(index, word)
+        if word_matches and word_matches[0][1] > 0:
+            corrected.append(index["texts"][word_matches[0][0]])
+            changed = True
+        else:
+            corrected.append(word)
+    return " ".join(corrected) if changed else None
+
+
+# 초성 색인. (컬럼, 가중치) — 직업명 일치를 키워드·태그 일치보다 앞세운다.
+CHOSUNG_SOURCES = [
+    ("job", "job", 1.0),
+    ("keyword", "llm_keywords_list", 0.5),
+    ("topic", "topic_tags_list", 0.5),
+]
+# 초성 전체가 같은 일치 > 앞부분 일치 > 이름 중간에서 시작하는 일치("ㅅㅍㅌㅇ" → 시스템소프트웨어…).
+CHOSUNG_PREFIX_FACTOR = 0.9
+CHOSUNG_INNER_FACTOR = 0.8
+
+
+def build_chosung_index(df: pd.DataFrame) -> dict:
+    terms: dict[tuple[str, str], dict] = {}
+    for kind, col, weight in CHOSUNG_SOURCES:
+        if col not in df.columns:
+            continue
+        for pos, value in enumerate(df[col].tolist()):
+            items = [value] if kind == "job" else list(value or [])
+            for item in items:
+                text = " ".join(str(item).split())
+                key = extract_chosung(text)
+                if len(key) < 2:
+                    continue
+                term = terms.setdefault((kind, text), {"text": text, "kind": kind, "positions": {}})
+                term["positions"][pos] = max(term["positions"].get(pos, 0.0), weight)
+
+    entries = list(terms.values())
+    pairs: list[tuple[str, int, int]] = []
+    for term_id, entry in enumerate(entries):
+        key = extract_chosung(entry["text"])
+        for offset in range(len(key) - 1):
+            pairs.append((key[offset:], term_id, offset))
+    pairs.sort()
+
+    return {
+        "keys": [key for key, _, _ in pairs],
+        "term_ids": np.array([term_id for _, term_id, _ in pairs], dtype=np.int32),
+        "offsets": np.array([offset for _, _, offset in pairs], dtype=np.int16),
+        "texts": [entry["text"] for entry in entries],
+        "kinds": [entry["kind"] for entry in entries],
+        "key_lengths": np.array([len(extract_chosung(entry["text"])) for entry in entries], dtype=np.int16),
+        "positions": [np.array(list(entry["positions"]), dtype=np.int64) for entry in entries],
+        "weights": [np.array(list(entry["positions"].values()), dtype=np.float32) for entry in entries],
+    }
+
+
+def lookup_chosung_terms(index: dict | None, query: str) -> dict[int, int]:
+    """초성 검색어를 부분 문자열로 갖는 항목 → 가장 앞선 일치 위치."""
+    if not index or not is_chosung_text(query):
+        return {}
+    key = "".join(query.split())
+    keys = index["keys"]
+    lo = bisect_left(keys, key)
+    hi = bisect_left(keys, key + "\uffff", lo)
+
+    matches: dict[int, int] = {}
+    for term_id, offset in zip(index["term_ids"][lo:hi].tolist(), index["offsets"][lo:hi].tolist()):
+        if term_id not in matches or offset < matches[term_id]:
+            matches[term_id] = offset
+    return matches
+
+
+def chosung_candidate_positions(index: dict | None, query: str) -> dict[int, float]:
+    """검색어 전체 또는 초성으로만 된 어절마다 일치하는 행과 가중치."""
+    terms = [query] if is_chosung_text(query) else [word for word in str(query).split() if is_chosung_text(word)]
+    hits: dict[int, float] = {}
+    for text in terms:
+        query_length = len("".join(text.split()))
+        for term_id, offset in lookup_chosung_terms(index, text).items():
+            if offset > 0:
+                factor = CHOSUNG_INNER_FACTOR
+            elif index["key_lengths"][term_id] == query_length:
+                factor = 1.0
+            else:
+                factor = CHOSUNG_PREFIX_FACTOR
+            for pos, weight in zip(index["positions"][term_id].tolist(), index["weights"][term_id].tolist()):
+                hits[pos] = max(hits.get(pos, 0.0), weight * factor)
+    return hits
+
+
+def suggest_chosung_queries(index: dict | None, query: str, limit: int = 8) -> list[dict]:
+    """초성 검색어 자동완성. 앞에서 일치하는 직업명 → 짧은 이름 → 행이 많은 항목 순."""
+    matches = lookup_chosung_terms(index, query)
+    if not matches:
+        return []
+    kind_rank = {kind: rank for rank, (kind, _, _) in enumerate(CHOSUNG_SOURCES)}
+    ranked = sorted(
+        matches.items(),
+        key=lambda item: (
+            item[1] > 0,
+            int(index["key_lengths"][item[0]]) != len("".join(query.split())),
+            kind_rank.get(index["kinds"][item[0]], len(kind_rank)),
+            len(index["texts"][item[0]]),
+            -len(index["positions"][item[0]]),
+        ),
+    )
+    suggestions: list[dict] = []
+    seen = set()
+    for term_id, _ in ranked:
+        text = index["texts"][term_id]
+        if text in seen:
+            continue
+        seen.add(text)
+        suggestions.append({"text": text, "kind": index["kinds"][term_id]})
+        if len(suggestions) >= limit:
+            break
+    return suggestions
@@ -0,0 +1,85 @@
+"""data_loader.search_jobs(벡터화)가 score_job을 행마다 적용하던 기존 구현과 같은 결과를 내는지 확인한다."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data_loader import get_job_detail, load_job_data, score_job, search_jobs
+
+DATA_PATH = Path(__file__).resolve().parent / "career_jobs.xlsx"
+
+QUERIES = [
+    "",
+    "   ",
+    "수의사",
+    "간호사",
+    "교사",
+    "개발",
+    "데이터 분석",
+    "소프트웨어 개발자",
+    "상담 교사 상담",
+    "Designer",
+    "연구",
+    "없는직업명xyz",
+]
+TOP_NS = [1, 5, 30, 1000]
+
+
+def reference_search_jobs(df: pd.DataFrame, query: str, top_n: int = 30) -> pd.DataFrame:
+    """벡터화 이전 search_jobs 구현."""
+    q = query.strip()
+
+    if not q:
+        return df[["job"]].sort_values("job").head(top_n)
+
+    result = df.copy()
+    result["score"] = result.apply(lambda row: score_job(row, q), axis=1)
+    result = result[result["score"] > 0].sort_values(["score", "job"], ascending=[False, True])
+
+    return result.head(top_n)
+
+
+@pytest.fixture(scope="module")
+def jobs() -> pd.DataFrame:
+    if not DATA_PATH.exists():
+        pytest.skip(f"{DATA_PATH.name}이 없습니다.")
+    return load_job_data(DATA_PATH)
+
+
+def assert_same_result(df: pd.DataFrame, query: str, top_n: int) -> None:
+    expected = reference_search_jobs(df, query, top_n)
+    actual = search_jobs(df, query, top_n)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("top_n", TOP_NS)
+@pytest.mark.parametrize("query", QUERIES)
+def test_search_jobs_matches_reference(jobs, query, top_n):
+    assert_same_result(jobs, query, top_n)
+
+
+def test_exact_match_ranks_first_and_miss_is_empty(jobs):
+    assert search_jobs(jobs, "없는직업명xyz").empty
+    assert search_jobs(jobs, "수의사", 1)["job"].iat[0] == "수의사"
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_filtered_and_reordered_frames(jobs, query):
+    sampled = jobs.sample(frac=0.4, random_state=7)
+    reordered = jobs.iloc[::-1]
+    for frame in (sampled, reordered):
+        assert_same_result(frame, query, 30)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_frames_without_attrs(jobs, query):
+    bare = jobs.sample(frac=0.5, random_state=3).copy()
+    bare.attrs = {}
+    assert_same_result(bare, query, 30)
+
+
+def test_search_helpers_stay_out_of_public_output(jobs):
+    assert "search_row" not in jobs.columns
+    detail = get_job_detail(jobs, jobs["job"].iat[0])
+    assert set(detail) == set(jobs.columns)
@@ -0,0 +1,186 @@
+"""
+Google Sheets 대체용 메모리 워크시트
+
+목적:
+- 실제 서비스 계정 없이 gcp_storage(헤더 보정, append, outbox dispatcher)를 검증·벤치마크한다.
+- gspread.Worksheet 중 gcp_storage가 쓰는 메서드(row_values, col_values, update, append_row, append_rows,
+  get_all_records)만 같은 시그니처로 흉내 낸다. 호출마다 지연(latency)을 주고, 분당 읽기/쓰기 요청 한도를
+  넘거나 error_rate 확률에 걸리면 gspread.exceptions.APIError(429/503)를 올린다.
+- FakeSpreadsheets는 여러 워크시트(rollover 샤드, 샤드 레지스트리)를 만들고 열며,
+  분당 요청 한도는 실제 API처럼 모든 워크시트가 함께 쓴다.
+- 값은 RAW 입력처럼 그대로 저장하고, 읽을 때는 시트처럼 문자열로 돌려준다.
+
+사용:
+   import gcp_storage
+   from fake_sheets import FakeSpreadsheets
+   sheets = FakeSpreadsheets(latency=0.3)
+   gcp_storage.set_worksheet_backend(sheets.open_worksheet, target=("fake", "responses"))
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+import json
+import random
+import threading
+import time
+
+import gspread
+import requests
+from gspread.utils import a1_to_rowcol
+
+
+# Sheets API 기본 할당량: 사용자당 분당 읽기/쓰기 요청 각 60회.
+DEFAULT_QUOTA_PER_MINUTE = 60
+QUOTA_WINDOW_SECONDS = 60.0
+
+
+def _api_error(code: int, message: str, status: str) -> gspread.exceptions.APIError:
+    response = requests.Response()
+    response.status_code = code
+    response._content = json.dumps({"error": {"code": code, "message": message, "status": status}}).encode("utf-8")
+    return gspread.exceptions.APIError(response)
+
+
+def _cell_text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _new_quota_group() -> dict:
+    return {"lock": threading.Lock(), "recent": {"read": deque(), "write": deque()}}
+
+
+def _trim(values: list[str]) -> list[str]:
+    # 시트 API는 끝의 빈 칸을 돌려주지 않는다.
+    end = len(values)
+    while end and values[end - 1] == "":
+        end -= 1
+    return values[:end]
+
+
+class FakeWorksheet:
+    def __init__(
+        self,
+        title: str = "responses",
+        latency: float = 0.0,
+        read_quota_per_minute: int | None = DEFAULT_QUOTA_PER_MINUTE,
+        write_quota_per_minute: int | None = DEFAULT_QUOTA_PER_MINUTE,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+        quota_group: dict | None = None,
+    ):
+        self.title = title
+        self.latency = latency
+        self.quota = {"read": read_quota_per_minute, "write": write_quota_per_minute}
+        self.error_rate = error_rate
+        self.rows: list[list] = []
+        self.calls: Counter = Counter()
+        self.errors: Counter = Counter()
+        self._quota_group = quota_group or _new_quota_group()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _request(self, method: str, kind: str) -> None:
+        """API 요청 한 번. 할당량은 요청이 도착한 시점 기준으로 세고, 지연은 잠금 밖에서 기다린다."""
+        now = time.monotonic()
+        with self._lock:
+            self.calls[method] += 1
+            failed = self.error_rate and self._random.random() < self.error_rate
+        with self._quota_group["lock"]:
+            limit = self.quota[kind]
+            recent = self._quota_group["recent"][kind]
+            while recent and now - recent[0] >= QUOTA_WINDOW_SECONDS:
+                recent.popleft()
+            exceeded = limit is not None and len(recent) >= limit
+            if not exceeded:
+                recent.append(now)
+        if exceeded:
+            with self._lock:
+                self.errors[429] += 1
+            raise _api_error(429, f"Quota exceeded for '{kind} requests per minute per user'", "RESOURCE_EXHAUSTED")
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            with self._lock:
+                self.errors[503] += 1
+            raise _api_error(503, "The service is currently unavailable.", "UNAVAILABLE")
+
+    def row_values(self, row: int, **kwargs) -> list[str]:
+        self._request("row_values", "read")
+        with self._lock:
+            values = self.rows[row - 1] if row <= len(self.rows) else []
+            return _trim([_cell_text(value) for value in values])
+
+    def col_values(self, col: int, **kwargs) -> list[str]:
+        self._request("col_values", "read")
+        with self._lock:
+            return _trim([_cell_text(row[col - 1]) if len(row) >= col else "" for row in self.rows])
+
+    def update(self, range_name: str, values: list[list], **kwargs) -> dict:
+        self._request("update", "write")
+        start_row, start_col = a1_to_rowcol(range_name.split(":")[0])
+        with self._lock:
+            for offset, new_values in enumerate(values):
+                index = start_row - 1 + offset
+                while len(self.rows) <= index:
+                    self.rows.append([])
+                row = self.rows[index]
+                end = start_col - 1 + len(new_values)
+                if len(row) < end:
+                    row.extend([""] * (end - len(row)))
+                row[start_col - 1:end] = list(new_values)
+        return {"updatedRows": len(values)}
+
+    def append_row(self, values: list, value_input_option: str = "RAW", **kwargs) -> dict:
+        return self._append("append_row", [values])
+
+    def append_rows(self, values: list[list], value_input_option: str = "RAW", **kwargs) -> dict:
+        return self._append("append_rows", values)
+
+    def _append(self, method: str, values: list[list]) -> dict:
+        self._request(method, "write")
+        with self._lock:
+            self.rows.extend(list(row) for row in values)
+            return {"updates": {"updatedRows": len(values)}}
+
+    def get_all_records(self, **kwargs) -> list[dict]:
+        self._request("get_all_records", "read")
+        with self._lock:
+            if not self.rows:
+                return []
+            header = [_cell_text(value) for value in self.rows[0]]
+            return [
+                {col: (row[i] if i < len(row) else "") for i, col in enumerate(header) if col}
+                for row in self.rows[1:]
+            ]
+
+    def data_rows(self) -> list[list]:
+        """헤더를 뺀 데이터 행 (검증용, API 호출로 세지 않는다)."""
+        with self._lock:
+            return [list(row) for row in self.rows[1:]]
+
+
+class FakeSpreadsheets:
+    """(spreadsheet_id, worksheet_name)별 FakeWorksheet 모음. open_worksheet를 set_worksheet_backend에 넘긴다."""
+
+    def __init__(self, **worksheet_options):
+        self.worksheet_options = worksheet_options
+        self.worksheets: dict[tuple[str, str], FakeWorksheet] = {}
+        self._quota_group = _new_quota_group()
+        self._lock = threading.Lock()
+
+    def open_worksheet(self, spreadsheet_id: str, worksheet_name: str, create: bool = False, cols: int = 26) -> FakeWorksheet:
+        with self._lock:
+            worksheet = self.worksheets.get((spreadsheet_id, worksheet_name))
+            if worksheet is None:
+                if not create:
+                    raise gspread.exceptions.WorksheetNotFound(worksheet_name)
+                worksheet = FakeWorksheet(title=worksheet_name, quota_group=self._quota_group, **self.worksheet_options)
+                self.worksheets[(spreadsheet_id, worksheet_name)] = worksheet
+            return worksheet
+
+    def total_calls(self) -> Counter:
+        calls: Counter = Counter()
+        for worksheet in self.worksheets.values():
+            calls.update(worksheet.calls)
+        return calls
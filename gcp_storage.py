@@ -1,19 +1,102 @@
 from __future__ import annotations
 
-from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Callable, Iterable, Protocol
 
 import gspread
 import streamlit as st
+from google.auth.exceptions import RefreshError
 from google.oauth2.service_account import Credentials
 
+from submission_outbox import (
+    add_submission,
+    claim_due,
+    connect_outbox,
+    mark_failed,
+    mark_retry,
+    mark_sent,
+    next_due_at,
+    purge_sent,
+    submission_status,
+)
 
-def _get_header_row(worksheet: gspread.Worksheet) -> list[str]:
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+# 캐시한 클라이언트/워크시트 핸들을 버리고 한 번 다시 시도할 API 오류 코드.
+# 401: 토큰 만료·폐기, 404: 워크시트가 지워졌거나 이름이 바뀜. 이 경우 append는 반영되지 않았다.
+STALE_HANDLE_ERROR_CODES = {401, 404}
+
+# outbox dispatcher 설정. 배치는 WRITE_BATCH_SIZE행이 모이거나 첫 행이 들어온 뒤
+# WRITE_FLUSH_INTERVAL_SECONDS가 지나면 append_rows 한 번으로 보낸다. 재시도 백오프는 submission_outbox가 정한다.
+WRITE_BATCH_SIZE = 50
+WRITE_FLUSH_INTERVAL_SECONDS = 1.0
+# 다른 프로세스가 같은 outbox에 넣은 행이나 백오프가 끝난 행을 놓치지 않도록 깨어나는 최대 간격.
+DISPATCH_IDLE_SECONDS = 30.0
+# 시트에서 중복 제출을 가려내는 컬럼.
+SUBMISSION_ID_COLUMN = "submission_id"
+
+# 워크시트 rollover. st.secrets["sheets"]의 rollover_max_rows(데이터 행 수)와 rollover_monthly(월 단위)로 켠다.
+# 둘 다 없으면 worksheet_name 하나에만 쓴다. 샤드 목록은 같은 스프레드시트의 SHARD_REGISTRY_WORKSHEET에 둔다.
+SHARD_REGISTRY_WORKSHEET = "_shards"
+SHARD_REGISTRY_HEADER = ["base", "spreadsheet_id", "worksheet_name", "period", "created_at"]
+# 다른 프로세스가 만든 샤드를 알아차리도록 레지스트리를 다시 읽는 간격.
+SHARD_REGISTRY_TTL_SECONDS = 300.0
+SHARD_INITIAL_ROWS = 1000
+SHARD_MIN_COLS = 26
+SHARD_READ_WORKERS = 8
+
+
+class WorksheetBackend(Protocol):
+    """gcp_storage가 쓰는 워크시트 메서드. gspread.Worksheet와 fake_sheets.FakeWorksheet가 따른다."""
+
+    def row_values(self, row: int) -> list[str]: ...
+
+    def col_values(self, col: int) -> list[str]: ...
+
+    def update(self, range_name: str, values: list[list]) -> dict: ...
+
+    def append_row(self, values: list, value_input_option: str = "RAW") -> dict: ...
+
+    def append_rows(self, values: list[list], value_input_option: str = "RAW") -> dict: ...
+
+    def get_all_records(self) -> list[dict]: ...
+
+
+# 테스트/벤치마크에서 바꿔 끼우는 워크시트 백엔드. open이 None이면 gspread로 연다.
+# open(spreadsheet_id, worksheet_name, create=False, cols=...)은 create=True면 없는 워크시트를 만든다.
+_WORKSHEET_BACKEND: dict = {"open": None, "target": None, "rollover": None}
+# _reset_sheet_handles가 올리는 핸들 세대. 캐시한 워크시트 상태는 세대가 바뀌면 핸들만 다시 연다.
+_SHEET_HANDLES: dict = {"generation": 0}
+
+
+def set_worksheet_backend(
+    open_worksheet: Callable[..., WorksheetBackend] | None,
+    target: tuple[str, str] | None = None,
+    rollover: dict | None = None,
+) -> None:
+    """워크시트를 여는 함수를 바꾼다. target을 주면 st.secrets 대신 그 (spreadsheet_id, worksheet_name)에 쓴다.
+
+    rollover({"max_rows": int | None, "monthly": bool})를 주면 st.secrets의 rollover 설정 대신 쓴다.
+    open_worksheet=None이면 gspread 백엔드로 돌아간다. 캐시한 워크시트 핸들은 버린다.
+    """
+    _WORKSHEET_BACKEND["open"] = open_worksheet
+    _WORKSHEET_BACKEND["target"] = target
+    _WORKSHEET_BACKEND["rollover"] = rollover
+    _reset_sheet_handles()
+
+
+def _get_header_row(worksheet: WorksheetBackend) -> list[str]:
     header = worksheet.row_values(1)
     return [col.strip() for col in header if col is not None]
 
 
 def _ensure_header(
-    worksheet: gspread.Worksheet,
+    worksheet: WorksheetBackend,
     desired_header: Iterable[str],
 ) -> list[str]:
     desired = list(desired_header)
@@ -31,23 +114,487 @@ def _ensure_header(
     return header
 
 
+def _sheet_target() -> tuple[str, str]:
+    if _WORKSHEET_BACKEND["target"] is not None:
+        return _WORKSHEET_BACKEND["target"]
+    return st.secrets["sheets"]["spreadsheet_id"], st.secrets["sheets"]["worksheet_name"]
+
+
+def _rollover_policy() -> dict:
+    if _WORKSHEET_BACKEND["rollover"] is not None:
+        return _WORKSHEET_BACKEND["rollover"]
+    if _WORKSHEET_BACKEND["target"] is not None:
+        return {"max_rows": None, "monthly": False}
+    sheets = st.secrets["sheets"]
+    return {
+        "max_rows": int(sheets["rollover_max_rows"]) if sheets.get("rollover_max_rows") else None,
+        "monthly": bool(sheets.get("rollover_monthly", False)),
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _get_client() -> gspread.Client:
+    # gspread의 AuthorizedSession이 만료된 액세스 토큰을 요청 시점에 자동으로 갱신한다.
+    credentials = Credentials.from_service_account_info(
+        st.secrets["gcp_service_account"],
+        scopes=SCOPES,
+    )
+    return gspread.authorize(credentials)
+
+
+@st.cache_resource(show_spinner=False)
+def _sheet_state_slot(spreadsheet_id: str, worksheet_name: str) -> dict:
+    # rows: 헤더를 뺀 데이터 행 수. rollover_max_rows를 쓸 때만 처음 한 번 세고 이후 append마다 더한다.
+    # generation이 _SHEET_HANDLES와 다르면 다음 사용 때 워크시트를 다시 연다. lock은 바꾸지 않는다.
+    return {"worksheet": None, "header": None, "rows": None, "generation": -1, "lock": threading.Lock()}
+
+
+def _get_sheet_state(spreadsheet_id: str, worksheet_name: str) -> dict:
+    """프로세스 전체가 공유하는 워크시트 핸들과 헤더 캐시. header가 None이면 다음 쓰기 때 시트에서 읽는다."""
+    state = _sheet_state_slot(spreadsheet_id, worksheet_name)
+    if state["generation"] != _SHEET_HANDLES["generation"]:
+        with state["lock"]:
+            generation = _SHEET_HANDLES["generation"]
+            if state["generation"] != generation:
+                state["worksheet"] = _open_worksheet(spreadsheet_id, worksheet_name)
+                state["header"] = None
+                state["rows"] = None
+                state["generation"] = generation
+    return state
+
+
+def _open_worksheet(spreadsheet_id: str, worksheet_name: str, create: bool = False, cols: int = SHARD_MIN_COLS):
+    open_worksheet = _WORKSHEET_BACKEND["open"]
+    if open_worksheet is not None:
+        return open_worksheet(spreadsheet_id, worksheet_name, create=create, cols=cols)
+
+    spreadsheet = _get_client().open_by_key(spreadsheet_id)
+    try:
+        return spreadsheet.worksheet(worksheet_name)
+    except gspread.exceptions.WorksheetNotFound:
+        if not create:
+            raise
+    try:
+        return spreadsheet.add_worksheet(title=worksheet_name, rows=SHARD_INITIAL_ROWS, cols=max(cols, SHARD_MIN_COLS))
+    except gspread.exceptions.APIError:
+        # 다른 프로세스가 같은 이름으로 먼저 만들었으면 그 워크시트를 쓴다.
+        return spreadsheet.worksheet(worksheet_name)
+
+
+def _reset_sheet_handles() -> None:
+    """클라이언트를 버리고 캐시한 워크시트 핸들을 다음 사용 때 다시 열게 한다.
+
+    워크시트/레지스트리 상태와 잠금은 그대로 두므로, 이전 핸들로 쓰는 중인 스레드와 새 핸들로 쓰는 스레드가
+    같은 잠금을 기다린다.
+    """
+    _get_client.clear()
+    _SHEET_HANDLES["generation"] += 1
+
+
+def _cached_header_for(state: dict, keys: list[str]) -> list[str]:
+    """캐시한 헤더에 없는 컬럼이 있을 때만 시트를 다시 읽고 헤더를 늘린다."""
+    header = state["header"]
+    if header is not None and all(key in header for key in keys):
+        return header
+
+    # 다른 프로세스가 먼저 헤더를 늘렸을 수 있으므로 캐시가 아닌 시트 기준으로 확장한다.
+    state["header"] = None
+    header = _ensure_header(state["worksheet"], keys)
+    state["header"] = header
+    return header
+
+
+def _shard_row_count(state: dict) -> int:
+    """state["lock"]을 잡은 채로 부른다."""
+    if state["rows"] is None:
+        state["rows"] = max(len(state["worksheet"].col_values(1)) - 1, 0)
+    return state["rows"]
+
+
+def _append_rows_with_cached_sheet(target: tuple[str, str], wide_rows: list[dict]) -> None:
+    keys: list[str] = []
+    for wide_row in wide_rows:
+        keys.extend(key for key in wide_row if key not in keys)
+
+    shard = _active_shard(target, len(wide_rows), len(keys))
+    state = _get_sheet_state(*shard)
+    with state["lock"]:
+        header = _cached_header_for(state, keys)
+        values = [[wide_row.get(col, "") for col in header] for wide_row in wide_rows]
+        if len(values) == 1:
+            state["worksheet"].append_row(values[0], value_input_option="RAW")
+        else:
+            state["worksheet"].append_rows(values, value_input_option="RAW")
+        if state["rows"] is not None:
+            state["rows"] += len(values)
+
+
+def _append_rows_with_handle_retry(target: tuple[str, str], wide_rows: list[dict]) -> None:
+    try:
+        _append_rows_with_cached_sheet(target, wide_rows)
+    except RefreshError:
+        _reset_sheet_handles()
+        _append_rows_with_cached_sheet(target, wide_rows)
+    except gspread.exceptions.APIError as exc:
+        if exc.code not in STALE_HANDLE_ERROR_CODES:
+            raise
+        _reset_sheet_handles()
+        _append_rows_with_cached_sheet(target, wide_rows)
+
+
 def append_one_row_to_sheet(wide_row: dict) -> None:
-    service_account_info = st.secrets["gcp_service_account"]
-    spreadsheet_id = st.secrets["sheets"]["spreadsheet_id"]
-    worksheet_name = st.secrets["sheets"]["worksheet_name"]
+    _append_rows_with_handle_retry(_sheet_target(), [wide_row])
+
+
+# -------------------------
+# 워크시트 샤드 (rollover)
+# -------------------------
+
+def _shard_period(policy: dict) -> str:
+    return time.strftime("%Y-%m") if policy["monthly"] else ""
+
+
+def _shard_name(base: str, period: str, index: int) -> str:
+    name = f"{base}_{period.replace('-', '')}" if period else base
+    return f"{name}_{index}" if index > 1 else name
+
 
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
+def _load_shards(registry: dict) -> None:
+    """레지스트리 워크시트를 읽어 샤드 목록을 만든다. 기존 worksheet_name은 항상 첫 샤드(period "")다."""
+    spreadsheet_id, base = registry["target"]
+    shards = [{"spreadsheet_id": spreadsheet_id, "worksheet_name": base, "period": ""}]
+    seen = {(spreadsheet_id, base)}
+    for record in registry["worksheet"].get_all_records():
+        if str(record.get("base", "")) != base:
+            continue
+        key = (str(record["spreadsheet_id"]), str(record["worksheet_name"]))
+        if key in seen:
+            continue
+        seen.add(key)
+        shards.append({"spreadsheet_id": key[0], "worksheet_name": key[1], "period": str(record.get("period", ""))})
+    registry["shards"] = shards
+    registry["loaded_at"] = time.monotonic()
+
+
+@st.cache_resource(show_spinner=False)
+def _shard_registry_slot(spreadsheet_id: str, worksheet_name: str) -> dict:
+    return {
+        "target": (spreadsheet_id, worksheet_name),
+        "worksheet": None,
+        "shards": [],
+        "loaded_at": 0.0,
+        "generation": -1,
+        "lock": threading.Lock(),
+    }
+
+
+def _get_shard_registry(spreadsheet_id: str, worksheet_name: str) -> dict:
+    """기본 워크시트별 샤드 목록. 레지스트리 워크시트는 처음 쓸 때 만든다."""
+    registry = _shard_registry_slot(spreadsheet_id, worksheet_name)
+    if registry["generation"] != _SHEET_HANDLES["generation"]:
+        with registry["lock"]:
+            generation = _SHEET_HANDLES["generation"]
+            if registry["generation"] != generation:
+                worksheet = _open_worksheet(
+                    spreadsheet_id, SHARD_REGISTRY_WORKSHEET, create=True, cols=len(SHARD_REGISTRY_HEADER)
+                )
+                _ensure_header(worksheet, SHARD_REGISTRY_HEADER)
+                registry["worksheet"] = worksheet
+                _load_shards(registry)
+                registry["generation"] = generation
+    return registry
+
+
+def _shard_full(shard: dict, policy: dict, incoming: int) -> bool:
+    if not policy["max_rows"]:
+        return False
+    state = _get_sheet_state(shard["spreadsheet_id"], shard["worksheet_name"])
+    with state["lock"]:
+        rows = _shard_row_count(state)
+    # 빈 샤드에는 한도보다 큰 배치도 그대로 쓴다 (새 샤드를 계속 만들지 않도록).
+    return rows > 0 and rows + incoming > policy["max_rows"]
+
+
+def _active_shard(target: tuple[str, str], incoming: int = 1, cols: int = SHARD_MIN_COLS) -> tuple[str, str]:
+    """이번 배치를 쓸 (spreadsheet_id, worksheet_name). 이번 달 샤드가 없거나 가득 찼으면 새로 만든다."""
+    policy = _rollover_policy()
+    if not policy["max_rows"] and not policy["monthly"]:
+        return target
+
+    registry = _get_shard_registry(*target)
+    period = _shard_period(policy)
+    with registry["lock"]:
+        if time.monotonic() - registry["loaded_at"] > SHARD_REGISTRY_TTL_SECONDS:
+            _load_shards(registry)
+        candidates = [shard for shard in registry["shards"] if shard["period"] == period]
+        if candidates and not _shard_full(candidates[-1], policy, incoming):
+            current = candidates[-1]
+            return current["spreadsheet_id"], current["worksheet_name"]
+
+        # 다른 프로세스가 먼저 새 샤드를 만들었을 수 있으니 레지스트리를 다시 읽고 확인한다.
+        _load_shards(registry)
+        candidates = [shard for shard in registry["shards"] if shard["period"] == period]
+        if candidates and not _shard_full(candidates[-1], policy, incoming):
+            current = candidates[-1]
+            return current["spreadsheet_id"], current["worksheet_name"]
+
+        spreadsheet_id = target[0]
+        name = _shard_name(target[1], period, len(candidates) + 1)
+        _open_worksheet(spreadsheet_id, name, create=True, cols=cols)
+        registry["worksheet"].append_row(
+            [target[1], spreadsheet_id, name, period, time.strftime("%Y-%m-%d %H:%M:%S")],
+            value_input_option="RAW",
+        )
+        registry["shards"].append({"spreadsheet_id": spreadsheet_id, "worksheet_name": name, "period": period})
+        return spreadsheet_id, name
+
+
+def list_sheet_shards() -> list[dict]:
+    """기본 워크시트와 rollover로 만든 샤드 목록 (오래된 순)."""
+    target = _sheet_target()
+    policy = _rollover_policy()
+    if not policy["max_rows"] and not policy["monthly"]:
+        return [{"spreadsheet_id": target[0], "worksheet_name": target[1], "period": ""}]
+    registry = _get_shard_registry(*target)
+    with registry["lock"]:
+        _load_shards(registry)
+        return [dict(shard) for shard in registry["shards"]]
+
+
+def read_sheet_records(periods: list[str] | None = None) -> list[dict]:
+    """모든 샤드(또는 period가 periods에 든 샤드)의 행을 병렬로 읽어 샤드 순서대로 합친다.
+
+    각 행에는 어느 워크시트에서 왔는지 "_shard" 키가 붙는다. 기본 워크시트의 period는 ""이다.
+    """
+    shards = [shard for shard in list_sheet_shards() if periods is None or shard["period"] in periods]
+
+    def read_shard(shard: dict) -> list[dict]:
+        state = _get_sheet_state(shard["spreadsheet_id"], shard["worksheet_name"])
+        records = state["worksheet"].get_all_records()
+        return [{**record, "_shard": shard["worksheet_name"]} for record in records]
+
+    if not shards:
+        return []
+    with ThreadPoolExecutor(max_workers=min(SHARD_READ_WORKERS, len(shards))) as pool:
+        results = list(pool.map(read_shard, shards))
+    return [record for records in results for record in records]
+
+
+# -------------------------
+# 로컬 outbox → 시트 dispatcher
+# -------------------------
+
+def _existing_submission_ids(target: tuple[str, str], submission_ids: list[str]) -> set[str]:
+    """응답을 받지 못한 이전 시도가 실제로는 반영됐을 수 있으므로, 시트에 이미 있는 submission_id를 찾는다.
+
+    이전 시도 뒤에 rollover가 일어났을 수 있으므로 현재 샤드와 바로 앞 샤드를 본다.
+    """
+    policy = _rollover_policy()
+    if not policy["max_rows"] and not policy["monthly"]:
+        shards = [target]
+    else:
+        registry = _get_shard_registry(*target)
+        with registry["lock"]:
+            shards = [(shard["spreadsheet_id"], shard["worksheet_name"]) for shard in registry["shards"][-2:]]
+
+    wanted = set(submission_ids)
+    found: set[str] = set()
+    for shard in shards:
+        state = _get_sheet_state(*shard)
+        with state["lock"]:
+            header = state["header"] if state["header"] is not None else _get_header_row(state["worksheet"])
+            if SUBMISSION_ID_COLUMN not in header:
+                continue
+            column = state["worksheet"].col_values(header.index(SUBMISSION_ID_COLUMN) + 1)
+        found.update(value for value in column if value in wanted)
+    return found
+
+
+def _may_have_applied(exc: Exception) -> bool:
+    """4xx(할당량 초과 포함)와 인증 실패는 시트가 요청을 거절한 것이므로 반영되지 않았다."""
+    if isinstance(exc, RefreshError):
+        return False
+    if isinstance(exc, gspread.exceptions.APIError):
+        return not 400 <= exc.code < 500
+    return True
+
+
+def _is_permanent_failure(exc: Exception) -> bool:
+    """다시 보내도 같은 결과일 4xx(셀 한도 초과, 잘못된 요청, 권한 없음 등).
+
+    할당량 초과(429), 인증 만료(401), 시트/워크시트를 찾지 못함(404)은 설정을 고치거나 기다리면 풀리므로 재시도한다.
+    """
+    if isinstance(exc, gspread.exceptions.APIError):
+        return 400 <= exc.code < 500 and exc.code not in (401, 404, 429)
+    return False
+
+
+def _record_failure(dispatcher: dict, submission_ids: list[str], exc: Exception, sending: bool) -> None:
+    error = f"{type(exc).__name__}: {exc}"
+    with dispatcher["lock"]:
+        if _is_permanent_failure(exc):
+            mark_failed(dispatcher["conn"], submission_ids, error)
+        else:
+            mark_retry(dispatcher["conn"], submission_ids, error, sending and _may_have_applied(exc))
+    dispatcher["error"] = str(exc)
+
+
+def _dispatch_one_by_one(dispatcher: dict, due: list[dict]) -> int:
+    """배치가 4xx로 거절되면 한 행 때문일 수 있으므로 한 행씩 다시 보내 거절된 행만 failed로 둔다."""
+    sent = 0
+    for item in due:
+        try:
+            _append_rows_with_handle_retry(dispatcher["target"], [item["row"]])
+        except Exception as exc:
+            _record_failure(dispatcher, [item["submission_id"]], exc, sending=True)
+            continue
+        with dispatcher["lock"]:
+            mark_sent(dispatcher["conn"], [item["submission_id"]])
+        sent += 1
+        dispatcher["batches"] += 1
+    dispatcher["sent"] += sent
+    return sent
+
+
+def _dispatch_due(dispatcher: dict) -> int:
+    """보낼 차례인 outbox 행을 한 배치 시트에 쓴다. 시트에 반영된(또는 이미 있던) 행 수를 돌려준다."""
+    target = dispatcher["target"]
+    with dispatcher["lock"]:
+        due = claim_due(dispatcher["conn"], target, dispatcher["batch_size"])
+    if not due:
+        return 0
+
+    # 응답을 받지 못한 이전 시도가 있었거나 이전 프로세스가 남긴 행은 시트에서 먼저 확인한다.
+    uncertain = [
+        item["submission_id"]
+        for item in due
+        if item["in_doubt"] or item["created_at"] < dispatcher["started_at"]
     ]
-    credentials = Credentials.from_service_account_info(
-        service_account_info,
-        scopes=scopes,
+    try:
+        existing = _existing_submission_ids(target, uncertain) if uncertain else set()
+    except Exception as exc:
+        _record_failure(dispatcher, [item["submission_id"] for item in due], exc, sending=False)
+        return 0
+
+    if existing:
+        with dispatcher["lock"]:
+            mark_sent(dispatcher["conn"], sorted(existing))
+        dispatcher["sent"] += len(existing)
+    fresh = [item for item in due if item["submission_id"] not in existing]
+    if not fresh:
+        dispatcher["error"] = None
+        return len(existing)
+
+    fresh_ids = [item["submission_id"] for item in fresh]
+    try:
+        _append_rows_with_handle_retry(target, [item["row"] for item in fresh])
+    except Exception as exc:
+        if len(fresh) > 1 and _is_permanent_failure(exc):
+            return len(existing) + _dispatch_one_by_one(dispatcher, fresh)
+        _record_failure(dispatcher, fresh_ids, exc, sending=True)
+        return len(existing)
+
+    with dispatcher["lock"]:
+        mark_sent(dispatcher["conn"], fresh_ids)
+    dispatcher["sent"] += len(fresh_ids)
+    dispatcher["batches"] += 1
+    dispatcher["error"] = None
+    return len(due)
+
+
+def _wait_for_batch(dispatcher: dict) -> None:
+    """다음 보낼 행이 생길 때까지 기다리고, 새 제출이면 배치가 차거나 flush 간격이 지날 때까지 더 모은다."""
+    wake = dispatcher["wake"]
+    with dispatcher["lock"]:
+        due_at = next_due_at(dispatcher["conn"], dispatcher["target"])
+    timeout = DISPATCH_IDLE_SECONDS if due_at is None else min(max(due_at - time.time(), 0.0), DISPATCH_IDLE_SECONDS)
+    if timeout > 0 and not wake.wait(timeout):
+        return
+
+    deadline = time.monotonic() + dispatcher["flush_interval"]
+    while True:
+        with dispatcher["lock"]:
+            if dispatcher["queued"] >= dispatcher["batch_size"]:
+                break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        wake.clear()
+        wake.wait(remaining)
+    with dispatcher["lock"]:
+        # 잠금 안에서 비워야 enqueue_row_to_sheet가 올린 값을 잃지 않는다.
+        wake.clear()
+        dispatcher["queued"] = 0
+
+
+def _dispatch_loop(dispatcher: dict) -> None:
+    with dispatcher["lock"]:
+        purge_sent(dispatcher["conn"])
+    while True:
+        try:
+            _wait_for_batch(dispatcher)
+            while _dispatch_due(dispatcher) == dispatcher["batch_size"]:
+                pass
+        except Exception as exc:
+            # outbox 자체 오류(디스크 등)로 스레드가 죽지 않게 하고 잠시 뒤 다시 시도한다.
+            dispatcher["error"] = str(exc)
+            time.sleep(WRITE_FLUSH_INTERVAL_SECONDS)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_sheet_dispatcher(spreadsheet_id: str, worksheet_name: str) -> dict:
+    """워크시트마다 하나씩 두는 outbox 연결과 dispatcher 스레드. 모든 세션이 함께 쓴다."""
+    dispatcher = {
+        "target": (spreadsheet_id, worksheet_name),
+        "conn": connect_outbox(),
+        "lock": threading.Lock(),
+        "wake": threading.Event(),
+        "queued": 0,
+        "batch_size": WRITE_BATCH_SIZE,
+        "flush_interval": WRITE_FLUSH_INTERVAL_SECONDS,
+        "started_at": time.time(),
+        "sent": 0,
+        "batches": 0,
+        "error": None,
+    }
+    dispatcher["thread"] = threading.Thread(
+        target=_dispatch_loop,
+        args=(dispatcher,),
+        name="kirbs-sheet-dispatcher",
+        daemon=True,
     )
-    client = gspread.authorize(credentials)
-    sheet = client.open_by_key(spreadsheet_id)
-    worksheet = sheet.worksheet(worksheet_name)
+    dispatcher["thread"].start()
+    return dispatcher
+
+
+def start_sheet_dispatcher() -> bool:
+    """앱 시작 시 호출해 이전 프로세스가 outbox에 남긴 제출도 보내게 한다. 시트 설정이 없으면 False."""
+    try:
+        target = _sheet_target()
+    except (KeyError, FileNotFoundError):
+        return False
+    _get_sheet_dispatcher(*target)
+    return True
+
+
+def enqueue_row_to_sheet(submission_id: str, wide_row: dict) -> bool:
+    """제출 행을 로컬 outbox에 커밋하고 dispatcher를 깨운다. 이미 같은 submission_id가 있으면 False.
+
+    함수가 반환되면 응답은 디스크에 남아 있고, 시트 반영 여부는 get_submission_status로 확인한다.
+    """
+    dispatcher = _get_sheet_dispatcher(*_sheet_target())
+    row = {**wide_row, SUBMISSION_ID_COLUMN: submission_id}
+    with dispatcher["lock"]:
+        added = add_submission(dispatcher["conn"], submission_id, dispatcher["target"], row)
+        if added:
+            dispatcher["queued"] += 1
+    if added:
+        dispatcher["wake"].set()
+    return added
+
 
-    header = _ensure_header(worksheet, wide_row.keys())
-    values = [wide_row.get(col, "") for col in header]
-    worksheet.append_row(values, value_input_option="RAW")
+def get_submission_status(submission_id: str) -> dict | None:
+    """outbox 상태("pending"/"sending"/"sent"/"failed"), 시도 횟수, 마지막 오류. outbox에 없으면 None."""
+    dispatcher = _get_sheet_dispatcher(*_sheet_target())
+    with dispatcher["lock"]:
+        return submission_status(dispatcher["conn"], submission_id)
@@ -0,0 +1,133 @@
+from datetime import datetime
+import threading
+import time
+
+import streamlit as st
+
+from gcp_storage import read_sheet_records
+from kirbsplus_questions import QUESTIONS
+from response_lake import backfill_from_sheet_records
+from survey_analytics import (
+    category_summary,
+    new_analytics_state,
+    overall_satisfaction,
+    question_summary,
+    refresh_analytics,
+    reset_analytics,
+)
+
+st.set_page_config(page_title="사용성 평가 결과", layout="wide")
+
+# 응답 레이크를 다시 읽는 최소 간격. 그 사이 rerun은 메모리의 누적 집계만 그린다.
+REFRESH_INTERVAL_SECONDS = 30.0
+
+
+@st.cache_resource(show_spinner=False)
+def get_analytics_state() -> dict:
+    """프로세스 전체가 공유하는 누적 집계. 모든 대시보드 세션이 같은 집계를 본다."""
+    return new_analytics_state()
+
+
+@st.cache_resource(show_spinner=False)
+def get_sheet_sync() -> dict:
+    """결과 시트 → 응답 레이크 백필 상태. 프로세스당 한 번, 그리고 새로고침 버튼을 누를 때 시트를 다시 읽는다."""
+    return {"synced_at": None, "attempted_at": None, "added": 0, "lock": threading.Lock()}
+
+
+def ensure_sheet_synced(sync: dict, state: dict, force: bool = False) -> None:
+    """레이크에 없는 시트 제출(레이크 도입 전 이력, 다른 서버 제출)을 submission_id 기준으로 채운다."""
+    with sync["lock"]:
+        attempted_at = sync["attempted_at"]
+        retry_due = attempted_at is None or time.time() - attempted_at >= REFRESH_INTERVAL_SECONDS
+        if not force and (sync["synced_at"] is not None or not retry_due):
+            return
+        sync["attempted_at"] = time.time()
+        added = backfill_from_sheet_records(read_sheet_records(), QUESTIONS)
+        sync["synced_at"] = time.time()
+        sync["added"] += added
+    if added:
+        # 채운 제출은 워터마크보다 오래된 시각일 수 있으므로 레이크 전체를 다시 센다.
+        reset_analytics(state)
+
+
+def ensure_fresh(state: dict, force: bool = False) -> None:
+    refreshed_at = state["refreshed_at"]
+    if force or refreshed_at is None or time.time() - refreshed_at >= REFRESH_INTERVAL_SECONDS:
+        refresh_analytics(state)
+
+
+state = get_analytics_state()
+sheet_sync = get_sheet_sync()
+
+# -------------------------
+# 1) 헤더
+# -------------------------
+st.title("사용성 평가 결과 (KIRBSPLUS)")
+
+col_caption, col_refresh = st.columns([6, 1])
+with col_refresh:
+    force_refresh = st.button("새로고침")
+try:
+    ensure_sheet_synced(sheet_sync, state, force=force_refresh)
+except Exception as exc:
+    st.warning(f"결과 시트를 읽지 못해 이 서버의 응답 레이크만 집계합니다: {exc}")
+try:
+    ensure_fresh(state, force=force_refresh)
+except Exception as exc:
+    st.warning(f"응답을 불러오지 못했습니다. 이전 집계를 표시합니다: {exc}")
+
+with col_caption:
+    refreshed = datetime.fromtimestamp(state["refreshed_at"]).strftime("%Y-%m-%d %H:%M:%S") if state["refreshed_at"] else "-"
+    st.caption(f"마지막 갱신: {refreshed} · {int(REFRESH_INTERVAL_SECONDS)}초마다 새 제출만 불러옵니다.")
+    if sheet_sync["synced_at"] is not None:
+        synced = datetime.fromtimestamp(sheet_sync["synced_at"]).strftime("%Y-%m-%d %H:%M:%S")
+        st.caption(
+            f"집계 범위: 결과 시트의 {synced}까지 제출(이 서버 레이크에 없던 {sheet_sync['added']:,}건 포함) "
+            "+ 그 이후 이 서버에 들어온 제출. 다른 서버의 새 제출은 새로고침을 눌러야 반영됩니다."
+        )
+    else:
+        st.caption("집계 범위: 이 서버의 응답 레이크에 저장된 제출만 (결과 시트 이력 미포함).")
+
+if not state["submissions"]:
+    st.info("아직 제출된 응답이 없습니다.")
+    st.stop()
+
+# -------------------------
+# 2) 요약 지표
+# -------------------------
+categories = category_summary(state)
+mean_satisfaction = overall_satisfaction(state)
+
+metric_cols = st.columns(3)
+metric_cols[0].metric("제출 수", f"{state['submissions']:,}")
+metric_cols[1].metric("평균 만족도", f"{mean_satisfaction:.2f}" if mean_satisfaction is not None else "-")
+metric_cols[2].metric("마지막 제출", state["watermark"].strftime("%Y-%m-%d %H:%M") if state["watermark"] is not None else "-")
+
+# -------------------------
+# 3) 분류별 결과
+# -------------------------
+st.subheader("분류별 결과")
+st.bar_chart(categories.set_index("분류")["평균 만족도"], horizontal=True)
+st.dataframe(
+    categories,
+    hide_index=True,
+    column_config={
+        "Y 비율": st.column_config.NumberColumn(format="percent"),
+        "평균 만족도": st.column_config.NumberColumn(format="%.2f"),
+    },
+)
+
+# -------------------------
+# 4) 문항별 결과
+# -------------------------
+st.subheader("문항별 결과")
+selected = st.selectbox("분류", options=["전체"] + categories["분류"].tolist())
+questions = question_summary(state, None if selected == "전체" else selected)
+st.dataframe(
+    questions,
+    hide_index=True,
+    column_config={
+        "Y 비율": st.column_config.NumberColumn(format="percent"),
+        "평균 만족도": st.column_config.NumberColumn(format="%.2f"),
+    },
+)
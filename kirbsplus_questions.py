@@ -0,0 +1,56 @@
+"""
+KIRBSPLUS 사용성 평가 설문 문항
+
+kirbsplus_ut(설문 화면)와 response_lake 시트 백필이 같은 문항 정의를 쓰도록 따로 둔다.
+문항번호는 QUESTIONS의 순서(1부터)이며 시트의 Q{번호}_* 컬럼과 대응한다. 순서를 바꾸면 기존 응답과 어긋난다.
+"""
+
+QUESTIONS = [
+    # 기본탐색
+    {"category": "기본탐색", "sub": "", "item": "메뉴 구조가 직관적으로 구성되어 있는가?"},
+    {"category": "기본탐색", "sub": "", "item": "검색 기능이 키워드 기반으로 정확하게 작동하는가?"},
+    {"category": "기본탐색", "sub": "", "item": "FAQ, 고객센터 등 사용자 지원 채널이 작동하고 있는가?"},
+    # UI 및 반응형
+    {"category": "사용자 인터페이스(UI) 및 반응형 디자인", "sub": "", "item": "디자인 컬러가 연구소의 신뢰성과 접근성을 반영하는가?"},
+    {"category": "사용자 인터페이스(UI) 및 반응형 디자인", "sub": "", "item": "사용자가 현재 접속한 페이지를 명확히 인식할 수 있는가?"},
+    # 기술적 성능
+    {"category": "기술적 성능", "sub": "", "item": "로딩 속도, 이미지 출력 속도가 적절한가?"},
+    {"category": "기술적 성능", "sub": "", "item": "링크 오류, 기능 오류 등 기술적 문제 없이 원활하게 작동하는가?"},
+    # 회원 > 회원가입
+    {"category": "회원", "sub": "회원 가입", "item": "회원가입/로그인 과정이 원활하게 진행되며 개인/기관 유형별로 구분 가능한가?"},
+    {"category": "회원", "sub": "회원 가입", "item": "구매 자격 확인 기능이 명확히 작동하고, 승인 후 구매 가능 여부가 안내되어 있는가?"},
+    {"category": "회원", "sub": "회원 가입", "item": "학위증, 자격증명서, 교육이수증 등 자료의 업로드가 가능한가? (임의 예시 이미지 파일 업로드 진행)"},
+    # 회원 > 마이페이지 > 대시보드
+    {"category": "회원", "sub": "마이페이지 > 대시보드", "item": "이름 및 회원 등급이 잘 표시되어 있는가?"},
+    {"category": "회원", "sub": "마이페이지 > 대시보드", "item": "대시보드의 정보의 확인이 가능한가?"},
+    # 회원 > 마이페이지 > 회원정보수정
+    {"category": "회원", "sub": "마이페이지 > 회원 정보 수정", "item": "학위증, 자격증명서, 교육이수증 등이 회원정보 수정 창에서 삭제 및 재업로드가 가능한가? (예시 이미지로 삭제 후 재업로드 진행)"},
+    # 구매 > 심리검사 > 상품정보
+    {"category": "구매", "sub": "심리검사 > 상품 정보", "item": "검사, 교육 콘텐츠 등의 정보가 명확하게 표시되어 있는가?"},
+    {"category": "구매", "sub": "심리검사 > 상품 정보", "item": "상세 정보에 있는 버튼의 기능은 작동하는가? (결과지 sample, 검사 목적, 특징 등)"},
+    # 구매 > 구매
+    {"category": "구매", "sub": "구매", "item": "상품 구매가 가능한가? (테스트를 위해 최소 2건의 검사를 구매)"},
+    {"category": "구매", "sub": "구매", "item": "구매 후 마이페이지에서 주문 내역 확인이 가능한가?"},
+    # 검사 관리
+    {"category": "검사 관리", "sub": "마이페이지 검사관리", "item": "검사 관리 페이지에서 구매한 검사 내역 확인이 가능한가?"},
+    {"category": "검사 관리", "sub": "코드 발송", "item": "검사 실시 버튼으로 바로 검사 진행이 가능한가?"},
+    {"category": "검사 관리", "sub": "코드 발송", "item": "코드 발송을 통해 온라인 코드 발송이 가능한가? (코드 발송은 이메일 발송으로 진행)"},
+    {"category": "검사 관리", "sub": "코드 발송", "item": "발송된 코드로 접속하여 검사 진행이 가능한가?"},
+    {"category": "검사 관리", "sub": "검사 실시", "item": "검사 진행 과정이 단계별로 명확하게 안내되어 있는가?"},
+    {"category": "검사 관리", "sub": "검사 실시", "item": "결과지 및 보고서 확인, 다운로드 기능이 문제 없이 제공되는가?"},
+    {"category": "검사 관리", "sub": "결과 확인", "item": "완료된 검사의 결과를 마이페이지 - 검사 관리 - 검사 결과 탭에서 확인 가능한가?"},
+    {"category": "검사 관리", "sub": "결과 확인", "item": "결과화면, 결과지 등이 시각적으로 이해하기 쉽게 구성되어 있는가?"},
+    {"category": "검사 관리", "sub": "결과 확인", "item": "검사 결과의 다운로드(엑셀, pdf)가 가능하며 재확인이 되는가?"},
+    # 테스타리움
+    {"category": "테스타리움", "sub": "", "item": "테스타리움 무료 검사 진행이 가능한가?"},
+]
+
+CATEGORY_ORDER = [
+    "기본탐색",
+    "사용자 인터페이스(UI) 및 반응형 디자인",
+    "기술적 성능",
+    "회원",
+    "구매",
+    "검사 관리",
+    "테스타리움",
+]
@@ -1,65 +1,22 @@
 from datetime import datetime
 from uuid import uuid4
+import logging
 
 import pandas as pd
 import streamlit as st
 
-from gcp_storage import append_one_row_to_sheet
+from gcp_storage import enqueue_row_to_sheet, get_submission_status, start_sheet_dispatcher
+from kirbsplus_questions import CATEGORY_ORDER, QUESTIONS
+from response_lake import append_submission_to_lake
 
 st.set_page_config(page_title="사용성 평가 설문", layout="wide")
 
+# 이전 프로세스가 outbox에 남긴 제출도 시트로 보내도록 dispatcher를 먼저 띄운다.
+start_sheet_dispatcher()
+
 # -------------------------
-# 1) 설문 문항 정의
+# 1) 설문 문항 정의 (kirbsplus_questions.py)
 # -------------------------
-QUESTIONS = [
-    # 기본탐색
-    {"category": "기본탐색", "sub": "", "item": "메뉴 구조가 직관적으로 구성되어 있는가?"},
-    {"category": "기본탐색", "sub": "", "item": "검색 기능이 키워드 기반으로 정확하게 작동하는가?"},
-    {"category": "기본탐색", "sub": "", "item": "FAQ, 고객센터 등 사용자 지원 채널이 작동하고 있는가?"},
-    # UI 및 반응형
-    {"category": "사용자 인터페이스(UI) 및 반응형 디자인", "sub": "", "item": "디자인 컬러가 연구소의 신뢰성과 접근성을 반영하는가?"},
-    {"category": "사용자 인터페이스(UI) 및 반응형 디자인", "sub": "", "item": "사용자가 현재 접속한 페이지를 명확히 인식할 수 있는가?"},
-    # 기술적 성능
-    {"category": "기술적 성능", "sub": "", "item": "로딩 속도, 이미지 출력 속도가 적절한가?"},
-    {"category": "기술적 성능", "sub": "", "item": "링크 오류, 기능 오류 등 기술적 문제 없이 원활하게 작동하는가?"},
-    # 회원 > 회원가입
-    {"category": "회원", "sub": "회원 가입", "item": "회원가입/로그인 과정이 원활하게 진행되며 개인/기관 유형별로 구분 가능한가?"},
-    {"category": "회원", "sub": "회원 가입", "item": "구매 자격 확인 기능이 명확히 작동하고, 승인 후 구매 가능 여부가 안내되어 있는가?"},
-    {"category": "회원", "sub": "회원 가입", "item": "학위증, 자격증명서, 교육이수증 등 자료의 업로드가 가능한가? (임의 예시 이미지 파일 업로드 진행)"},
-    # 회원 > 마이페이지 > 대시보드
-    {"category": "회원", "sub": "마이페이지 > 대시보드", "item": "이름 및 회원 등급이 잘 표시되어 있는가?"},
-    {"category": "회원", "sub": "마이페이지 > 대시보드", "item": "대시보드의 정보의 확인이 가능한가?"},
-    # 회원 > 마이페이지 > 회원정보수정
-    {"category": "회원", "sub": "마이페이지 > 회원 정보 수정", "item": "학위증, 자격증명서, 교육이수증 등이 회원정보 수정 창에서 삭제 및 재업로드가 가능한가? (예시 이미지로 삭제 후 재업로드 진행)"},
-    # 구매 > 심리검사 > 상품정보
-    {"category": "구매", "sub": "심리검사 > 상품 정보", "item": "검사, 교육 콘텐츠 등의 정보가 명확하게 표시되어 있는가?"},
-    {"category": "구매", "sub": "심리검사 > 상품 정보", "item": "상세 정보에 있는 버튼의 기능은 작동하는가? (결과지 sample, 검사 목적, 특징 등)"},
-    # 구매 > 구매
-    {"category": "구매", "sub": "구매", "item": "상품 구매가 가능한가? (테스트를 위해 최소 2건의 검사를 구매)"},
-    {"category": "구매", "sub": "구매", "item": "구매 후 마이페이지에서 주문 내역 확인이 가능한가?"},
-    # 검사 관리
-    {"category": "검사 관리", "sub": "마이페이지 검사관리", "item": "검사 관리 페이지에서 구매한 검사 내역 확인이 가능한가?"},
-    {"category": "검사 관리", "sub": "코드 발송", "item": "검사 실시 버튼으로 바로 검사 진행이 가능한가?"},
-    {"category": "검사 관리", "sub": "코드 발송", "item": "코드 발송을 통해 온라인 코드 발송이 가능한가? (코드 발송은 이메일 발송으로 진행)"},
-    {"category": "검사 관리", "sub": "코드 발송", "item": "발송된 코드로 접속하여 검사 진행이 가능한가?"},
-    {"category": "검사 관리", "sub": "검사 실시", "item": "검사 진행 과정이 단계별로 명확하게 안내되어 있는가?"},
-    {"category": "검사 관리", "sub": "검사 실시", "item": "결과지 및 보고서 확인, 다운로드 기능이 문제 없이 제공되는가?"},
-    {"category": "검사 관리", "sub": "결과 확인", "item": "완료된 검사의 결과를 마이페이지 - 검사 관리 - 검사 결과 탭에서 확인 가능한가?"},
-    {"category": "검사 관리", "sub": "결과 확인", "item": "결과화면, 결과지 등이 시각적으로 이해하기 쉽게 구성되어 있는가?"},
-    {"category": "검사 관리", "sub": "결과 확인", "item": "검사 결과의 다운로드(엑셀, pdf)가 가능하며 재확인이 되는가?"},
-    # 테스타리움
-    {"category": "테스타리움", "sub": "", "item": "테스타리움 무료 검사 진행이 가능한가?"},
-]
-
-CATEGORY_ORDER = [
-    "기본탐색",
-    "사용자 인터페이스(UI) 및 반응형 디자인",
-    "기술적 성능",
-    "회원",
-    "구매",
-    "검사 관리",
-    "테스타리움",
-]
 
 # -------------------------
 # 2) 세션 상태 초기화
@@ -69,12 +26,17 @@ def qkey(i: int) -> str:
     return f"q_{i:03d}"
 
 
+@st.cache_resource(show_spinner=False)
+def get_category_indices() -> dict[str, list[int]]:
+    """분류별 문항 인덱스. 프로세스에서 한 번만 만들고 rerun마다 QUESTIONS 전체를 훑지 않는다."""
+    indices: dict[str, list[int]] = {category: [] for category in CATEGORY_ORDER}
+    for idx, q in enumerate(QUESTIONS):
+        indices.setdefault(q["category"], []).append(idx)
+    return indices
+
+
 def init_question_defaults(i: int) -> None:
     base = qkey(i)
-    sat_key = f"{base}_sat"
-    func_key = f"{base}_func"
-    imp_key = f"{base}_imp"
-    cmt_key = f"{base}_cmt"
     responses = st.session_state.setdefault("responses", {})
     response = responses.setdefault(
         base,
@@ -86,31 +48,37 @@ def init_question_defaults(i: int) -> None:
         },
     )
 
-    if func_key in st.session_state:
-        func_val = st.session_state.get(func_key)
-        response["functionality"] = func_val if func_val in ("Y", "N") else None
-    if sat_key in st.session_state:
-        sat = st.session_state.get(sat_key)
-        response["satisfaction"] = int(sat) if sat is not None else None
+    # 다른 페이지로 넘어가며 정리된 위젯 값은 응답 dict에서 되살린다.
+    for suffix, field in (("func", "functionality"), ("sat", "satisfaction"), ("imp", "improvement"), ("cmt", "comment")):
+        widget_key = f"{base}_{suffix}"
+        if widget_key not in st.session_state:
+            st.session_state[widget_key] = response[field]
+
 
-    st.session_state[imp_key] = st.session_state.get(imp_key, "")
-    st.session_state[cmt_key] = st.session_state.get(cmt_key, "")
+def ensure_category_state(category: str) -> list[int]:
+    """현재 페이지 분류의 문항 상태만 준비한다. 처음 보는 분류는 이때 응답 dict가 만들어진다."""
+    indices = get_category_indices()[category]
+    for i in indices:
+        init_question_defaults(i)
+    return indices
 
-    response["improvement"] = st.session_state.get(imp_key, "")
-    response["comment"] = st.session_state.get(cmt_key, "")
+
+def update_missing(i: int, response: dict) -> None:
+    missing = st.session_state["missing_questions"]
+    if response.get("functionality") is None or response.get("satisfaction") is None:
+        missing.add(i)
+    else:
+        missing.discard(i)
 
 
 def get_missing(question_indices: list[int]) -> list[int]:
-    missing: list[int] = []
-    responses = st.session_state.get("responses", {})
-    for i in question_indices:
-        base = qkey(i)
-        response = responses.get(base, {})
-        func_val = response.get("functionality")
-        sat_val = response.get("satisfaction")
-        if func_val is None or sat_val is None:
-            missing.append(i + 1)
-    return missing
+    """question_indices 중 필수 응답(기능 여부, 만족도)이 빠진 문항 번호(1부터)."""
+    missing = st.session_state["missing_questions"]
+    return [i + 1 for i in question_indices if i in missing]
+
+
+def get_all_missing() -> list[int]:
+    return sorted(i + 1 for i in st.session_state["missing_questions"])
 
 
 if "step_idx" not in st.session_state:
@@ -125,8 +93,9 @@ if "submitted" not in st.session_state:
 if "respondent_id" not in st.session_state:
     st.session_state["respondent_id"] = str(uuid4())
 
-for i in range(len(QUESTIONS)):
-    init_question_defaults(i)
+# 아직 보지 않은 분류의 문항은 모두 미응답이다. 화면에 보이는 문항만 rerun마다 갱신한다.
+if "missing_questions" not in st.session_state:
+    st.session_state["missing_questions"] = set(range(len(QUESTIONS)))
 
 # -------------------------
 # 3) UI 헤더
@@ -150,6 +119,7 @@ with st.sidebar:
                 for suffix in ("func", "sat", "imp", "cmt"):
                     st.session_state.pop(f"{base}_{suffix}", None)
             st.session_state["responses"] = {}
+            st.session_state.pop("missing_questions", None)
             st.session_state["step_idx"] = 0
             st.session_state["submission_complete"] = False
             st.session_state["submitted"] = False
@@ -157,6 +127,7 @@ with st.sidebar:
             st.session_state.pop("last_submission_id", None)
             st.session_state.pop("last_submission_ts", None)
             st.session_state.pop("submission_csv", None)
+            st.session_state.pop("sheet_settled", None)
             st.success("응답이 초기화되었습니다.")
             st.rerun()
         else:
@@ -166,7 +137,8 @@ with st.sidebar:
 # 4) 현재 분류 문항 필터
 # -------------------------
 current_category = CATEGORY_ORDER[st.session_state["step_idx"]]
-filtered = [(idx, q) for idx, q in enumerate(QUESTIONS) if q["category"] == current_category]
+current_indices = ensure_category_state(current_category)
+filtered = [(idx, QUESTIONS[idx]) for idx in current_indices]
 
 # -------------------------
 # 5) 문항 렌더링
@@ -211,6 +183,7 @@ for idx, q in filtered:
     responses["satisfaction"] = int(sat) if sat is not None else None
     responses["improvement"] = (st.session_state.get(f"{base}_imp") or "").strip()
     responses["comment"] = (st.session_state.get(f"{base}_cmt") or "").strip()
+    update_missing(idx, responses)
 
 # -------------------------
 # 6) 검증 및 제출
@@ -221,7 +194,7 @@ def handle_submit() -> None:
         st.info("이미 제출되었습니다. 새 제출을 위해 응답을 초기화하세요.")
         return
 
-    all_missing = get_missing(list(range(len(QUESTIONS))))
+    all_missing = get_all_missing()
     if all_missing:
         missing_list = ", ".join(map(str, all_missing))
         first_missing_idx = all_missing[0] - 1
@@ -274,14 +247,52 @@ def handle_submit() -> None:
     st.session_state["submission_complete"] = True
     st.session_state["submission_csv"] = df.to_csv(index=False, encoding="utf-8-sig").encode("utf-8-sig")
 
+    # 로컬 outbox에 커밋되면 제출 완료로 본다. 시트 전송은 dispatcher가 배치/재시도로 처리한다.
     try:
-        append_one_row_to_sheet(wide_row)
-        st.session_state["submitted"] = True
-        st.session_state["last_submission_ts"] = timestamp
-        st.session_state["last_submission_id"] = submission_id
-        st.success("저장 완료")
+        enqueue_row_to_sheet(submission_id, wide_row)
     except Exception as exc:
         st.warning(f"저장 실패, 연구사업부로 알려주세요: {exc}")
+        return
+    st.session_state["submitted"] = True
+    st.session_state["last_submission_ts"] = timestamp
+    st.session_state["last_submission_id"] = submission_id
+    st.session_state["sheet_settled"] = False
+
+    # 분석용 long 포맷 사본. 원본은 outbox/시트에 있으므로 실패해도 제출은 유지하고 로그만 남긴다.
+    try:
+        append_submission_to_lake(submission_id, respondent_id, rows)
+    except Exception:
+        logging.getLogger(__name__).exception("응답 레이크 저장 실패: %s", submission_id)
+
+
+SUBMISSION_POLL_SECONDS = 2.0
+
+
+def render_submission_status(polling: bool) -> None:
+    status = get_submission_status(st.session_state["last_submission_id"])
+    if status is None:
+        return
+
+    if status["status"] in ("sent", "failed") and polling:
+        # 시트 반영이 끝났거나 전송을 멈췄으면 전체 rerun으로 폴링 fragment를 멈춘다.
+        st.session_state["sheet_settled"] = True
+        st.rerun()
+
+    if status["status"] == "sent":
+        st.success("저장 완료")
+        return
+
+    if status["status"] == "failed":
+        st.warning(
+            "응답은 저장되었지만 결과 시트로 전송하지 못했습니다. "
+            f"연구사업부로 알려주세요 (제출 번호 {st.session_state['last_submission_id']})."
+        )
+        st.caption(f"오류: {status['last_error']}")
+        return
+
+    st.success("응답이 저장되었습니다. 결과 시트로 전송하는 중입니다.")
+    if status["attempts"]:
+        st.caption(f"시트 연결이 원활하지 않아 자동으로 다시 시도합니다 ({status['attempts']}회): {status['last_error']}")
 
 
 st.divider()
@@ -300,7 +311,6 @@ with col_right:
             handle_submit()
     else:
         if st.button("다음", type="primary"):
-            current_indices = [idx for idx, _ in filtered]
             missing = get_missing(current_indices)
             if missing:
                 missing_list = ", ".join(map(str, missing))
@@ -309,4 +319,9 @@ with col_right:
                 st.session_state["step_idx"] += 1
                 st.rerun()
 
-
+# 시트 반영(또는 전송 실패)이 정해질 때까지만 fragment로 주기적으로 outbox 상태를 확인한다.
+if st.session_state.get("submitted") and st.session_state.get("last_submission_id"):
+    if st.session_state.get("sheet_settled"):
+        render_submission_status(polling=False)
+    else:
+        st.fragment(render_submission_status, run_every=SUBMISSION_POLL_SECONDS)(polling=True)
@@ -0,0 +1,421 @@
+"""
+Streamlit 앱 헤드리스 다중 세션 부하 테스트
+
+목적:
+- 한 노드가 동시에 감당할 수 있는 검사자/검색 사용자 수를 가늠하기 위해,
+  streamlit.testing.v1.AppTest로 N개의 가상 세션을 실제 화면 흐름대로 진행시킨다.
+- 대상: career_demo/search.py(검색 → 상세), phq_9.py, gad_7.py(동의 → 인적사항 → 설문 → 결과),
+  cognitive_arcade 결과 화면.
+- 외부 의존성은 스텁으로 바꾼다.
+  · utils.database.Database  : 메모리에만 기록하고 --db-latency-ms 만큼 대기
+  · sentence_transformers    : 텍스트 해시로 만든 고정 단위 벡터를 돌려주는 가짜 모델
+  실제 DB/모델 성능이 아니라 앱 자체의 rerun 비용을 재는 것이 목적이다.
+
+측정 방식:
+- 워커 프로세스(--workers)들이 동시에 세션을 진행한다. AppTest는 전역 Runtime을 쓰기 때문에
+  한 프로세스 안에서 스레드로 여러 세션을 동시에 돌릴 수 없어, 동시성은 프로세스 수로 만든다.
+  같은 워커의 세션끼리는 Streamlit 서버처럼 st.cache_data / st.cache_resource를 공유한다.
+- rerun 지연 시간: 세션의 각 단계(AppTest.run 1회)마다 벽시계 시간을 잰다. 앱/단계별 p50/p90/p99/max.
+- CPU 시간: 세션 전후 process_time 증가분 (워커는 세션을 하나씩 진행하므로 세션별 값이다).
+- 메모리: 세션 전후 RSS 증가분과 워커별 최종 RSS.
+  각 워커에서 앱별 첫 세션은 캐시가 비어 있으므로 cold로 따로 집계한다.
+
+실행 예:
+   python load_test.py
+   python load_test.py --apps search phq9 --sessions 40 --workers 4
+   python load_test.py --sessions 20 --json load_test_report.json
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import threading
+import time
+import types
+import zlib
+
+import numpy as np
+
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_TIMEOUT_SEC = 120
+STUB_EMBEDDING_DIM = 768
+
+APP_FILES = {
+    "search": BASE_DIR / "career_demo" / "search.py",
+    "phq9": BASE_DIR / "phq_9.py",
+    "gad7": BASE_DIR / "gad_7.py",
+    "arcade_result": BASE_DIR / "cognitive_arcade" / "kirbs_cognitive_condition_battery.py",
+}
+
+SEARCH_QUERIES = [
+    "컴퓨터와 관련된 일",
+    "사람을 돕는 직업",
+    "디자인 감각이 필요한 직업",
+    "환경 문제를 다루는 일",
+    "소프트웨어",
+    "간호",
+]
+
+EXAMINEE = {
+    "name": "부하테스트",
+    "gender": "응답하지 않음",
+    "age": "30",
+    "region": "수도권",
+    "phone": "010-0000-0000",
+    "email": "load@test.local",
+}
+
+
+# -----------------------------
+# Stub backends
+# -----------------------------
+STUB_DB_RECORDS: list[dict] = []
+_STUB_DB_LOCK = threading.Lock()
+
+
+def install_stub_backends(db_latency_ms: float) -> None:
+    """앱이 import하기 전에 sys.modules에 가짜 DB/모델 모듈을 넣는다."""
+    os.environ["ENABLE_DB_INSERT"] = "true"
+
+    class Database:
+        def insert(self, exam_data: dict) -> None:
+            if db_latency_ms > 0:
+                time.sleep(db_latency_ms / 1000.0)
+            with _STUB_DB_LOCK:
+                STUB_DB_RECORDS.append(exam_data)
+
+    database_module = types.ModuleType("utils.database")
+    database_module.Database = Database
+    utils_module = types.ModuleType("utils")
+    utils_module.database = database_module
+    sys.modules["utils"] = utils_module
+    sys.modules["utils.database"] = database_module
+
+    class SentenceTransformer:
+        def __init__(self, model_name: str, *args, **kwargs):
+            self.model_name = model_name
+
+        def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True, **kwargs):
+            vectors = []
+            for text in texts:
+                rng = np.random.default_rng(zlib.crc32(str(text).encode("utf-8")))
+                vector = rng.standard_normal(STUB_EMBEDDING_DIM).astype(np.float32)
+                if normalize_embeddings:
+                    vector /= np.linalg.norm(vector)
+                vectors.append(vector)
+            return np.vstack(vectors)
+
+    model_module = types.ModuleType("sentence_transformers")
+    model_module.SentenceTransformer = SentenceTransformer
+    sys.modules["sentence_transformers"] = model_module
+
+
+# -----------------------------
+# Scenario steps
+# -----------------------------
+def click_button(at, label: str, optional: bool = False) -> None:
+    """라벨(또는 접두어)이 맞는 첫 버튼을 누른다. optional이면 없거나 비활성일 때 그냥 rerun한다."""
+    for button in at.button:
+        if button.label == label or button.label.startswith(label):
+            if optional and button.disabled:
+                return
+            button.click()
+            return
+    if not optional:
+        raise LookupError(f"버튼을 찾지 못했습니다: {label}")
+
+
+def set_state(**values):
+    def action(at) -> None:
+        for key, value in values.items():
+            at.session_state[key] = value
+    return action
+
+
+def search_steps(session_no: int) -> list[tuple[str, object]]:
+    query = SEARCH_QUERIES[session_no % len(SEARCH_QUERIES)]
+    return [
+        ("main", None),
+        ("search", set_state(search_input=query, committed_query=query, trigger_ai_search=False)),
+        ("next_page", lambda at: click_button(at, "→", optional=True)),
+        ("open_detail", lambda at: click_button(at, "상세 보기")),
+        ("back_to_list", lambda at: click_button(at, "← 목록으로")),
+    ]
+
+
+def phq9_steps(session_no: int) -> list[tuple[str, object]]:
+    labels = ["전혀 아님", "며칠 동안", "절반 이상", "거의 매일"]
+    answers = {i: labels[(session_no + i) % len(labels)] for i in range(1, 10)}
+    examinee = dict(EXAMINEE, user_id=f"load-{session_no}")
+    return [
+        ("intro", None),
+        ("examinee", set_state(consent=True, page="examinee")),
+        ("survey", set_state(examinee=examinee, page="survey")),
+        ("answered", set_state(answers=answers, functional="전혀 어렵지 않음")),
+        ("result", lambda at: click_button(at, "결과 보기")),
+    ]
+
+
+def gad7_steps(session_no: int) -> list[tuple[str, object]]:
+    answers = {f"q{i}": (session_no + i) % 4 for i in range(1, 8)}
+
+    def consent(at) -> None:
+        meta = dict(at.session_state["meta"])
+        meta.update(consent=True, consent_ts=time.strftime("%Y-%m-%dT%H:%M:%S"))
+        at.session_state["meta"] = meta
+        at.session_state["page"] = "info"
+
+    return [
+        ("intro", None),
+        ("info", consent),
+        ("survey", set_state(examinee=dict(EXAMINEE), page="survey")),
+        ("answered", set_state(answers=answers)),
+        ("result", lambda at: click_button(at, "결과 보기")),
+    ]
+
+
+def build_arcade_payload(session_no: int) -> dict:
+    rng = np.random.default_rng(session_no)
+    records = [
+        {"task": task, "trial": trial, "correct": bool(rng.random() < 0.85), "rt_ms": float(rng.normal(800, 120))}
+        for task in ("trail", "gaze", "flanker")
+        for trial in range(20)
+    ]
+    return {
+        "task_set": ["trail", "gaze", "flanker"],
+        "records": records,
+        "summaries": {
+            "trail": {"score": 70, "total_sec": float(rng.normal(58, 8)), "accuracy": 0.9},
+            "gaze": {"score": 65, "median_rt_ms": float(rng.normal(820, 60)), "accuracy": 0.85},
+            "flanker": {"score": 72, "median_rt_ms": float(rng.normal(860, 60)), "accuracy": 0.88},
+        },
+        "domains": {},
+        "overall_score": 69,
+    }
+
+
+def arcade_result_steps(session_no: int) -> list[tuple[str, object]]:
+    def to_result(at) -> None:
+        at.session_state["meta"] = {
+            "respondent_id": f"load-{session_no}",
+            "consent": True,
+            "consent_ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "started_ts": "",
+            "submitted_ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        at.session_state["examinee"] = dict(EXAMINEE)
+        at.session_state["task_payload"] = build_arcade_payload(session_no)
+        at.session_state["page"] = "result"
+
+    return [
+        ("intro", None),
+        ("result", to_result),
+        ("result_rerun", None),
+    ]
+
+
+SCENARIOS = {
+    "search": search_steps,
+    "phq9": phq9_steps,
+    "gad7": gad7_steps,
+    "arcade_result": arcade_result_steps,
+}
+
+
+# -----------------------------
+# Session runner
+# -----------------------------
+def current_rss_mb() -> float:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except Exception:
+        # Linux 외 환경: 최대 RSS로 대신한다 (macOS는 바이트, Linux는 KB 단위).
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_session(app: str, session_no: int, timeout: float) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_FILES[app]), default_timeout=timeout)
+    rss_before = current_rss_mb()
+    cpu_before = time.process_time()
+    started = time.perf_counter()
+    reruns = []
+    errors = []
+
+    for label, action in SCENARIOS[app](session_no):
+        try:
+            if action is not None:
+                action(at)
+            step_started = time.perf_counter()
+            at.run()
+            elapsed_ms = (time.perf_counter() - step_started) * 1000
+        except Exception as exc:
+            errors.append(f"{label}: {type(exc).__name__}: {exc}")
+            break
+        reruns.append({"step": label, "ms": elapsed_ms})
+        if len(at.exception):
+            errors.append(f"{label}: {at.exception[0].message}")
+            break
+
+    return {
+        "app": app,
+        "session": session_no,
+        "reruns": reruns,
+        "errors": errors,
+        "wall_ms": (time.perf_counter() - started) * 1000,
+        "cpu_ms": (time.process_time() - cpu_before) * 1000,
+        "rss_delta_mb": current_rss_mb() - rss_before,
+    }
+
+
+def run_worker(worker_no: int, jobs: list[tuple[str, int]], timeout: float, db_latency_ms: float) -> dict:
+    install_stub_backends(db_latency_ms)
+    sys.path.insert(0, str(BASE_DIR / "career_demo"))
+
+    cpu_started = time.process_time()
+    rss_started = current_rss_mb()
+    seen_apps: set[str] = set()
+    sessions = []
+    for app, session_no in jobs:
+        session = run_session(app, session_no, timeout)
+        session["worker"] = worker_no
+        session["cold"] = app not in seen_apps
+        seen_apps.add(app)
+        sessions.append(session)
+
+    return {
+        "worker": worker_no,
+        "sessions": sessions,
+        "cpu_sec": time.process_time() - cpu_started,
+        "rss_start_mb": rss_started,
+        "rss_end_mb": current_rss_mb(),
+        "db_inserts": len(STUB_DB_RECORDS),
+    }
+
+
+# -----------------------------
+# Report
+# -----------------------------
+def percentile_summary(values: list[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "count": int(arr.size),
+        "p50_ms": round(float(np.percentile(arr, 50)), 2),
+        "p90_ms": round(float(np.percentile(arr, 90)), 2),
+        "p99_ms": round(float(np.percentile(arr, 99)), 2),
+        "max_ms": round(float(arr.max()), 2),
+    }
+
+
+def build_report(workers: list[dict], args: argparse.Namespace, elapsed_sec: float) -> dict:
+    sessions = [session for worker in workers for session in worker["sessions"]]
+    apps = {}
+    for app in args.apps:
+        app_sessions = [s for s in sessions if s["app"] == app]
+        warm = [s for s in app_sessions if not s["cold"]]
+        steps = {}
+        for session in warm or app_sessions:
+            for rerun in session["reruns"]:
+                steps.setdefault(rerun["step"], []).append(rerun["ms"])
+        apps[app] = {
+            "sessions": len(app_sessions),
+            "errors": sum(len(s["errors"]) for s in app_sessions),
+            "rerun_warm": percentile_summary([r["ms"] for s in warm for r in s["reruns"]]),
+            "rerun_cold": percentile_summary([r["ms"] for s in app_sessions if s["cold"] for r in s["reruns"]]),
+            "steps": {step: percentile_summary(values) for step, values in steps.items()},
+            "session_wall": percentile_summary([s["wall_ms"] for s in app_sessions]),
+            "session_cpu": percentile_summary([s["cpu_ms"] for s in app_sessions]),
+            "rss_delta_mb_mean": round(float(np.mean([s["rss_delta_mb"] for s in app_sessions])), 2) if app_sessions else 0.0,
+        }
+
+    total_cpu = sum(worker["cpu_sec"] for worker in workers)
+    return {
+        "config": {
+            "apps": args.apps,
+            "sessions_per_app": args.sessions,
+            "workers": args.workers,
+            "db_latency_ms": args.db_latency_ms,
+        },
+        "elapsed_sec": round(elapsed_sec, 2),
+        "sessions_per_sec": round(len(sessions) / elapsed_sec, 2) if elapsed_sec > 0 else None,
+        "cpu_sec_total": round(total_cpu, 2),
+        "cpu_sec_per_session": round(total_cpu / len(sessions), 3) if sessions else None,
+        "rss_end_mb_per_worker": [round(worker["rss_end_mb"], 1) for worker in workers],
+        "db_inserts": sum(worker["db_inserts"] for worker in workers),
+        "apps": apps,
+        "errors": [f"[{s['app']} #{s['session']}] {error}" for s in sessions for error in s["errors"]][:20],
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"\n총 {report['elapsed_sec']}초 · 세션/초 {report['sessions_per_sec']} · "
+        f"세션당 CPU {report['cpu_sec_per_session']}초 · 워커 RSS {report['rss_end_mb_per_worker']} MB · "
+        f"DB insert {report['db_inserts']}건"
+    )
+    for app, info in report["apps"].items():
+        warm = info["rerun_warm"]
+        cold = info["rerun_cold"]
+        cpu = info["session_cpu"]
+        print(
+            f"\n[{app}] 세션 {info['sessions']} · 오류 {info['errors']} · "
+            f"세션 CPU p50 {cpu.get('p50_ms')} ms · 세션당 RSS 증가 {info['rss_delta_mb_mean']} MB"
+        )
+        if warm.get("count"):
+            print(f"  rerun(warm) p50 {warm['p50_ms']} / p90 {warm['p90_ms']} / p99 {warm['p99_ms']} / max {warm['max_ms']} ms")
+        if cold.get("count"):
+            print(f"  rerun(cold) p50 {cold['p50_ms']} / max {cold['max_ms']} ms")
+        for step, summary in info["steps"].items():
+            print(f"    - {step:<14} p50 {summary['p50_ms']:>9} ms · p90 {summary['p90_ms']:>9} ms · n={summary['count']}")
+    for error in report["errors"]:
+        print(f"  ! {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streamlit 앱 헤드리스 다중 세션 부하 테스트")
+    parser.add_argument("--apps", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--sessions", type=int, default=8, help="앱별 세션 수")
+    parser.add_argument("--workers", type=int, default=1, help="동시에 세션을 진행할 워커 프로세스 수")
+    parser.add_argument("--db-latency-ms", type=float, default=20.0)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SEC)
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    jobs = [(app, session_no) for session_no in range(args.sessions) for app in args.apps]
+    chunks = [jobs[worker_no::args.workers] for worker_no in range(args.workers)]
+
+    print(f"세션 {len(jobs)}개 · 워커 {args.workers} · 대상 {', '.join(args.apps)}")
+    started = time.perf_counter()
+    if args.workers == 1:
+        workers = [run_worker(0, chunks[0], args.timeout, args.db_latency_ms)]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=args.workers) as pool:
+            workers = pool.starmap(
+                run_worker,
+                [(worker_no, chunk, args.timeout, args.db_latency_ms) for worker_no, chunk in enumerate(chunks)],
+            )
+    elapsed = time.perf_counter() - started
+
+    report = build_report(workers, args, elapsed)
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\nJSON 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
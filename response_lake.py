@@ -0,0 +1,329 @@
+"""
+설문 응답 Parquet 레이크 (날짜 파티션, long 포맷)
+
+목적:
+- 시트에는 제출 1건이 문항당 4컬럼씩 늘어나는 wide 행 하나로 쌓여, 분석하려면 시트 전체를 받아야 한다.
+  같은 제출을 (제출 × 문항) long 포맷으로 로컬 Parquet 레이크에도 남겨 분류별 리포트를 빠르게 만든다.
+- 배치: {lake}/date=YYYY-MM-DD/part-*.parquet (hive 파티션). 제출마다 작은 part 파일을 원자적으로 쓴다.
+- compact_lake가 파티션의 part 파일을 하나로 합친다. 합칠 때 (submission_id, question_no) 중복을 없애고
+  category 순으로 정렬해 row group 통계(min/max)만으로 다른 분류를 건너뛸 수 있게 한다.
+- read_responses는 pyarrow.dataset 필터로 날짜 파티션과 분류 조건을 내려보내(predicate pushdown)
+  필요한 파티션/row group만 읽는다.
+- 레이크는 이 서버에서 받은 제출만 담는다. backfill_from_sheet_records가 결과 시트(wide 행)에서
+  레이크에 없는 제출을 submission_id 기준으로 채워, 레이크 도입 전 이력·다른 서버 제출·레이크 쓰기에
+  실패한 제출을 더한다. submission_id 컬럼이 없는 예전 행은 kirbsplus_ut와 같은 규칙
+  (respondent_id + 제출 시각)으로 만든다.
+- pyarrow는 레이크를 실제로 읽고 쓸 때만 불러온다.
+
+권장 실행:
+   python response_lake.py compact
+   python response_lake.py backfill
+   python response_lake.py report --start 2026-01-01 --category 기본탐색 회원
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import os
+import uuid
+
+import pandas as pd
+
+
+DEFAULT_LAKE_DIR = Path(__file__).resolve().parent / ".response_lake" / "kirbsplus"
+LAKE_DIR_ENV = "KIRBS_RESPONSE_LAKE_DIR"
+PARTITION_FIELD = "date"
+COMPACTED_ROW_GROUP_SIZE = 8192
+
+# kirbsplus_ut.py 제출 CSV(long 포맷)의 컬럼 → 레이크 컬럼.
+SURVEY_LONG_COLUMNS = {
+    "분류": "category",
+    "세부": "sub",
+    "문항번호": "question_no",
+    "문항": "question",
+    "기능여부": "functionality",
+    "만족도": "satisfaction",
+    "개선요청": "improvement",
+    "추가의견": "comment",
+}
+DEDUP_KEYS = ["submission_id", "question_no"]
+
+
+def lake_dir() -> Path:
+    return Path(os.environ.get(LAKE_DIR_ENV) or DEFAULT_LAKE_DIR)
+
+
+def _lake_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("submission_id", pa.string()),
+            ("submission_ts", pa.timestamp("s")),
+            ("respondent_id", pa.string()),
+            ("category", pa.string()),
+            ("sub", pa.string()),
+            ("question_no", pa.int16()),
+            ("question", pa.string()),
+            ("functionality", pa.string()),
+            ("satisfaction", pa.int8()),
+            ("improvement", pa.string()),
+            ("comment", pa.string()),
+        ]
+    )
+
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([(PARTITION_FIELD, pa.string())]), flavor="hive")
+
+
+def _write_parquet_atomic(table, path: Path, **kwargs) -> None:
+    import pyarrow.parquet as pq
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # pyarrow.dataset은 "."으로 시작하는 파일을 무시하므로 쓰는 도중인 파일은 읽히지 않는다.
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    pq.write_table(table, tmp_path, **kwargs)
+    os.replace(tmp_path, path)
+
+
+def append_submission_to_lake(
+    submission_id: str,
+    respondent_id: str,
+    rows: list[dict],
+    root: Path | None = None,
+) -> Path:
+    """제출 1건의 long 포맷 행(kirbsplus_ut 제출 CSV와 같은 키)을 날짜 파티션에 part 파일로 쓴다."""
+    import pyarrow as pa
+
+    root = Path(root) if root is not None else lake_dir()
+    df = pd.DataFrame(rows).rename(columns=SURVEY_LONG_COLUMNS)
+    df["submission_ts"] = pd.to_datetime(df["submission_ts"])
+    df["submission_id"] = submission_id
+    df["respondent_id"] = respondent_id
+    table = pa.Table.from_pandas(df, schema=_lake_schema(), preserve_index=False)
+
+    partition = df["submission_ts"].iloc[0].strftime("%Y-%m-%d")
+    path = root / f"{PARTITION_FIELD}={partition}" / f"part-{uuid.uuid4().hex}.parquet"
+    _write_parquet_atomic(table, path)
+    return path
+
+
+def _sheet_submission_id(record: dict) -> str:
+    submission_id = str(record.get("submission_id") or "").strip()
+    if submission_id:
+        return submission_id
+    # submission_id 컬럼 도입 전 행: kirbsplus_ut가 만들던 {respondent_id}_{YYYYmmdd_HHMMSS}.
+    submission_ts = pd.to_datetime(str(record.get("submission_ts", "")), errors="coerce")
+    respondent_id = str(record.get("respondent_id") or "").strip()
+    if pd.isna(submission_ts) or not respondent_id:
+        return ""
+    return f"{respondent_id}_{submission_ts.strftime('%Y%m%d_%H%M%S')}"
+
+
+def _sheet_satisfaction(value):
+    number = pd.to_numeric(value, errors="coerce")
+    return None if pd.isna(number) else int(number)
+
+
+def backfill_from_sheet_records(records: list[dict], questions: list[dict], root: Path | None = None) -> int:
+    """결과 시트의 wide 행 중 레이크에 없는 제출을 long 포맷으로 날짜 파티션에 쓴다. 채운 제출 수를 돌려준다.
+
+    questions는 kirbsplus_questions.QUESTIONS(문항번호 = 순서 + 1)다. 제출 시각이나 응답자가 없는 행은 건너뛴다.
+    """
+    import pyarrow as pa
+
+    root = Path(root) if root is not None else lake_dir()
+    known = set(read_responses(columns=["submission_id"], root=root)["submission_id"])
+
+    rows = []
+    added: set[str] = set()
+    for record in records:
+        submission_id = _sheet_submission_id(record)
+        if not submission_id or submission_id in known or submission_id in added:
+            continue
+        submission_ts = pd.to_datetime(str(record["submission_ts"]))
+        respondent_id = str(record["respondent_id"]).strip()
+        added.add(submission_id)
+        for no, question in enumerate(questions, start=1):
+            rows.append(
+                {
+                    "submission_id": submission_id,
+                    "submission_ts": submission_ts,
+                    "respondent_id": respondent_id,
+                    "category": question["category"],
+                    "sub": question.get("sub", ""),
+                    "question_no": no,
+                    "question": question["item"],
+                    "functionality": str(record.get(f"Q{no}_func", "") or "") or None,
+                    "satisfaction": _sheet_satisfaction(record.get(f"Q{no}_sat", "")),
+                    "improvement": str(record.get(f"Q{no}_imp", "") or ""),
+                    "comment": str(record.get(f"Q{no}_cmt", "") or ""),
+                }
+            )
+    if not rows:
+        return 0
+
+    df = pd.DataFrame(rows)
+    df["satisfaction"] = df["satisfaction"].astype("Int8")
+    for partition, part in df.groupby(df["submission_ts"].dt.strftime("%Y-%m-%d"), sort=True):
+        table = pa.Table.from_pandas(part, schema=_lake_schema(), preserve_index=False)
+        path = root / f"{PARTITION_FIELD}={partition}" / f"backfill-{uuid.uuid4().hex}.parquet"
+        _write_parquet_atomic(table, path)
+    return len(added)
+
+
+def list_partitions(root: Path | None = None) -> list[Path]:
+    root = Path(root) if root is not None else lake_dir()
+    if not root.is_dir():
+        return []
+    return sorted(path for path in root.iterdir() if path.is_dir() and path.name.startswith(f"{PARTITION_FIELD}="))
+
+
+def _data_files(partition: Path) -> list[Path]:
+    return sorted(path for path in partition.glob("*.parquet") if not path.name.startswith("."))
+
+
+def compact_partition(partition: Path) -> int:
+    """파티션의 part 파일을 중복 제거·분류순 정렬한 파일 하나로 합친다. 합친 입력 파일 수를 돌려준다."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    inputs = _data_files(partition)
+    if len(inputs) < 2:
+        return 0
+
+    # 합치는 동안 새로 들어온 part 파일은 inputs에 없으므로 지우지 않고 다음 압축 때 합친다.
+    df = pd.concat([pq.read_table(path, schema=_lake_schema()).to_pandas() for path in inputs], ignore_index=True)
+    df = (
+        df.drop_duplicates(DEDUP_KEYS, keep="first")
+        .sort_values(["category", "question_no", "submission_ts"], kind="stable")
+        .reset_index(drop=True)
+    )
+    table = pa.Table.from_pandas(df, schema=_lake_schema(), preserve_index=False)
+    _write_parquet_atomic(
+        table,
+        partition / f"compacted-{uuid.uuid4().hex}.parquet",
+        row_group_size=COMPACTED_ROW_GROUP_SIZE,
+    )
+    for path in inputs:
+        path.unlink(missing_ok=True)
+    return len(inputs)
+
+
+def compact_lake(root: Path | None = None) -> dict[str, int]:
+    return {
+        partition.name: merged
+        for partition in list_partitions(root)
+        if (merged := compact_partition(partition))
+    }
+
+
+def read_responses(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    categories: list[str] | None = None,
+    columns: list[str] | None = None,
+    root: Path | None = None,
+    since_ts: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """날짜(YYYY-MM-DD, 양 끝 포함)와 분류 조건에 맞는 long 포맷 응답을 읽는다.
+
+    날짜 조건은 파티션 디렉터리 단위로, 분류 조건은 row group 통계로 걸러진다.
+    since_ts를 주면 submission_ts가 그 시각 이후(포함)인 행만 읽고, 그 날짜 이전 파티션은 열지 않는다.
+    압축 중 잠깐 겹쳐 보이는 행은 (submission_id, question_no)로 한 번 더 중복 제거한다.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    root = Path(root) if root is not None else lake_dir()
+    schema = _lake_schema()
+    if not list_partitions(root):
+        return schema.empty_table().to_pandas()[columns or schema.names]
+
+    dataset = ds.dataset(root, format="parquet", partitioning=_partitioning())
+    predicate = None
+    conditions = []
+    if start_date:
+        conditions.append(ds.field(PARTITION_FIELD) >= start_date)
+    if end_date:
+        conditions.append(ds.field(PARTITION_FIELD) <= end_date)
+    if categories:
+        conditions.append(ds.field("category").isin(list(categories)))
+    if since_ts is not None:
+        since_ts = pd.Timestamp(since_ts).floor("s")
+        conditions.append(ds.field(PARTITION_FIELD) >= since_ts.strftime("%Y-%m-%d"))
+        conditions.append(ds.field("submission_ts") >= pa.scalar(since_ts.to_pydatetime(), type=pa.timestamp("s")))
+    for condition in conditions:
+        predicate = condition if predicate is None else predicate & condition
+
+    read_columns = list(dict.fromkeys((columns or schema.names) + DEDUP_KEYS))
+    df = dataset.to_table(columns=read_columns, filter=predicate).to_pandas()
+    df = df.drop_duplicates(DEDUP_KEYS, keep="first")
+    return df[columns or schema.names].reset_index(drop=True)
+
+
+def category_satisfaction_report(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    categories: list[str] | None = None,
+    root: Path | None = None,
+) -> pd.DataFrame:
+    """분류별 제출 수, 응답 수, 평균 만족도, 기능 Y 비율."""
+    df = read_responses(
+        start_date,
+        end_date,
+        categories,
+        columns=["submission_id", "category", "functionality", "satisfaction"],
+        root=root,
+    )
+    if df.empty:
+        return pd.DataFrame(columns=["category", "submissions", "responses", "satisfaction_mean", "functionality_yes_rate"])
+    df["functionality_yes"] = df["functionality"].eq("Y")
+    return (
+        df.groupby("category", sort=True)
+        .agg(
+            submissions=("submission_id", "nunique"),
+            responses=("satisfaction", "size"),
+            satisfaction_mean=("satisfaction", "mean"),
+            functionality_yes_rate=("functionality_yes", "mean"),
+        )
+        .reset_index()
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="설문 응답 Parquet 레이크 관리")
+    parser.add_argument("--lake", type=Path, default=None, help=f"레이크 경로 (기본: ${LAKE_DIR_ENV} 또는 {DEFAULT_LAKE_DIR})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("compact", help="파티션별 part 파일 합치기")
+    sub.add_parser("backfill", help="결과 시트에서 레이크에 없는 제출 채우기 (.streamlit/secrets.toml 필요)")
+    report = sub.add_parser("report", help="분류별 만족도 리포트")
+    report.add_argument("--start", default=None)
+    report.add_argument("--end", default=None)
+    report.add_argument("--category", nargs="*", default=None)
+    args = parser.parse_args()
+
+    if args.command == "backfill":
+        from gcp_storage import read_sheet_records
+        from kirbsplus_questions import QUESTIONS
+
+        added = backfill_from_sheet_records(read_sheet_records(), QUESTIONS, root=args.lake)
+        print(f"시트에서 제출 {added}건을 채웠습니다.")
+    elif args.command == "compact":
+        merged = compact_lake(args.lake)
+        if not merged:
+            print("합칠 파티션이 없습니다.")
+        for name, count in merged.items():
+            print(f"{name}: part 파일 {count}개 → 1개")
+    else:
+        result = category_satisfaction_report(args.start, args.end, args.category, root=args.lake)
+        print(result.to_string(index=False) if not result.empty else "조건에 맞는 응답이 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+설문 제출 로컬 outbox (SQLite WAL)
+
+목적:
+- 제출 응답을 Google Sheets로 보내기 전에 로컬 디스크의 SQLite에 먼저 커밋한다.
+  시트 API가 실패하거나 프로세스가 재시작돼도 응답이 세션 상태와 함께 사라지지 않는다.
+- submission_id가 PRIMARY KEY이므로 같은 제출을 두 번 넣어도 한 행만 남는다(INSERT OR IGNORE).
+- gcp_storage의 dispatcher 스레드가 due 상태인 행을 배치로 꺼내 시트에 쓰고,
+  실패하면 attempts에 따라 지수 백오프로 next_attempt_at을 미룬다. 시트가 요청 자체를 거절했거나(4xx)
+  MAX_ATTEMPTS번 실패한 행은 failed로 옮겨 더 보내지 않는다.
+- WAL 모드 + synchronous=FULL: 커밋이 끝나면 프로세스가 죽어도 행이 남고, 읽기와 쓰기가 서로 막지 않는다.
+
+상태:
+- pending : 아직 시트에 반영되지 않음 (attempts > 0 이면 재시도 대기 중, last_error에 마지막 오류)
+            in_doubt = 1 이면 전송 도중 응답을 받지 못해 시트에 이미 반영됐을 수도 있는 행
+- sending : dispatcher 하나가 claim_due로 가져가 보내는 중 (lease_until까지).
+            같은 outbox를 쓰는 다른 dispatcher(다른 프로세스, 캐시를 비운 뒤 새로 뜬 스레드)는 가져가지 않는다.
+            lease가 끝나도록 결과가 기록되지 않으면 보내던 쪽이 죽은 것으로 보고 in_doubt로 다시 가져간다.
+- sent    : 시트에 반영됨
+- failed  : 다시 보내도 반영될 수 없거나 재시도 횟수를 다 써서 전송을 멈춤 (last_error에 원인).
+            응답은 payload에 남아 있으므로 원인을 고친 뒤 requeue_failed로 다시 보낼 수 있다.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import os
+import sqlite3
+import time
+
+
+DEFAULT_OUTBOX_PATH = Path(__file__).resolve().parent / ".outbox" / "submissions.sqlite3"
+OUTBOX_PATH_ENV = "KIRBS_OUTBOX_PATH"
+
+RETRY_BASE_SECONDS = 2.0
+RETRY_MAX_SECONDS = 600.0
+# 2초부터 10분까지 늘어나는 백오프 기준 약 2시간 동안 재시도한다.
+MAX_ATTEMPTS = 20
+# claim한 행을 다른 dispatcher가 가져가지 않는 시간. 한 배치 전송(핸들 재시도 포함)보다 충분히 길어야 한다.
+LEASE_SECONDS = 300.0
+SENT_RETENTION_SECONDS = 30 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    submission_id   TEXT PRIMARY KEY,
+    target          TEXT NOT NULL,
+    payload         TEXT NOT NULL,
+    status          TEXT NOT NULL DEFAULT 'pending',
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error      TEXT,
+    in_doubt        INTEGER NOT NULL DEFAULT 0,
+    lease_until     REAL,
+    created_at      REAL NOT NULL,
+    sent_at         REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (target, status, next_attempt_at);
+"""
+
+
+def outbox_path() -> Path:
+    return Path(os.environ.get(OUTBOX_PATH_ENV) or DEFAULT_OUTBOX_PATH)
+
+
+def connect_outbox(path: Path | str | None = None) -> sqlite3.Connection:
+    """outbox DB를 열고 스키마를 만든다. 연결은 여러 스레드가 잠금을 걸고 함께 쓸 수 있다."""
+    path = Path(path) if path is not None else outbox_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # isolation_level=None: 문장마다 자동 커밋. 여러 문장은 명시적으로 BEGIN으로 묶는다.
+    conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=FULL")
+    conn.executescript(_SCHEMA)
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(outbox)")}
+    if "in_doubt" not in columns:
+        conn.execute("ALTER TABLE outbox ADD COLUMN in_doubt INTEGER NOT NULL DEFAULT 0")
+    if "lease_until" not in columns:
+        conn.execute("ALTER TABLE outbox ADD COLUMN lease_until REAL")
+    return conn
+
+
+def target_key(target: tuple[str, str]) -> str:
+    return "/".join(target)
+
+
+def add_submission(conn: sqlite3.Connection, submission_id: str, target: tuple[str, str], row: dict) -> bool:
+    """제출 행을 outbox에 커밋한다. 이미 같은 submission_id가 있으면 False."""
+    now = time.time()
+    cursor = conn.execute(
+        "INSERT OR IGNORE INTO outbox (submission_id, target, payload, next_attempt_at, created_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (submission_id, target_key(target), json.dumps(row, ensure_ascii=False), now, now),
+    )
+    return cursor.rowcount == 1
+
+
+def claim_due(conn: sqlite3.Connection, target: tuple[str, str], limit: int, now: float | None = None) -> list[dict]:
+    """지금 보낼 차례인 행을 오래된 순으로 limit개까지 sending으로 바꾸고 돌려준다.
+
+    조회와 상태 변경을 한 쓰기 트랜잭션(BEGIN IMMEDIATE)으로 묶으므로 같은 outbox를 쓰는 dispatcher가
+    여럿이어도 한 행은 한 dispatcher만 가져간다. lease가 끝난 sending 행은 보내던 쪽이 죽은 것이므로
+    시트에 반영됐을 수 있어 in_doubt로 표시해 다시 가져간다.
+    """
+    now = time.time() if now is None else now
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        rows = conn.execute(
+            "SELECT submission_id, payload, attempts, in_doubt, status, created_at FROM outbox "
+            "WHERE target = ? AND ((status = 'pending' AND next_attempt_at <= ?) "
+            "OR (status = 'sending' AND lease_until <= ?)) "
+            "ORDER BY created_at LIMIT ?",
+            (target_key(target), now, now, limit),
+        ).fetchall()
+        conn.executemany(
+            "UPDATE outbox SET status = 'sending', lease_until = ?, in_doubt = MAX(in_doubt, ?) WHERE submission_id = ?",
+            [(now + LEASE_SECONDS, int(row["status"] == "sending"), row["submission_id"]) for row in rows],
+        )
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return [
+        {
+            "submission_id": row["submission_id"],
+            "row": json.loads(row["payload"]),
+            "attempts": row["attempts"],
+            "in_doubt": bool(row["in_doubt"]) or row["status"] == "sending",
+            "created_at": row["created_at"],
+        }
+        for row in rows
+    ]
+
+
+def next_due_at(conn: sqlite3.Connection, target: tuple[str, str]) -> float | None:
+    row = conn.execute(
+        "SELECT MIN(CASE status WHEN 'pending' THEN next_attempt_at ELSE lease_until END) FROM outbox "
+        "WHERE target = ? AND status IN ('pending', 'sending')",
+        (target_key(target),),
+    ).fetchone()
+    return row[0]
+
+
+def mark_sent(conn: sqlite3.Connection, submission_ids: list[str]) -> None:
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "UPDATE outbox SET status = 'sent', sent_at = ?, last_error = NULL, lease_until = NULL WHERE submission_id = ?",
+            [(now, submission_id) for submission_id in submission_ids],
+        )
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def retry_delay(attempts: int) -> float:
+    return min(RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), RETRY_MAX_SECONDS)
+
+
+def mark_retry(conn: sqlite3.Connection, submission_ids: list[str], error: str, in_doubt: bool = False) -> None:
+    """attempts를 늘리고 지수 백오프로 다음 시도 시각을 정한다. MAX_ATTEMPTS에 닿은 행은 failed로 옮긴다.
+
+    in_doubt: 요청이 시트에 도달했을 수 있는 실패(연결 끊김, 5xx). 한 번 켜지면 전송될 때까지 유지한다.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for submission_id in submission_ids:
+            row = conn.execute("SELECT attempts FROM outbox WHERE submission_id = ?", (submission_id,)).fetchone()
+            if row is None:
+                continue
+            attempts = row["attempts"] + 1
+            status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+            conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, "
+                "in_doubt = MAX(in_doubt, ?), lease_until = NULL WHERE submission_id = ?",
+                (status, attempts, now + retry_delay(attempts), error, int(in_doubt), submission_id),
+            )
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def mark_failed(conn: sqlite3.Connection, submission_ids: list[str], error: str) -> None:
+    """시트가 거절해 다시 보내도 반영될 수 없는 행을 failed로 옮긴다."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "UPDATE outbox SET status = 'failed', attempts = attempts + 1, last_error = ?, lease_until = NULL "
+            "WHERE submission_id = ?",
+            [(error, submission_id) for submission_id in submission_ids],
+        )
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def requeue_failed(conn: sqlite3.Connection, target: tuple[str, str]) -> int:
+    """failed 행을 pending으로 되돌려 바로 다시 보내게 한다. 되돌린 행 수를 돌려준다."""
+    cursor = conn.execute(
+        "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE target = ? AND status = 'failed'",
+        (time.time(), target_key(target)),
+    )
+    return cursor.rowcount
+
+
+def submission_status(conn: sqlite3.Connection, submission_id: str) -> dict | None:
+    row = conn.execute(
+        "SELECT status, attempts, next_attempt_at, last_error, created_at, sent_at FROM outbox WHERE submission_id = ?",
+        (submission_id,),
+    ).fetchone()
+    return dict(row) if row is not None else None
+
+
+def outbox_counts(conn: sqlite3.Connection) -> dict[str, int]:
+    rows = conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def purge_sent(conn: sqlite3.Connection, older_than: float = SENT_RETENTION_SECONDS) -> int:
+    cursor = conn.execute(
+        "DELETE FROM outbox WHERE status = 'sent' AND sent_at < ?",
+        (time.time() - older_than,),
+    )
+    return cursor.rowcount
@@ -0,0 +1,172 @@
+"""
+KIRBSPLUS 사용성 평가 누적 집계
+
+목적:
+- 대시보드가 rerun마다 전체 제출을 다시 읽고 집계하지 않도록, 문항(분류 × 세부 × 문항번호)별
+  누적 집계(응답 수, Y/N 수, 만족도 합계)를 메모리에 두고 새로 들어온 응답만 더한다.
+- 응답 레이크(response_lake)에서 마지막으로 본 submission_ts 이후 행만 읽는다. 동시에 제출된 응답은
+  part 파일이 submission_ts 순서와 다르게 쓰일 수 있으므로 ANALYTICS_LOOKBACK_SECONDS만큼 겹쳐 읽고,
+  그 구간에서 이미 센 submission_id는 건너뛴다.
+- 집계 크기는 문항 수에만 비례하므로 요약 표는 누적 제출 수와 무관하게 같은 시간에 만들어진다.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import threading
+import time
+
+import pandas as pd
+
+from response_lake import read_responses
+
+
+ANALYTICS_LOOKBACK_SECONDS = 300
+ANALYTICS_COLUMNS = [
+    "submission_id",
+    "submission_ts",
+    "category",
+    "sub",
+    "question_no",
+    "question",
+    "functionality",
+    "satisfaction",
+]
+
+
+def new_analytics_state() -> dict:
+    return {
+        # (category, sub, question_no) → {"question", "responses", "yes", "no", "sat_sum", "sat_count"}
+        "questions": {},
+        "submissions": 0,
+        "watermark": None,
+        # 겹쳐 읽는 구간에서 이미 센 제출: submission_id → submission_ts
+        "recent_ids": {},
+        "refreshed_at": None,
+        "lock": threading.Lock(),
+    }
+
+
+def reset_analytics(state: dict) -> None:
+    """누적 집계를 비운다. 워터마크 이전 시각의 제출이 레이크에 들어왔을 때(시트 백필) 처음부터 다시 세기 위해 쓴다."""
+    with state["lock"]:
+        fresh = new_analytics_state()
+        fresh.pop("lock")
+        state.update(fresh)
+
+
+def apply_responses(state: dict, df: pd.DataFrame) -> int:
+    """long 포맷 응답을 누적 집계에 더한다. 이미 센 submission_id는 건너뛴다. 새로 센 제출 수를 돌려준다."""
+    if df.empty:
+        return 0
+    df = df[~df["submission_id"].isin(state["recent_ids"].keys())]
+    if df.empty:
+        return 0
+
+    df = df.assign(
+        is_yes=df["functionality"].eq("Y"),
+        is_no=df["functionality"].eq("N"),
+        sat_value=df["satisfaction"].astype("float64"),
+    )
+    grouped = df.groupby(["category", "sub", "question_no"], sort=False).agg(
+        question=("question", "first"),
+        responses=("submission_id", "size"),
+        yes=("is_yes", "sum"),
+        no=("is_no", "sum"),
+        sat_sum=("sat_value", "sum"),
+        sat_count=("sat_value", "count"),
+    )
+    questions = state["questions"]
+    for key, row in zip(grouped.index, grouped.itertuples(index=False)):
+        agg = questions.setdefault(
+            key,
+            {"question": row.question, "responses": 0, "yes": 0, "no": 0, "sat_sum": 0.0, "sat_count": 0},
+        )
+        agg["responses"] += int(row.responses)
+        agg["yes"] += int(row.yes)
+        agg["no"] += int(row.no)
+        agg["sat_sum"] += float(row.sat_sum)
+        agg["sat_count"] += int(row.sat_count)
+
+    submitted = df.groupby("submission_id", sort=False)["submission_ts"].max()
+    state["submissions"] += len(submitted)
+    state["recent_ids"].update(submitted.to_dict())
+    latest = submitted.max()
+    if state["watermark"] is None or latest > state["watermark"]:
+        state["watermark"] = latest
+
+    cutoff = state["watermark"] - pd.Timedelta(seconds=ANALYTICS_LOOKBACK_SECONDS)
+    state["recent_ids"] = {sid: ts for sid, ts in state["recent_ids"].items() if ts >= cutoff}
+    return len(submitted)
+
+
+def refresh_analytics(state: dict, root: Path | None = None) -> int:
+    """마지막으로 본 submission_ts(에서 겹침 구간을 뺀 시각) 이후의 응답만 읽어 집계에 더한다."""
+    with state["lock"]:
+        since = None
+        if state["watermark"] is not None:
+            since = state["watermark"] - pd.Timedelta(seconds=ANALYTICS_LOOKBACK_SECONDS)
+        df = read_responses(columns=ANALYTICS_COLUMNS, root=root, since_ts=since)
+        added = apply_responses(state, df)
+        state["refreshed_at"] = time.time()
+        return added
+
+
+def question_summary(state: dict, category: str | None = None) -> pd.DataFrame:
+    with state["lock"]:
+        items = [(key, dict(agg)) for key, agg in state["questions"].items() if category is None or key[0] == category]
+    rows = [
+        {
+            "분류": key[0],
+            "세부": key[1],
+            "문항번호": key[2],
+            "문항": agg["question"],
+            "응답 수": agg["responses"],
+            "Y 비율": agg["yes"] / (agg["yes"] + agg["no"]) if agg["yes"] + agg["no"] else None,
+            "평균 만족도": agg["sat_sum"] / agg["sat_count"] if agg["sat_count"] else None,
+        }
+        for key, agg in items
+    ]
+    columns = ["분류", "세부", "문항번호", "문항", "응답 수", "Y 비율", "평균 만족도"]
+    return pd.DataFrame(rows, columns=columns).sort_values("문항번호").reset_index(drop=True)
+
+
+def category_summary(state: dict) -> pd.DataFrame:
+    """문항 집계를 분류별로 다시 합친다. 합계로 합치므로 평균은 만족도를 답한 수로 가중한 평균이다. 설문 순서(첫 문항번호)로 정렬한다."""
+    with state["lock"]:
+        items = [(key, dict(agg)) for key, agg in state["questions"].items()]
+    totals: dict[str, dict] = {}
+    for (category, _, question_no), agg in items:
+        total = totals.setdefault(
+            category,
+            {"first_no": question_no, "questions": 0, "responses": 0, "yes": 0, "no": 0, "sat_sum": 0.0, "sat_count": 0},
+        )
+        total["first_no"] = min(total["first_no"], question_no)
+        total["questions"] += 1
+        for field in ("responses", "yes", "no", "sat_sum", "sat_count"):
+            total[field] += agg[field]
+
+    order = sorted(totals, key=lambda category: totals[category]["first_no"])
+    rows = [
+        {
+            "분류": category,
+            "문항 수": totals[category]["questions"],
+            "응답 수": totals[category]["responses"],
+            "Y 비율": totals[category]["yes"] / (totals[category]["yes"] + totals[category]["no"])
+            if totals[category]["yes"] + totals[category]["no"]
+            else None,
+            "평균 만족도": totals[category]["sat_sum"] / totals[category]["sat_count"]
+            if totals[category]["sat_count"]
+            else None,
+        }
+        for category in order
+    ]
+    return pd.DataFrame(rows, columns=["분류", "문항 수", "응답 수", "Y 비율", "평균 만족도"])
+
+
+def overall_satisfaction(state: dict) -> float | None:
+    """전체 평균 만족도. 만족도를 답한 응답(sat_count)으로 가중하므로 답이 없는 문항·분류는 평균에 들어가지 않는다."""
+    with state["lock"]:
+        sat_sum = sum(agg["sat_sum"] for agg in state["questions"].values())
+        sat_count = sum(agg["sat_count"] for agg in state["questions"].values())
+    return sat_sum / sat_count if sat_count else None